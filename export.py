@@ -0,0 +1,91 @@
+"""Offline export of crawled pages into sharded files.
+
+Examples:
+    python export.py --config example.yml --out dumps/ --shards 8
+    python export.py --all --out /backups/nightly --shards 4 --format warc
+
+Each config is written to `<out>/<config name>/shard-NNNN-of-NNNN.*` with a
+`.ckpt` file per shard; re-running the same command resumes unfinished shards.
+Pass `--restart` to discard existing shards and checkpoints.
+"""
+import argparse
+import logging
+import shutil
+import sys
+from pathlib import Path
+from typing import Optional
+
+from infracrawl.container import Container
+from infracrawl.services.shard_exporter import SHARD_FORMATS, export_sharded, plan_shards
+
+
+def _config_dir_name(config_path: str) -> str:
+    name = Path(config_path).name
+    for suffix in (".yaml", ".yml"):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export crawled pages into sharded files.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--config", action="append", help="Config path to export (repeatable)")
+    target.add_argument("--all", action="store_true", help="Export every config")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--shards", type=int, default=4, help="Shards per config, split by page_id range")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=SHARD_FORMATS, default="ndjson")
+    parser.add_argument("--no-compress", action="store_true", help="Write plain NDJSON instead of gzip")
+    parser.add_argument("--fields", help="Comma-separated columns for NDJSON (page_id is always included)")
+    parser.add_argument("--checkpoint-every", type=int, default=10_000, help="Rows between checkpoints")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints and start over")
+    return parser.parse_args(argv)
+
+
+def main(argv=None, container: Optional[Container] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    args = parse_args(argv)
+
+    if container is None:
+        container = Container()
+    database_url = container.config.DATABASE_URL()
+    if not database_url:
+        print("DATABASE_URL is not set", file=sys.stderr)
+        return 2
+
+    pages_repo = container.pages_repository()
+    config_service = container.config_service()
+    if args.all:
+        configs = config_service.list_configs()
+    else:
+        configs = [config_service.get_config(path) for path in args.config]
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+    out_root = Path(args.out)
+    for cfg in configs:
+        name = _config_dir_name(cfg.config_path)
+        out_dir = out_root / name
+        if args.restart and out_dir.exists():
+            shutil.rmtree(out_dir)
+        specs = plan_shards(name, cfg.config_id, pages_repo.get_page_id_range(cfg.config_id), args.shards)
+        if not specs:
+            print(f"{cfg.config_path}: no pages")
+            continue
+        manifest = export_sharded(
+            database_url,
+            specs,
+            out_dir,
+            workers=args.workers,
+            fmt=args.format,
+            compress=not args.no_compress,
+            fields=fields,
+            checkpoint_every=args.checkpoint_every,
+        )
+        rows = sum(s["rows"] for s in manifest["shards"])
+        print(f"{cfg.config_path}: {rows} pages in {len(specs)} shards -> {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
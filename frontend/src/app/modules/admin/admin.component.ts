@@ -72,6 +72,9 @@ export class AdminComponent implements OnInit {
     'INFRACRAWL_VISITED_MAX_URLS': 'Max URLs tracked per crawl',
     'INFRACRAWL_ROBOTS_CACHE_MAX_SIZE': 'Max robots.txt cache entries',
     'INFRACRAWL_ROBOTS_CACHE_TTL_SECONDS': 'robots.txt cache TTL (seconds)',
+    'INFRACRAWL_ROBOTS_STORE_TTL_SECONDS': 'Shared robots.txt TTL (seconds)',
+    'INFRACRAWL_ROBOTS_PREFETCH_WORKERS': 'robots.txt prefetch threads',
+    'INFRACRAWL_MAX_BODY_BYTES': 'Max page body size (bytes, 0 = no limit)',
   };
 
   constructor(private api: APIService) {}
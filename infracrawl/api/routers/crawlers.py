@@ -1,13 +1,30 @@
-import json
-from typing import Optional
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from starlette.responses import StreamingResponse
 
 from infracrawl.services.config_service import ConfigService
 from infracrawl.services.crawl_registry import InMemoryCrawlRegistry
 from infracrawl.repository.crawls import CrawlsRepository
+from infracrawl.repository.pages import EXPORT_FIELDS
+from infracrawl.services.export_writers import (
+    WARC_FIELDS,
+    gzip_stream,
+    ndjson_stream,
+    parquet_available,
+    parquet_stream,
+    warc_stream,
+)
 from infracrawl.services.scheduled_crawl_job_runner import ScheduledCrawlJobRunner
+from infracrawl.services.config_data_remover import ConfigDataRemover
+
+# format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "ndjson.gz": ("application/gzip", "ndjson.gz"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "warc": ("application/warc", "warc.gz"),
+}
 
 
 def create_crawlers_router(
@@ -18,6 +35,11 @@ def create_crawlers_router(
     start_crawl_callback,
     crawl_registry: Optional[InMemoryCrawlRegistry],
     crawls_repo: CrawlsRepository,
+    config_stats_repo=None,
+    data_remover: Optional[ConfigDataRemover] = None,
+    page_scores_repo=None,
+    link_graph_service=None,
+    job_queue=None,
 ) -> APIRouter:
     router = APIRouter(prefix="/crawlers", tags=["Crawlers"])
 
@@ -27,6 +49,8 @@ def create_crawlers_router(
         start_crawl_callback=start_crawl_callback,
         crawls_repo=crawls_repo,
     )
+    if data_remover is None:
+        data_remover = ConfigDataRemover(pages_repo, config_stats_repo)
 
     @router.get(
         "/export",
@@ -37,11 +61,29 @@ def create_crawlers_router(
                         "schema": {"type": "string", "format": "binary"}
                     }
                 },
-                "description": "NDJSON stream (one JSON object per line)",
+                "description": "NDJSON stream (one JSON object per line), or gzip NDJSON / Parquet / WARC per `format`",
             }
         },
     )
-    def export(config: Optional[str] = None, limit: Optional[int] = None):
+    def export(
+        config: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+        fields: Optional[str] = None,
+        fmt: Annotated[str, Query(alias="format")] = "ndjson",
+    ):
+        """Stream pages in page_id order as NDJSON, gzip NDJSON, Parquet or WARC.
+
+        `fields` is a comma-separated column list (e.g. `page_url,filtered_plain_text`);
+        `page_id` is always included. To resume an interrupted export, pass
+        the last `page_id` received as `after`. WARC output always uses the
+        URL, content, status and fetch time and ignores `fields`.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"unknown format: {fmt}")
+        if fmt == "parquet" and not parquet_available():
+            raise HTTPException(status_code=501, detail="parquet export requires pyarrow")
+
         config_id = None
         if config:
             try:
@@ -50,13 +92,69 @@ def create_crawlers_router(
                 raise HTTPException(status_code=404, detail="config not found")
             config_id = cfg.config_id
 
-        pages = pages_repo.fetch_pages(full=True, limit=limit, config_id=config_id)
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        if field_list:
+            unknown = [f for f in field_list if f not in EXPORT_FIELDS]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"unknown fields: {', '.join(unknown)}")
+        if fmt == "warc":
+            field_list = list(WARC_FIELDS)
+        elif fmt == "parquet":
+            field_list = field_list or list(EXPORT_FIELDS)
+            if "page_id" not in field_list:
+                field_list.insert(0, "page_id")
+
+        rows = pages_repo.iter_pages(config_id=config_id, after_page_id=after, fields=field_list, limit=limit)
+
+        media_type, ext = EXPORT_FORMATS[fmt]
+        filename = f"{config or 'export'}.{ext}"
+        if fmt == "ndjson":
+            body = ndjson_stream(rows)
+        elif fmt == "ndjson.gz":
+            body = gzip_stream(ndjson_stream(rows))
+        elif fmt == "parquet":
+            body = parquet_stream(rows, field_list)
+        else:
+            body = warc_stream(rows, filename=filename)
 
-        def gen_ndjson():
-            for p in pages:
-                yield (json.dumps(p.__dict__, default=str) + "\n").encode("utf-8")
+        headers = {}
+        if fmt != "ndjson":
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return StreamingResponse(body, media_type=media_type, headers=headers)
 
-        return StreamingResponse(gen_ndjson(), media_type="application/x-ndjson")
+    @router.get("/search")
+    def search(q: str, config: Optional[str] = None, limit: int = 20, offset: int = 0):
+        """Full-text search over crawled pages, ranked, with highlighted snippets.
+
+        `q` uses web-search syntax: `"county fair"`, `fair or festival`, `fair -cancelled`.
+        """
+        if not q or not q.strip():
+            raise HTTPException(status_code=400, detail="missing query")
+        limit = max(1, min(int(limit), 100))
+        offset = max(0, int(offset))
+        config_id = None
+        if config:
+            try:
+                cfg = config_service.get_config(config)
+            except Exception:
+                raise HTTPException(status_code=404, detail="config not found")
+            config_id = cfg.config_id
+
+        try:
+            # Fetch one extra row to know whether another page exists
+            rows = pages_repo.search_pages(q, config_id=config_id, limit=limit + 1, offset=offset)
+        except Exception:
+            raise HTTPException(status_code=500, detail="search failed")
+
+        has_more = len(rows) > limit
+        return {
+            "query": q,
+            "config": config,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": offset + limit if has_more else None,
+            "results": rows[:limit],
+        }
 
     @router.post("/crawl/{config}/start", status_code=202)
     def crawl(config: str, background_tasks: BackgroundTasks):
@@ -68,11 +166,24 @@ def create_crawlers_router(
             raise HTTPException(status_code=404, detail="config not found")
 
         # Validate config synchronously, but run the crawl + tracking in the background.
-        background_tasks.add_task(job_runner.run_config, cfg)
-        return {"status": "started"}
+        if job_queue is None:
+            background_tasks.add_task(job_runner.run_config, cfg)
+            return {"status": "started"}
+        job = job_queue.submit(cfg.config_path, job_runner.run_config, cfg, kind="manual")
+        if job is None:
+            raise HTTPException(status_code=409, detail="crawl already queued or running for this config")
+        return {"status": "queued", "job": job}
+
+    @router.get("/queue")
+    def queue():
+        """Running and waiting crawls (manual, scheduled, recovery) and the concurrency cap."""
+        if job_queue is None:
+            return {"max_concurrent": None, "running": [], "queued": [], "queue_depth": 0}
+        return job_queue.snapshot()
 
     @router.get("/active")
     def list_active_crawls():
+        """Crawls running in this API process; worker-run crawls are listed by `/queue` only."""
         if crawl_registry is None:
             return {"active": []}
         return {"active": crawl_registry.list_active()}
@@ -148,6 +259,7 @@ def create_crawlers_router(
 
     @router.post("/cancel/{crawl_id}")
     def cancel_crawl(crawl_id: str):
+        """Cancel a crawl running in this API process (not one run by `worker.py`)."""
         if crawl_registry is None:
             raise HTTPException(status_code=404, detail="no registry configured")
         ok = crawl_registry.cancel(crawl_id)
@@ -155,8 +267,13 @@ def create_crawlers_router(
             raise HTTPException(status_code=404, detail="crawl not found or cannot cancel")
         return {"status": "cancelling", "crawl_id": crawl_id}
 
-    @router.delete("/remove")
-    def remove(config: str):
+    @router.delete("/remove", status_code=202)
+    def remove(config: str, background_tasks: BackgroundTasks):
+        """Start removing all pages and links of a config.
+
+        Deletion runs in the background in chunks; poll
+        `GET /crawlers/remove/{job_id}` for progress.
+        """
         config_name = config
         if not config_name:
             raise HTTPException(status_code=400, detail="missing config")
@@ -166,26 +283,23 @@ def create_crawlers_router(
         except Exception:
             raise HTTPException(status_code=404, detail="config not found")
 
-        try:
-            # Get all pages belonging to this config
-            page_ids = pages_repo.get_page_ids_by_config(cfg.config_id)
-            deleted_links = 0
-            deleted_pages = 0
-            if page_ids:
-                # Get all pages referenced by these pages (including the config's pages)
-                all_page_ids = links_repo.get_all_page_ids_referenced_by_pages(page_ids)
-                # Delete all links referencing any of these pages
-                deleted_links = links_repo.delete_links_for_page_ids(all_page_ids)
-                # Delete all pages referenced by the config's pages
-                deleted_pages = pages_repo.delete_pages_by_ids(all_page_ids)
-        except Exception:
-            raise HTTPException(status_code=500, detail="error removing data")
+        job = data_remover.create_job(cfg.config_id, config_name)
+        if job["status"] == "pending":
+            background_tasks.add_task(data_remover.run, job["job_id"])
+        return job
 
-        return {
-            "status": "removed",
-            "deleted_pages": deleted_pages,
-            "deleted_links": deleted_links,
-        }
+    @router.get("/remove/{job_id}")
+    def get_removal(job_id: str):
+        job = data_remover.get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="removal job not found")
+        return job
+
+    @router.post("/remove/{job_id}/cancel")
+    def cancel_removal(job_id: str):
+        if not data_remover.cancel(job_id):
+            raise HTTPException(status_code=404, detail="removal job not found or already finished")
+        return {"status": "cancelling", "job_id": job_id}
 
     @router.get("/runs")
     def list_runs(limit: Optional[int] = 20, offset: Optional[int] = 0):
@@ -203,13 +317,20 @@ def create_crawlers_router(
                 "start_timestamp": r.start_timestamp,
                 "end_timestamp": r.end_timestamp,
                 "exception": r.exception,
+                "stop_reason": getattr(r, "stop_reason", None),
             }
 
         return [r_to_dict(r) for r in runs]
 
     @router.get("/stats/{config}")
-    def get_config_stats(config: str):
-        """Get statistics (page and link counts) for a config."""
+    def get_config_stats(config: str, breakdown: bool = False):
+        """Get statistics (page and link counts) for a config.
+
+        Served from the incrementally maintained `config_stats` row (a primary
+        key lookup). `breakdown=true` adds per-depth, per-status-class and
+        per-fetch-state figures, aggregated from the pages table on demand;
+        its page counts then take precedence over the counters.
+        """
         if not config:
             raise HTTPException(status_code=400, detail="missing config")
         try:
@@ -218,19 +339,67 @@ def create_crawlers_router(
             raise HTTPException(status_code=404, detail="config not found")
 
         try:
-            # Only count pages that have been fetched (have content)
-            page_ids = pages_repo.get_fetched_page_ids_by_config(cfg.config_id)
-            page_count = len(page_ids) if page_ids else 0
-            link_count = 0
-            if page_ids:
-                link_count = links_repo.count_links_for_page_ids(page_ids)
+            if config_stats_repo is None or breakdown:
+                stats = pages_repo.get_config_stats(cfg.config_id)
+            else:
+                stats = {}
+            if config_stats_repo is not None:
+                counters = config_stats_repo.get(cfg.config_id)
+                settled = (
+                    counters["pages_fetched"] + counters["pages_skipped"] + counters["pages_fetch_failed"]
+                )
+                from_counters = {
+                    "pages": counters["pages_fetched"],
+                    "pending": counters["pages_discovered"] - settled,
+                    "skipped": counters["pages_skipped"],
+                    "fetch_failed": counters["pages_fetch_failed"],
+                    "total_pages": counters["pages_discovered"],
+                    "failed": counters["pages_failed"],
+                    "links": counters["links"],
+                    "bytes_stored": counters["bytes_stored"],
+                    "last_fetched_at": counters["last_fetched_at"],
+                }
+                # The breakdown's exact aggregate wins over the incremental counters
+                for key, value in from_counters.items():
+                    stats.setdefault(key, value)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"error getting stats: {str(e)}")
 
-        return {
-            "config_path": config,
-            "pages": page_count,
-            "links": link_count,
-        }
+        return {"config_path": config, **stats}
+
+    @router.post("/rank/{config}")
+    def compute_page_ranks(config: str):
+        """Recompute in/out-degree and PageRank for a config's link graph."""
+        if link_graph_service is None:
+            raise HTTPException(status_code=501, detail="link graph analytics not configured")
+        try:
+            cfg = config_service.get_config(config)
+        except Exception:
+            raise HTTPException(status_code=404, detail="config not found")
+        try:
+            summary = link_graph_service.compute_scores(cfg.config_id)
+        except Exception:
+            raise HTTPException(status_code=500, detail="error computing ranks")
+        return {"config_path": config, **summary}
+
+    @router.get("/rank/{config}")
+    def get_page_ranks(
+        config: str,
+        limit: int = 50,
+        order_by: Annotated[str, Query(alias="by")] = "pagerank",
+    ):
+        """Top pages of a config by `pagerank`, `in_degree` or `out_degree`."""
+        if page_scores_repo is None:
+            raise HTTPException(status_code=501, detail="link graph analytics not configured")
+        if order_by not in ("pagerank", "in_degree", "out_degree"):
+            raise HTTPException(status_code=400, detail="by must be pagerank, in_degree or out_degree")
+        if limit < 1 or limit > 1000:
+            raise HTTPException(status_code=400, detail="limit must be between 1 and 1000")
+        try:
+            cfg = config_service.get_config(config)
+        except Exception:
+            raise HTTPException(status_code=404, detail="config not found")
+        pages = page_scores_repo.top_pages(cfg.config_id, limit=limit, order_by=order_by)
+        return {"config_path": config, "pages": pages}
 
     return router
@@ -27,7 +27,12 @@ def create_app(container: Container) -> FastAPI:
     crawl_executor = container.crawl_executor()
     crawl_registry = container.crawl_registry()
     crawls_repo = container.crawls_repository()
+    config_stats_repo = container.config_stats_repository()
+    page_scores_repo = container.page_scores_repository()
+    link_graph_service = container.link_graph_service()
     scheduler = container.scheduler_service()
+    job_queue = container.crawl_job_queue()
+    robots_service = container.robots_service()
 
     start_crawl_callback = crawl_executor.crawl
 
@@ -44,6 +49,8 @@ def create_app(container: Container) -> FastAPI:
                 scheduler.shutdown()
             except Exception:
                 logging.exception("Failed to shut down scheduler")
+            job_queue.shutdown()
+            robots_service.shutdown()
 
     app = FastAPI(title="InfraCrawl Control API", lifespan=_lifespan)
 
@@ -51,7 +58,7 @@ def create_app(container: Container) -> FastAPI:
     app.include_router(create_auth_router())
     # Protect configuration and crawler control endpoints with admin token.
     app.include_router(create_configs_router(config_service), dependencies=[Depends(require_admin)])
-    app.include_router(create_crawlers_router(pages_repo, links_repo, config_service, session_factory, start_crawl_callback, crawl_registry, crawls_repo), dependencies=[Depends(require_admin)])
+    app.include_router(create_crawlers_router(pages_repo, links_repo, config_service, session_factory, start_crawl_callback, crawl_registry, crawls_repo, config_stats_repo=config_stats_repo, page_scores_repo=page_scores_repo, link_graph_service=link_graph_service, job_queue=job_queue), dependencies=[Depends(require_admin)])
 
     # Serve minimal UI
     app.mount("/ui", StaticFiles(directory="static", html=True), name="ui")
@@ -6,6 +6,10 @@ from infracrawl.db.engine import make_engine
 from infracrawl.repository.pages import PagesRepository
 from infracrawl.repository.links import LinksRepository
 from infracrawl.repository.configs import ConfigsRepository
+from infracrawl.repository.config_stats import ConfigStatsRepository
+from infracrawl.repository.page_scores import PageScoresRepository
+from infracrawl.repository.crawl_jobs import CrawlJobsRepository
+from infracrawl.repository.robots_txt import RobotsTxtRepository
 from infracrawl.services.config_service import ConfigService
 from infracrawl.services.crawl_policy import CrawlPolicy
 from infracrawl.services.crawl_session_factory import CrawlSessionFactory
@@ -23,8 +27,14 @@ from infracrawl.services.link_persister import LinkPersister
 from infracrawl.services.content_review_service import ContentReviewService
 from infracrawl.services.crawl_executor import CrawlExecutor
 from infracrawl.services.crawl_registry import InMemoryCrawlRegistry
+from infracrawl.services.crawl_job_queue import CrawlJobQueue, DbCrawlJobQueue
+from infracrawl.services.crawl_worker import CrawlWorker
+from infracrawl.services.scheduled_crawl_job_runner import ScheduledCrawlJobRunner
+from infracrawl.services.link_graph import LinkGraphService
 from infracrawl.services.scheduler_service import SchedulerService
+from infracrawl.services.sitemap_service import SitemapService
 from infracrawl.repository.crawls import CrawlsRepository
+from infracrawl.utils.content_type import is_text_content_type
 from infracrawl import config as env
 from sqlalchemy.orm import sessionmaker
 
@@ -54,7 +64,8 @@ from sqlalchemy.orm import sessionmaker
 #
 # INFRACRAWL_RECOVERY_MODE (str, default: "restart")
 #   Startup behavior when incomplete crawl runs are found (e.g. "restart").
-#   Value is normalized with `.strip().lower()`.
+#   Value is normalized with `.strip().lower()`. Not used by the API in worker
+#   mode (INFRACRAWL_CRAWL_EXECUTION=worker): workers requeue dead workers' jobs.
 #
 # INFRACRAWL_RECOVERY_WITHIN_SECONDS (int seconds | optional)
 #   If set, only attempts recovery for runs whose last activity is within this window.
@@ -62,15 +73,62 @@ from sqlalchemy.orm import sessionmaker
 # INFRACRAWL_RECOVERY_MESSAGE (str, default: "job found incomplete on startup")
 #   Stored/logged message used when recovery logic detects an incomplete run.
 #
-# INFRACRAWL_VISITED_MAX_URLS (int, default: 100000)
-#   Upper bound for the per-crawl visited URL tracker (LRU eviction) to prevent
-#   unbounded memory growth on large crawls.
+# INFRACRAWL_STATS_RECONCILE_INTERVAL (int seconds, default: 3600)
+#   How often the scheduler recomputes the per-config `config_stats` counters from
+#   the pages/links tables to correct drift. 0 disables the job.
+#
+# INFRACRAWL_VISITED_MAX_URLS (int, default: 1000000)
+#   Number of URL fingerprints the per-crawl visited tracker holds exactly
+#   (~12-24 bytes each). URLs beyond this spill into the Bloom-filter tier.
+#
+# INFRACRAWL_VISITED_BLOOM_CAPACITY (int, default: 10000000)
+#   URLs the visited tracker's Bloom-filter overflow tier is sized for. The
+#   filter is only allocated once the exact tier is full. 0 disables the tier
+#   and lets the exact tier grow without bound.
+#
+# INFRACRAWL_VISITED_BLOOM_ERROR_RATE (float, default: 0.001)
+#   Target false-positive rate of the Bloom-filter tier. A false positive
+#   means a URL is treated as already visited and skipped.
+#
+# INFRACRAWL_MAX_CONCURRENT_CRAWLS (int, default: 2)
+#   Crawls (manual, scheduled and recovery) that may run at the same time. Further
+#   crawls wait in a priority queue: manual, then scheduled, then recovery. A config
+#   is never queued or run twice at once. In worker mode this is the number of
+#   crawl slots per `worker.py` process.
+#
+# INFRACRAWL_CRAWL_EXECUTION (str, default: "inline")
+#   "inline": the API process runs crawls itself. "worker": the API and scheduler
+#   only insert jobs into the `crawl_jobs` table and `python worker.py` processes
+#   run them. Value is normalized with `.strip().lower()`. Worker-run crawls are
+#   not in the API's in-memory crawl registry: `/crawlers/active`,
+#   `/crawlers/active/{id}` (and its log) and `/crawlers/cancel/{id}` do not see
+#   them; use `/crawlers/queue` and `/crawlers/log/{config}` instead.
+#
+# INFRACRAWL_WORKER_POLL_INTERVAL (float seconds, default: 2.0)
+#   How long an idle worker slot waits before polling `crawl_jobs` again.
+#
+# INFRACRAWL_WORKER_LEASE_SECONDS (int seconds, default: 300)
+#   Running jobs whose worker has not heartbeated for this long are requeued
+#   as recovery jobs. Workers heartbeat every third of this interval.
 #
 # INFRACRAWL_ROBOTS_CACHE_MAX_SIZE (int, default: 2048)
 #   Max number of domains to keep in the in-memory robots.txt cache (LRU eviction).
 #
 # INFRACRAWL_ROBOTS_CACHE_TTL_SECONDS (int seconds, default: 3600)
 #   TTL for robots.txt cache entries. Entries older than TTL are treated as missing.
+#
+# INFRACRAWL_ROBOTS_STORE_TTL_SECONDS (int seconds, default: 86400)
+#   How long a robots.txt copy in the shared `robots_txt` table is used before
+#   it is revalidated with a conditional GET.
+#
+# INFRACRAWL_ROBOTS_PREFETCH_WORKERS (int, default: 8)
+#   Threads fetching robots.txt ahead of time for root and newly discovered hosts.
+#
+# INFRACRAWL_MAX_BODY_BYTES (int bytes, default: 10485760)
+#   Largest page body downloaded; larger pages are skipped as soon as their
+#   Content-Length or the streamed bytes exceed it. 0 disables the limit.
+#   A config can override it with `fetch: {http: {max_body_bytes: 5MB}}`
+#   (bytes or a size like `max_bytes`).
 ENV = {
     "DATABASE_URL": env.get_optional_str_env("DATABASE_URL"),
     "USER_AGENT": env.get_str_env("USER_AGENT", "InfraCrawl/0.1"),
@@ -80,9 +138,19 @@ ENV = {
     "INFRACRAWL_RECOVERY_MODE": env.get_str_env("INFRACRAWL_RECOVERY_MODE", "restart").strip().lower(),
     "INFRACRAWL_RECOVERY_WITHIN_SECONDS": env.get_optional_int_env("INFRACRAWL_RECOVERY_WITHIN_SECONDS"),
     "INFRACRAWL_RECOVERY_MESSAGE": env.get_str_env("INFRACRAWL_RECOVERY_MESSAGE", "job found incomplete on startup"),
-    "INFRACRAWL_VISITED_MAX_URLS": env.get_int_env("INFRACRAWL_VISITED_MAX_URLS", 100_000),
+    "INFRACRAWL_STATS_RECONCILE_INTERVAL": env.get_int_env("INFRACRAWL_STATS_RECONCILE_INTERVAL", 3600),
+    "INFRACRAWL_VISITED_MAX_URLS": env.get_int_env("INFRACRAWL_VISITED_MAX_URLS", 1_000_000),
+    "INFRACRAWL_VISITED_BLOOM_CAPACITY": env.get_int_env("INFRACRAWL_VISITED_BLOOM_CAPACITY", 10_000_000),
+    "INFRACRAWL_VISITED_BLOOM_ERROR_RATE": env.get_float_env("INFRACRAWL_VISITED_BLOOM_ERROR_RATE", 0.001),
+    "INFRACRAWL_MAX_CONCURRENT_CRAWLS": env.get_int_env("INFRACRAWL_MAX_CONCURRENT_CRAWLS", 2),
+    "INFRACRAWL_CRAWL_EXECUTION": env.get_str_env("INFRACRAWL_CRAWL_EXECUTION", "inline").strip().lower(),
+    "INFRACRAWL_WORKER_POLL_INTERVAL": env.get_float_env("INFRACRAWL_WORKER_POLL_INTERVAL", 2.0),
+    "INFRACRAWL_WORKER_LEASE_SECONDS": env.get_int_env("INFRACRAWL_WORKER_LEASE_SECONDS", 300),
     "INFRACRAWL_ROBOTS_CACHE_MAX_SIZE": env.get_int_env("INFRACRAWL_ROBOTS_CACHE_MAX_SIZE", 2048),
     "INFRACRAWL_ROBOTS_CACHE_TTL_SECONDS": env.get_int_env("INFRACRAWL_ROBOTS_CACHE_TTL_SECONDS", 3600),
+    "INFRACRAWL_ROBOTS_STORE_TTL_SECONDS": env.get_int_env("INFRACRAWL_ROBOTS_STORE_TTL_SECONDS", 86400),
+    "INFRACRAWL_ROBOTS_PREFETCH_WORKERS": env.get_int_env("INFRACRAWL_ROBOTS_PREFETCH_WORKERS", 8),
+    "INFRACRAWL_MAX_BODY_BYTES": env.get_int_env("INFRACRAWL_MAX_BODY_BYTES", 10 * 1024 * 1024),
 }
 
 
@@ -120,26 +188,62 @@ class Container(containers.DeclarativeContainer):
         session_factory=session_factory
     )
 
+    config_stats_repository = providers.Singleton(
+        ConfigStatsRepository,
+        session_factory=session_factory
+    )
+
     crawls_repository = providers.Singleton(
         CrawlsRepository,
         session_factory=session_factory
     )
 
+    page_scores_repository = providers.Singleton(
+        PageScoresRepository,
+        session_factory=session_factory
+    )
+
+    robots_txt_repository = providers.Singleton(
+        RobotsTxtRepository,
+        session_factory=session_factory
+    )
+
     crawl_registry = providers.Singleton(
         InMemoryCrawlRegistry
     )
+
+    crawl_jobs_repository = providers.Singleton(
+        CrawlJobsRepository,
+        session_factory=session_factory
+    )
+
+    # Where crawls run: in this process, or in `worker.py` processes fed by `crawl_jobs`
+    crawl_job_queue = providers.Selector(
+        config.INFRACRAWL_CRAWL_EXECUTION,
+        inline=providers.Singleton(
+            CrawlJobQueue,
+            max_concurrent=config.INFRACRAWL_MAX_CONCURRENT_CRAWLS.as_(int),
+        ),
+        worker=providers.Singleton(
+            DbCrawlJobQueue,
+            jobs_repo=crawl_jobs_repository,
+        ),
+    )
     
     # Services - Singleton instances
     http_service = providers.Singleton(
         HttpService,
         user_agent=config.USER_AGENT.as_(str),
         http_client=providers.Object(requests.get),
-        timeout=config.HTTP_TIMEOUT.as_(int)
+        timeout=config.HTTP_TIMEOUT.as_(int),
+        max_body_bytes=config.INFRACRAWL_MAX_BODY_BYTES.as_(int),
+        head_client=providers.Object(requests.head),
     )
 
     page_fetcher = providers.Singleton(
         HttpServiceFetcher,
         http_service=http_service,
+        accept_content_type=providers.Object(is_text_content_type),
     )
 
     headless_fetcher = providers.Singleton(
@@ -168,6 +272,9 @@ class Container(containers.DeclarativeContainer):
         http_service=http_service,
         user_agent=config.USER_AGENT.as_(str),
         cache=robots_cache,
+        store=robots_txt_repository,
+        ttl_seconds=config.INFRACRAWL_ROBOTS_STORE_TTL_SECONDS.as_(int),
+        prefetch_workers=config.INFRACRAWL_ROBOTS_PREFETCH_WORKERS.as_(int),
     )
     
     content_review_service = providers.Singleton(
@@ -196,12 +303,15 @@ class Container(containers.DeclarativeContainer):
         LinkProcessor,
         content_review_service=content_review_service,
         link_persister=link_persister,
+        robots_service=robots_service,
     )
 
     crawl_session_factory = providers.Singleton(
         CrawlSessionFactory,
         registry=crawl_registry,
         visited_tracker_max_urls=config.INFRACRAWL_VISITED_MAX_URLS.as_(int),
+        visited_bloom_capacity=config.INFRACRAWL_VISITED_BLOOM_CAPACITY.as_(int),
+        visited_bloom_error_rate=config.INFRACRAWL_VISITED_BLOOM_ERROR_RATE.as_(float),
     )
 
     crawl_session_resume_factory = providers.Singleton(
@@ -210,6 +320,8 @@ class Container(containers.DeclarativeContainer):
         links_repo=links_repository,
         registry=crawl_registry,
         visited_tracker_max_urls=config.INFRACRAWL_VISITED_MAX_URLS.as_(int),
+        visited_bloom_capacity=config.INFRACRAWL_VISITED_BLOOM_CAPACITY.as_(int),
+        visited_bloom_error_rate=config.INFRACRAWL_VISITED_BLOOM_ERROR_RATE.as_(float),
     )
 
     configured_crawl_provider_factory = providers.Singleton(
@@ -226,9 +338,44 @@ class Container(containers.DeclarativeContainer):
         configs_repo=configs_repository
     )
 
+    link_graph_service = providers.Singleton(
+        LinkGraphService,
+        links_repo=links_repository,
+        page_scores_repo=page_scores_repository,
+    )
+
+    sitemap_service = providers.Singleton(
+        SitemapService,
+        http_service=http_service,
+        robots_service=robots_service,
+        pages_repo=pages_repository,
+    )
+
     crawl_executor = providers.Factory(
         CrawlExecutor,
         provider_factory=configured_crawl_provider_factory,
+        sitemap_seeder=sitemap_service,
+        robots_prefetcher=robots_service,
+    )
+
+    crawl_job_runner = providers.Factory(
+        ScheduledCrawlJobRunner,
+        config_provider=config_service,
+        session_factory=crawl_session_factory,
+        resume_session_factory=crawl_session_resume_factory,
+        start_crawl_callback=crawl_executor.provided.crawl,
+        crawls_repo=crawls_repository,
+    )
+
+    # Worker process (`worker.py`) - claims jobs from `crawl_jobs`
+    crawl_worker = providers.Factory(
+        CrawlWorker,
+        jobs_repo=crawl_jobs_repository,
+        job_runner=crawl_job_runner,
+        crawl_registry=crawl_registry,
+        concurrency=config.INFRACRAWL_MAX_CONCURRENT_CRAWLS.as_(int),
+        poll_interval_seconds=config.INFRACRAWL_WORKER_POLL_INTERVAL.as_(float),
+        lease_seconds=config.INFRACRAWL_WORKER_LEASE_SECONDS.as_(int),
     )
 
     # Scheduler - Singleton instance
@@ -243,4 +390,8 @@ class Container(containers.DeclarativeContainer):
         recovery_mode=config.INFRACRAWL_RECOVERY_MODE.as_(str),
         recovery_within_seconds=config.INFRACRAWL_RECOVERY_WITHIN_SECONDS,
         recovery_message=config.INFRACRAWL_RECOVERY_MESSAGE.as_(str),
+        config_stats_repo=config_stats_repository,
+        stats_reconcile_interval_seconds=config.INFRACRAWL_STATS_RECONCILE_INTERVAL.as_(int),
+        job_queue=crawl_job_queue,
+        crawl_execution=config.INFRACRAWL_CRAWL_EXECUTION.as_(str),
     )
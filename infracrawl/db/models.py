@@ -1,18 +1,39 @@
 from __future__ import annotations
 
 
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, func
+from sqlalchemy import BigInteger, Column, Float, Index, Integer, Text, DateTime, ForeignKey, func, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import declarative_base, relationship
 
+from infracrawl.utils.url_fingerprint import url_hash
+
 
 Base = declarative_base()
 
 
+def _default_url_hash(context) -> int:
+    return url_hash(context.get_current_parameters()["page_url"])
+
+
+def _not_postgresql(ddl, target, bind, **kw) -> bool:
+    return kw["dialect"].name != "postgresql"
+
+
 class Page(Base):
     __tablename__ = "pages"
+    # As in migrations/20260118_add_url_hash_to_pages.sql: page_url is kept
+    # unique in Postgres by a hash exclusion constraint rather than a B-tree,
+    # and lookups go through the fixed-width url_hash index. Other dialects
+    # (tests) have no exclusion constraints and get a unique index instead.
+    __table_args__ = (
+        Index("idx_pages_url_hash", "url_hash"),
+        ExcludeConstraint(("page_url", "="), name="pages_page_url_excl", using="hash").ddl_if(dialect="postgresql"),
+        Index("uq_pages_page_url", "page_url", unique=True).ddl_if(callable_=_not_postgresql),
+    )
 
     page_id = Column(Integer, primary_key=True)
-    page_url = Column(Text, unique=True, nullable=False)
+    page_url = Column(Text, nullable=False)
+    url_hash = Column(BigInteger, nullable=False, default=_default_url_hash)
     page_content = Column(Text, nullable=True)
     plain_text = Column(Text, nullable=True)
     filtered_plain_text = Column(Text, nullable=True)
@@ -21,6 +42,30 @@ class Page(Base):
     fetched_at = Column(DateTime(timezone=True), nullable=True)
     config_id = Column(Integer, nullable=True)
     discovered_depth = Column(Integer, nullable=True)  # Depth at which this page was discovered
+    # Frontier ordering: links discovered to this page and the resulting
+    # fetch priority (see infracrawl.services.frontier_priority)
+    inlink_count = Column(Integer, nullable=False, default=0, server_default="0")
+    priority = Column(Float, nullable=True)
+    # <lastmod> from the site's sitemap (UTC); newer than fetched_at means the page changed
+    sitemap_lastmod = Column(DateTime(timezone=True), nullable=True)
+    # pending | in_flight | fetched | failed | skipped (see infracrawl.domain.fetch_state)
+    fetch_state = Column(Text, nullable=False, default="pending", server_default="pending")
+    # Why a skipped page is never fetched (e.g. "robots", "content_type")
+    skip_reason = Column(Text, nullable=True)
+    # Change history for adaptive revisits (see infracrawl.services.revisit_policy):
+    # refetches, refetches with a new content_hash, and the time they spanned
+    revisit_checks = Column(Integer, nullable=False, default=0, server_default="0")
+    revisit_changes = Column(Integer, nullable=False, default=0, server_default="0")
+    revisit_observed_seconds = Column(Float, nullable=False, default=0.0, server_default="0")
+    last_changed_at = Column(DateTime(timezone=True), nullable=True)
+    next_visit_at = Column(DateTime(timezone=True), nullable=True)
+    # SimHash of the extracted text (signed 64-bit) and its four 16-bit bands,
+    # which are indexed for near-duplicate candidate lookup.
+    simhash = Column(BigInteger, nullable=True)
+    simhash_b0 = Column(Integer, nullable=True)
+    simhash_b1 = Column(Integer, nullable=True)
+    simhash_b2 = Column(Integer, nullable=True)
+    simhash_b3 = Column(Integer, nullable=True)
 
 
 class Link(Base):
@@ -52,3 +97,90 @@ class CrawlRun(Base):
     start_timestamp = Column(DateTime(timezone=True), nullable=False)
     end_timestamp = Column(DateTime(timezone=True), nullable=True)
     exception = Column(Text, nullable=True)
+    stop_reason = Column(Text, nullable=True)  # "cancelled" or the budget that ended the run
+
+
+class ConfigStats(Base):
+    """Per-config counters maintained incrementally by the repositories.
+
+    Updated in the same transactions that write pages and links; see
+    `infracrawl.repository.config_stats` for the upsert and reconcile logic.
+    """
+    __tablename__ = "config_stats"
+
+    config_id = Column(Integer, primary_key=True)
+    pages_discovered = Column(BigInteger, nullable=False, default=0)
+    pages_fetched = Column(BigInteger, nullable=False, default=0)
+    pages_failed = Column(BigInteger, nullable=False, default=0)  # fetched with HTTP status >= 400
+    pages_skipped = Column(BigInteger, nullable=False, default=0)  # fetch_state 'skipped'
+    pages_fetch_failed = Column(BigInteger, nullable=False, default=0)  # fetch_state 'failed' (no usable response)
+    links = Column(BigInteger, nullable=False, default=0)
+    bytes_stored = Column(BigInteger, nullable=False, default=0)  # UTF-8 size of stored page_content
+    last_fetched_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class PageScore(Base):
+    """Link-graph scores per page, recomputed per config by `LinkGraphService`."""
+    __tablename__ = "page_scores"
+
+    page_id = Column(Integer, primary_key=True)
+    config_id = Column(Integer, nullable=False)
+    in_degree = Column(Integer, nullable=False, default=0)
+    out_degree = Column(Integer, nullable=False, default=0)
+    pagerank = Column(Float, nullable=False, default=0.0)
+    computed_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class CrawlJob(Base):
+    """A queued or executed crawl, claimed by worker processes (see `worker.py`).
+
+    At most one job per config is queued or running at a time, enforced by a
+    partial unique index.
+    """
+    __tablename__ = "crawl_jobs"
+    __table_args__ = (
+        Index(
+            "uq_crawl_jobs_active_config",
+            "config_path",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
+        Index(
+            "idx_crawl_jobs_queued",
+            "priority",
+            "job_id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+    )
+
+    job_id = Column(Integer, primary_key=True)
+    config_path = Column(Text, nullable=False)
+    kind = Column(Text, nullable=False)  # manual | scheduled | recovery
+    priority = Column(Integer, nullable=False)  # lower runs first
+    status = Column(Text, nullable=False, default="queued")  # queued | running | done | failed
+    worker_id = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    enqueued_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RobotsTxt(Base):
+    """robots.txt per site, shared by every crawl process (see `RobotsService`).
+
+    `body` is kept for 2xx responses only; other statuses are remembered so
+    4xx sites are not asked again until `expires_at`. ETag / Last-Modified
+    are sent back to revalidate an expired copy with a conditional GET.
+    """
+    __tablename__ = "robots_txt"
+
+    base_url = Column(Text, primary_key=True)  # scheme://host[:port]
+    status_code = Column(Integer, nullable=False)
+    body = Column(Text, nullable=True)
+    etag = Column(Text, nullable=True)
+    last_modified = Column(Text, nullable=True)
+    fetched_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
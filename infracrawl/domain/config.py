@@ -30,6 +30,14 @@ class CrawlerConfigData:
     headless_options: Optional[dict] = None
     delay_seconds: float = 1.0
     resume_on_application_restart: bool = True
+    canonicalize_options: Optional[dict] = None
+    near_duplicate_options: Optional[dict] = None
+    priority_options: Optional[dict] = None
+    sitemap_options: Optional[dict] = None
+    revisit_options: Optional[dict] = None
+    max_pages: Optional[int] = None
+    max_duration_seconds: Optional[float] = None
+    max_bytes: Optional[int] = None
 
 
 class CrawlerConfig:
@@ -56,6 +64,14 @@ class CrawlerConfig:
         headless_options: Optional[dict] = None,
         delay_seconds: float = 1.0,
         resume_on_application_restart: bool = True,
+        canonicalize_options: Optional[dict] = None,
+        near_duplicate_options: Optional[dict] = None,
+        priority_options: Optional[dict] = None,
+        sitemap_options: Optional[dict] = None,
+        revisit_options: Optional[dict] = None,
+        max_pages: Optional[int] = None,
+        max_duration_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
     ):
         if fetch_mode is None or (isinstance(fetch_mode, str) and fetch_mode.strip() == ""):
             raise ValueError("fetch_mode is required")
@@ -78,6 +94,14 @@ class CrawlerConfig:
             headless_options=headless_options,
             delay_seconds=delay_seconds,
             resume_on_application_restart=bool(resume_on_application_restart),
+            canonicalize_options=canonicalize_options,
+            near_duplicate_options=near_duplicate_options,
+            priority_options=priority_options,
+            sitemap_options=sitemap_options,
+            revisit_options=revisit_options,
+            max_pages=max_pages,
+            max_duration_seconds=max_duration_seconds,
+            max_bytes=max_bytes,
         )
 
     @property
@@ -140,5 +164,37 @@ class CrawlerConfig:
     def resume_on_application_restart(self) -> bool:
         return self.data.resume_on_application_restart
 
+    @property
+    def canonicalize_options(self) -> Optional[dict]:
+        return self.data.canonicalize_options
+
+    @property
+    def near_duplicate_options(self) -> Optional[dict]:
+        return self.data.near_duplicate_options
+
+    @property
+    def priority_options(self) -> Optional[dict]:
+        return self.data.priority_options
+
+    @property
+    def sitemap_options(self) -> Optional[dict]:
+        return self.data.sitemap_options
+
+    @property
+    def revisit_options(self) -> Optional[dict]:
+        return self.data.revisit_options
+
+    @property
+    def max_pages(self) -> Optional[int]:
+        return self.data.max_pages
+
+    @property
+    def max_duration_seconds(self) -> Optional[float]:
+        return self.data.max_duration_seconds
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self.data.max_bytes
+
     def __repr__(self):
         return f"<CrawlerConfig id={self.config_id} path={self.config_path} schedule={self.schedule}>"
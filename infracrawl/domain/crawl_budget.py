@@ -0,0 +1,78 @@
+import re
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$", re.IGNORECASE)
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+
+# CrawlSession.stop_reason values set when a budget runs out
+BUDGET_STOP_REASONS = ("max_pages", "max_duration", "max_bytes")
+
+
+def parse_duration_seconds(value: Union[int, float, str, None]) -> Optional[float]:
+    """Parse `90`, `"90s"`, `"30m"`, `"2h"` or `"1d"` into seconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = float(value)
+    else:
+        m = _DURATION.match(str(value))
+        if not m:
+            raise ValueError(f"invalid duration: {value!r}")
+        seconds = float(m.group(1)) * _DURATION_UNITS[m.group(2).lower()]
+    if seconds <= 0:
+        raise ValueError(f"duration must be positive: {value!r}")
+    return seconds
+
+
+def parse_size_bytes(value: Union[int, str, None]) -> Optional[int]:
+    """Parse `1048576`, `"500KB"`, `"200MB"` or `"2GiB"` (1024-based) into bytes."""
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        size = value
+    else:
+        m = _SIZE.match(str(value))
+        if not m:
+            raise ValueError(f"invalid size: {value!r}")
+        size = int(float(m.group(1)) * _SIZE_UNITS[m.group(2).lower()])
+    if size <= 0:
+        raise ValueError(f"size must be positive: {value!r}")
+    return size
+
+
+@dataclass(frozen=True)
+class CrawlBudget:
+    """Per-crawl resource limits; None means unlimited."""
+
+    max_pages: Optional[int] = None
+    max_duration_seconds: Optional[float] = None
+    max_bytes: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config) -> "CrawlBudget":
+        if config is None:
+            return cls()
+        return cls(
+            max_pages=getattr(config, "max_pages", None),
+            max_duration_seconds=getattr(config, "max_duration_seconds", None),
+            max_bytes=getattr(config, "max_bytes", None),
+        )
+
+    def exceeded(self, *, pages: int, bytes_fetched: int, started_at: float, now: Optional[float] = None) -> Optional[str]:
+        """Return the name of the first exhausted budget, or None.
+
+        `started_at` and `now` are `time.monotonic()` values.
+        """
+        if self.max_pages is not None and pages >= self.max_pages:
+            return "max_pages"
+        if self.max_bytes is not None and bytes_fetched >= self.max_bytes:
+            return "max_bytes"
+        if self.max_duration_seconds is not None:
+            elapsed = (time.monotonic() if now is None else now) - started_at
+            if elapsed >= self.max_duration_seconds:
+                return "max_duration"
+        return None
@@ -1,5 +1,7 @@
 """Crawl result data model."""
-from typing import NamedTuple
+from typing import NamedTuple, Optional
+
+from infracrawl.domain.crawl_budget import BUDGET_STOP_REASONS
 
 
 class CrawlResult(NamedTuple):
@@ -13,3 +15,11 @@ class CrawlResult(NamedTuple):
     
     stopped: bool
     """True if crawl was stopped early via stop_event, False if completed normally"""
+
+    stop_reason: Optional[str] = None
+    """Why the crawl ended early: "cancelled", a budget name ("max_pages", "max_duration", "max_bytes"), or None"""
+
+    @property
+    def budget_limited(self) -> bool:
+        """True if the crawl ended because a page, time or byte budget ran out"""
+        return self.stop_reason in BUDGET_STOP_REASONS
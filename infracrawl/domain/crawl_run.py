@@ -3,13 +3,14 @@ from datetime import datetime
 
 
 class CrawlRun:
-    def __init__(self, run_id: int, config_id: Optional[int], config_path: Optional[str], start_timestamp: datetime, end_timestamp: Optional[datetime], exception: Optional[str]):
+    def __init__(self, run_id: int, config_id: Optional[int], config_path: Optional[str], start_timestamp: datetime, end_timestamp: Optional[datetime], exception: Optional[str], stop_reason: Optional[str] = None):
         self.run_id = run_id
         self.config_id = config_id
         self.config_path = config_path
         self.start_timestamp = start_timestamp
         self.end_timestamp = end_timestamp
         self.exception = exception
+        self.stop_reason = stop_reason
 
     def __repr__(self):
         return (
@@ -1,7 +1,9 @@
 import threading
+import time
 from contextlib import contextmanager
 from typing import Optional
 from infracrawl.domain.config import CrawlerConfig
+from infracrawl.domain.crawl_budget import CrawlBudget
 from infracrawl.domain.visited_tracker import VisitedTracker
 
 
@@ -23,6 +25,7 @@ class CrawlSession:
         crawl_id: Optional[str] = None,
         stop_event: Optional[threading.Event] = None,
         registry=None,
+        resumed: bool = False,
     ):
         # Identity & tracking
         self.crawl_id = crawl_id
@@ -31,15 +34,25 @@ class CrawlSession:
         
         # Configuration
         self.config = config
+        # True when continuing an interrupted crawl (see CrawlSessionResumeFactory)
+        self.resumed = resumed
         
         # Execution state - current_root is set when iterating multiple root URLs
         self.current_root: Optional[str] = None
         # Visited URL tracking delegated to separate class (SRP fix)
         self.visited_tracker = visited_tracker if visited_tracker is not None else VisitedTracker()
-        # Track pages fetched within the current crawl
+        # Pages fetched for this config, including earlier runs when resumed (for display)
         self.pages_crawled: int = 0
+        # Pages fetched by this run only; the max_pages budget counts these
+        self.pages_this_run: int = 0
         # Track links discovered
         self.links_discovered: int = 0
+        # Budget accounting (limits come from the config)
+        self.budget = CrawlBudget.from_config(config)
+        self.bytes_fetched: int = 0
+        self.started_at: float = time.monotonic()
+        # Why the crawl ended early: "cancelled" or a budget name (see BUDGET_STOP_REASONS)
+        self.stop_reason: Optional[str] = None
 
     def start_tracking(self) -> None:
         """Begin registry tracking if registry is configured.
@@ -83,6 +96,33 @@ class CrawlSession:
 
     def increment_pages_crawled(self, count: int = 1) -> None:
         self.pages_crawled += int(count)
+        self.pages_this_run += int(count)
+
+    def add_bytes_fetched(self, count: int) -> None:
+        self.bytes_fetched += int(count)
+
+    def start_budget_clock(self) -> None:
+        """Restart the duration budget (called when the crawl actually begins)."""
+        self.started_at = time.monotonic()
+
+    def budget_exhausted(self) -> bool:
+        """True once any budget is used up; records it as `stop_reason`.
+
+        Checked before handing out each new URL. Unlike `mark_stopped`, this
+        does not signal the stop event, so an in-flight fetch and its
+        persistence complete normally.
+        """
+        if self.stop_reason is not None:
+            return self.stop_reason != "cancelled"
+        reason = self.budget.exceeded(
+            pages=self.pages_this_run,
+            bytes_fetched=self.bytes_fetched,
+            started_at=self.started_at,
+        )
+        if reason is not None:
+            self.stop_reason = reason
+            return True
+        return False
 
     def set_current_page(self, page):
         """Set the page currently being processed for link extraction."""
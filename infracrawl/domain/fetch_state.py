@@ -0,0 +1,20 @@
+class FetchState:
+    """Values of `pages.fetch_state`, the page's place in the crawl.
+
+    A discovered page is `pending`; a crawl marks it `in_flight` while
+    fetching it, then `fetched` (content stored, whatever the HTTP status),
+    `failed` (no usable response: network error, or it could not be stored)
+    or `skipped` (never to be fetched: robots.txt, content type; see
+    `pages.skip_reason`). A fresh crawl puts failed and skipped pages back to
+    pending; a resumed one does the same for pages left in flight.
+    """
+
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    FETCHED = "fetched"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    ALL = (PENDING, IN_FLIGHT, FETCHED, FAILED, SKIPPED)
+    # Not fetched yet, or interrupted while fetching
+    UNFETCHED = (PENDING, IN_FLIGHT)
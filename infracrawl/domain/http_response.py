@@ -1,4 +1,4 @@
-from typing import NamedTuple, Optional
+from typing import Iterator, Mapping, NamedTuple, Optional
 
 
 class HttpResponse(NamedTuple):
@@ -6,3 +6,11 @@ class HttpResponse(NamedTuple):
     status_code: int
     text: str
     content_type: Optional[str] = None
+    headers: Optional[Mapping[str, str]] = None
+
+
+class HttpStream(NamedTuple):
+    """Streamed response body, read chunk by chunk (see `HttpService.stream`)."""
+    status_code: int
+    chunks: Iterator[bytes]
+    content_type: Optional[str] = None
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 
 class Page:
-    def __init__(self, page_url: str, page_id: Optional[int] = None, page_content: Optional[str] = None, plain_text: Optional[str] = None, filtered_plain_text: Optional[str] = None, http_status: Optional[int] = None, fetched_at: Optional[datetime] = None, config_id: Optional[int] = None, content_hash: Optional[str] = None, discovered_depth: Optional[int] = None):
+    def __init__(self, page_url: str, page_id: Optional[int] = None, page_content: Optional[str] = None, plain_text: Optional[str] = None, filtered_plain_text: Optional[str] = None, http_status: Optional[int] = None, fetched_at: Optional[datetime] = None, config_id: Optional[int] = None, content_hash: Optional[str] = None, discovered_depth: Optional[int] = None, simhash: Optional[int] = None, sitemap_lastmod: Optional[datetime] = None, next_visit_at: Optional[datetime] = None, fetch_state: Optional[str] = None):
         self.page_id = page_id
         self.page_url = page_url
         self.page_content = page_content
@@ -13,6 +13,12 @@ class Page:
         self.config_id = config_id
         self.content_hash = content_hash
         self.discovered_depth = discovered_depth
+        self.simhash = simhash
+        self.sitemap_lastmod = sitemap_lastmod
+        self.next_visit_at = next_visit_at
+        self.fetch_state = fetch_state
+        # Set (transiently, not persisted) when the page was skipped as a near-duplicate of this page_id
+        self.near_duplicate_of: Optional[int] = None
 
     def __repr__(self):
         return f"<Page id={self.page_id} url={self.page_url}>"
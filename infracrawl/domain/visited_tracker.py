@@ -1,44 +1,216 @@
-from collections import OrderedDict
-from typing import Optional
+import logging
+import math
+from array import array
+from typing import Callable, Optional
+
+from infracrawl.utils.url_fingerprint import url_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class FingerprintSet:
+    """Open-addressing hash set of 64-bit URL fingerprints.
+
+    Slots live in a flat `array('Q')` (8 bytes each) and are probed linearly.
+    Zero marks an empty slot, so a fingerprint of 0 is stored as 1; the
+    resulting extra collision is irrelevant at 64 bits.
+    """
+
+    _MAX_LOAD = 0.7
+
+    def __init__(self, initial_capacity: int = 1024):
+        capacity = 8
+        while capacity < initial_capacity:
+            capacity *= 2
+        self._slots = array("Q", [0]) * capacity
+        self._mask = capacity - 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, fingerprint: int) -> bool:
+        fingerprint = fingerprint or 1
+        slots = self._slots
+        mask = self._mask
+        i = fingerprint & mask
+        while True:
+            slot = slots[i]
+            if slot == fingerprint:
+                return True
+            if slot == 0:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, fingerprint: int) -> bool:
+        """Add a fingerprint. Returns True if it was not already present."""
+        fingerprint = fingerprint or 1
+        if (self._size + 1) > len(self._slots) * self._MAX_LOAD:
+            self._grow()
+        if self._insert(self._slots, self._mask, fingerprint):
+            self._size += 1
+            return True
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._slots) * self._slots.itemsize
+
+    @staticmethod
+    def _insert(slots: array, mask: int, fingerprint: int) -> bool:
+        i = fingerprint & mask
+        while True:
+            slot = slots[i]
+            if slot == fingerprint:
+                return False
+            if slot == 0:
+                slots[i] = fingerprint
+                return True
+            i = (i + 1) & mask
+
+    def _grow(self) -> None:
+        old = self._slots
+        slots = array("Q", [0]) * (len(old) * 2)
+        mask = len(slots) - 1
+        for fingerprint in old:
+            if fingerprint:
+                self._insert(slots, mask, fingerprint)
+        self._slots = slots
+        self._mask = mask
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit fingerprints.
+
+    Bit positions are derived from the two 32-bit halves of the fingerprint
+    (Kirsch-Mitzenmacher double hashing), so no extra hashing is needed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._num_bits = max(num_bits, 8)
+        self._num_hashes = max(1, int(round(self._num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _positions(self, fingerprint: int):
+        h1 = fingerprint & 0xFFFFFFFF
+        h2 = (fingerprint >> 32) | 1
+        m = self._num_bits
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % m
+
+    def __contains__(self, fingerprint: int) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(fingerprint))
+
+    def add(self, fingerprint: int) -> bool:
+        """Add a fingerprint. Returns True if it was (probably) not present."""
+        bits = self._bits
+        added = False
+        for p in self._positions(fingerprint):
+            byte, mask = p >> 3, 1 << (p & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
 
 
 class VisitedTracker:
     """
     Tracks which URLs have been visited during a crawl.
-    
+
     Extracted from CrawlContext to follow Single Responsibility Principle.
     This class focuses solely on visited URL tracking, making it easier to:
     - Replace implementation (e.g., with bloom filter or database)
     - Test visited tracking logic independently
     - Reuse across different crawl contexts
+
+    URLs are stored as 64-bit fingerprints in a `FingerprintSet` (roughly
+    12-24 bytes per URL). Once `max_size` fingerprints are held, further URLs
+    spill into a `BloomFilter` tier instead of evicting older entries, so a
+    large crawl never refetches a URL because it fell out of the tracker.
+
+    An optional `fallback` lookup (e.g. a DB query) is consulted on misses,
+    which lets resumed crawls rely on persisted state instead of preloading
+    every previously fetched URL. Positive answers are remembered.
     """
-    
-    def __init__(self, max_size: Optional[int] = 100_000):
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 1_000_000,
+        *,
+        bloom_capacity: int = 10_000_000,
+        bloom_error_rate: float = 0.001,
+        fallback: Optional[Callable[[str], bool]] = None,
+    ):
         """Create a visited tracker.
 
-        `max_size` bounds memory usage by evicting least-recently-added URLs.
-        If `max_size` is None or <= 0, the tracker behaves as unbounded.
+        `max_size` bounds the exact fingerprint tier. URLs beyond it go to a
+        Bloom filter sized for `bloom_capacity` URLs at `bloom_error_rate`
+        false positives (allocated lazily on first spill). If `max_size` is
+        None or <= 0, or `bloom_capacity` is <= 0, the exact tier is unbounded.
         """
         self._max_size = int(max_size) if max_size is not None else None
         if self._max_size is not None and self._max_size <= 0:
             self._max_size = None
+        self._bloom_capacity = int(bloom_capacity or 0)
+        self._bloom_error_rate = float(bloom_error_rate)
+
+        self._exact = FingerprintSet()
+        self._bloom: Optional[BloomFilter] = None
+        self._fallback = fallback
+
+    def __len__(self) -> int:
+        return len(self._exact) + (len(self._bloom) if self._bloom is not None else 0)
+
+    def _exact_is_full(self) -> bool:
+        return (
+            self._max_size is not None
+            and self._bloom_capacity > 0
+            and len(self._exact) >= self._max_size
+        )
 
-        # OrderedDict gives us a lightweight LRU-like set.
-        self._visited: "OrderedDict[str, None]" = OrderedDict()
-    
     def mark(self, url: str) -> None:
         """Mark a URL as visited."""
-        if url in self._visited:
-            self._visited.move_to_end(url)
+        self._mark_fingerprint(url_fingerprint(url))
+
+    def _mark_fingerprint(self, fingerprint: int) -> None:
+        if fingerprint in self._exact:
             return
-        self._visited[url] = None
-        if self._max_size is not None:
-            while len(self._visited) > self._max_size:
-                self._visited.popitem(last=False)
-    
+        if not self._exact_is_full():
+            self._exact.add(fingerprint)
+            return
+        if self._bloom is None:
+            logger.info(
+                "Visited tracker reached %d exact entries; spilling into Bloom filter (capacity=%d)",
+                self._max_size,
+                self._bloom_capacity,
+            )
+            self._bloom = BloomFilter(self._bloom_capacity, self._bloom_error_rate)
+        self._bloom.add(fingerprint)
+
     def is_visited(self, url: str) -> bool:
         """Check if a URL has been visited."""
-        if url in self._visited:
-            self._visited.move_to_end(url)
+        fingerprint = url_fingerprint(url)
+        if fingerprint in self._exact:
+            return True
+        if self._bloom is not None and fingerprint in self._bloom:
+            return True
+        if self._fallback is not None and self._fallback(url):
+            self._mark_fingerprint(fingerprint)
             return True
         return False
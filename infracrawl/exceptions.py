@@ -17,3 +17,11 @@ class HttpFetchError(Exception):
         self.url = url
         self.original = original
         super().__init__(f"HTTP fetch failed for {url}: {original}")
+
+
+class ResponseTooLargeError(HttpFetchError):
+    """Raised when a response body is larger than the configured maximum."""
+
+    def __init__(self, url: str, limit: int):
+        self.limit = limit
+        super().__init__(url, ValueError(f"body larger than {limit} bytes"))
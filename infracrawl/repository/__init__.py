@@ -2,5 +2,9 @@ from .pages import PagesRepository
 from .links import LinksRepository
 from .configs import ConfigsRepository
 from .crawls import CrawlsRepository
+from .config_stats import ConfigStatsRepository
+from .page_scores import PageScoresRepository
+from .crawl_jobs import CrawlJobsRepository
+from .robots_txt import RobotsTxtRepository
 
-__all__ = ["PagesRepository", "LinksRepository", "ConfigsRepository", "CrawlsRepository"]
+__all__ = ["PagesRepository", "LinksRepository", "ConfigsRepository", "CrawlsRepository", "ConfigStatsRepository", "PageScoresRepository", "CrawlJobsRepository", "RobotsTxtRepository"]
@@ -0,0 +1,177 @@
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func, insert, select, union, update
+from sqlalchemy.orm import Session, aliased
+
+from infracrawl.db.models import ConfigStats as DBConfigStats
+from infracrawl.db.models import CrawlerConfig as DBCrawlerConfig
+from infracrawl.db.models import Link as DBLink
+from infracrawl.db.models import Page as DBPage
+from infracrawl.domain.fetch_state import FetchState
+
+logger = logging.getLogger(__name__)
+
+_COUNTERS = (
+    "pages_discovered", "pages_fetched", "pages_failed", "pages_skipped", "pages_fetch_failed",
+    "links", "bytes_stored",
+)
+
+# Fetch states with their own counter; pending/in-flight pages are what remains
+STATE_COUNTERS = {FetchState.SKIPPED: "pages_skipped", FetchState.FAILED: "pages_fetch_failed"}
+
+
+def content_bytes(content: Optional[str]) -> int:
+    """Size of `content` as stored (UTF-8 bytes); 0 for None."""
+    return len(content.encode("utf-8")) if content else 0
+
+
+def _dialect_insert(session: Session):
+    """`insert` with ON CONFLICT support for the session's dialect, or None if it has none."""
+    name = session.get_bind().dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
+
+
+def _bump_without_upsert(session: Session, config_id: int, last_fetched_at: Optional[datetime], deltas: dict) -> None:
+    """Portable `bump_config_stats`: increment the row in place, insert it if there is none yet."""
+    values = {name: getattr(DBConfigStats, name) + delta for name, delta in deltas.items()}
+    if last_fetched_at is not None:
+        values["last_fetched_at"] = last_fetched_at
+    values["updated_at"] = func.now()
+    result = session.execute(
+        update(DBConfigStats).where(DBConfigStats.config_id == config_id).values(**values)
+    )
+    if not result.rowcount:
+        session.execute(
+            insert(DBConfigStats).values(
+                config_id=config_id,
+                last_fetched_at=last_fetched_at,
+                **{name: deltas.get(name, 0) for name in _COUNTERS},
+            )
+        )
+
+
+def bump_config_stats(
+    session: Session,
+    config_id: Optional[int],
+    *,
+    last_fetched_at: Optional[datetime] = None,
+    **deltas: int,
+) -> None:
+    """Add `deltas` to the config's counters inside the caller's transaction.
+
+    Issues a single `INSERT ... ON CONFLICT DO UPDATE` so the counters commit
+    (or roll back) together with the page/link writes that caused them.
+    Dialects without ON CONFLICT get an UPDATE, then an INSERT if no row
+    was updated, in the same transaction.
+    Keyword names must be counter columns (pages_discovered, pages_fetched,
+    pages_failed, pages_skipped, pages_fetch_failed, links, bytes_stored).
+    """
+    if config_id is None:
+        return
+    unknown = set(deltas) - set(_COUNTERS)
+    if unknown:
+        raise ValueError(f"unknown config_stats counters: {sorted(unknown)}")
+    deltas = {k: int(v) for k, v in deltas.items() if v}
+    if not deltas and last_fetched_at is None:
+        return
+
+    upsert = _dialect_insert(session)
+    if upsert is None:
+        _bump_without_upsert(session, config_id, last_fetched_at, deltas)
+        return
+    values = {name: deltas.get(name, 0) for name in _COUNTERS}
+    stmt = upsert(DBConfigStats).values(config_id=config_id, last_fetched_at=last_fetched_at, **values)
+    set_ = {name: getattr(DBConfigStats, name) + getattr(stmt.excluded, name) for name in deltas}
+    if last_fetched_at is not None:
+        set_["last_fetched_at"] = stmt.excluded.last_fetched_at
+    set_["updated_at"] = func.now()
+    session.execute(stmt.on_conflict_do_update(index_elements=[DBConfigStats.config_id], set_=set_))
+
+
+class ConfigStatsRepository:
+    """Repository for the incrementally maintained `config_stats` counters."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get_session(self) -> Session:
+        return self.session_factory()
+
+    @staticmethod
+    def _to_dict(row: Optional[DBConfigStats], config_id: int) -> dict:
+        if row is None:
+            return {"config_id": config_id, **{name: 0 for name in _COUNTERS}, "last_fetched_at": None}
+        return {
+            "config_id": row.config_id,
+            **{name: int(getattr(row, name) or 0) for name in _COUNTERS},
+            "last_fetched_at": row.last_fetched_at,
+        }
+
+    def get(self, config_id: int) -> dict:
+        """Return the counters for a config (primary-key lookup). Missing rows read as zeros."""
+        with self.get_session() as session:
+            row = session.get(DBConfigStats, config_id)
+            return self._to_dict(row, config_id)
+
+    def reconcile(self, config_id: int) -> dict:
+        """Recompute the config's counters from `pages`/`links` and overwrite the row.
+
+        Fixes drift from writes that bypass the repositories (manual SQL,
+        bulk deletes, pages moved between configs).
+        """
+        with self.get_session() as session:
+            length = func.octet_length if session.get_bind().dialect.name == "postgresql" else func.length
+            fetched = DBPage.fetch_state == FetchState.FETCHED
+            src = aliased(DBPage)
+            links_count = (
+                select(func.count(DBLink.link_id))
+                .join(src, DBLink.link_from_id == src.page_id)
+                .where(src.config_id == config_id)
+                .scalar_subquery()
+            )
+            q = select(
+                func.count(DBPage.page_id).label("pages_discovered"),
+                func.count(DBPage.page_id).filter(fetched).label("pages_fetched"),
+                func.count(DBPage.page_id).filter(fetched & (DBPage.http_status >= 400)).label("pages_failed"),
+                func.count(DBPage.page_id).filter(DBPage.fetch_state == FetchState.SKIPPED).label("pages_skipped"),
+                func.count(DBPage.page_id).filter(DBPage.fetch_state == FetchState.FAILED).label("pages_fetch_failed"),
+                links_count.label("links"),
+                func.coalesce(func.sum(length(DBPage.page_content)), 0).label("bytes_stored"),
+                func.max(DBPage.fetched_at).filter(fetched).label("last_fetched_at"),
+            ).where(DBPage.config_id == config_id)
+            r = session.execute(q).one()
+
+            row = session.get(DBConfigStats, config_id)
+            if row is None:
+                row = DBConfigStats(config_id=config_id)
+                session.add(row)
+            for name in _COUNTERS:
+                setattr(row, name, int(getattr(r, name) or 0))
+            row.last_fetched_at = r.last_fetched_at
+            session.commit()
+            session.refresh(row)
+            return self._to_dict(row, config_id)
+
+    def reconcile_all(self) -> List[int]:
+        """Reconcile every config that has a config row, pages or a counters row."""
+        with self.get_session() as session:
+            q = union(
+                select(DBCrawlerConfig.config_id),
+                select(DBPage.config_id).where(DBPage.config_id.is_not(None)).distinct(),
+                select(DBConfigStats.config_id),
+            )
+            config_ids = sorted(session.execute(q).scalars().all())
+        for config_id in config_ids:
+            try:
+                self.reconcile(config_id)
+            except Exception:
+                logger.exception("Failed to reconcile config_stats for config_id=%s", config_id)
+        return config_ids
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from infracrawl.db.models import CrawlJob as DBCrawlJob
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _to_dict(job: DBCrawlJob) -> dict:
+    return {
+        "job_id": job.job_id,
+        "config_path": job.config_path,
+        "kind": job.kind,
+        "priority": job.priority,
+        "status": job.status,
+        "worker_id": job.worker_id,
+        "error": job.error,
+        "enqueued_at": job.enqueued_at,
+        "started_at": job.started_at,
+        "heartbeat_at": job.heartbeat_at,
+        "finished_at": job.finished_at,
+    }
+
+
+class CrawlJobsRepository:
+    """Crawl job queue table shared by the API process and crawl workers."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get_session(self) -> Session:
+        return self.session_factory()
+
+    def enqueue(self, config_path: str, kind: str, priority: int) -> Optional[dict]:
+        """Insert a queued job; returns None if the config already has a queued or running job."""
+        with self.get_session() as session:
+            job = DBCrawlJob(
+                config_path=config_path,
+                kind=kind,
+                priority=priority,
+                status="queued",
+                enqueued_at=datetime.utcnow(),
+            )
+            session.add(job)
+            try:
+                session.commit()
+            except IntegrityError:
+                # uq_crawl_jobs_active_config: another job for this config is active
+                session.rollback()
+                return None
+            session.refresh(job)
+            return _to_dict(job)
+
+    def claim_next(self, worker_id: str) -> Optional[dict]:
+        """Atomically take the highest-priority queued job and mark it running.
+
+        `FOR UPDATE SKIP LOCKED` lets any number of workers poll concurrently
+        without blocking each other or claiming the same row.
+        """
+        now = datetime.utcnow()
+        with self.get_session() as session:
+            q = (
+                select(DBCrawlJob)
+                .where(DBCrawlJob.status == "queued")
+                .order_by(DBCrawlJob.priority, DBCrawlJob.job_id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = session.execute(q).scalars().first()
+            if job is None:
+                session.rollback()
+                return None
+            job.status = "running"
+            job.worker_id = worker_id
+            job.started_at = now
+            job.heartbeat_at = now
+            session.commit()
+            return _to_dict(job)
+
+    def heartbeat(self, job_id: int) -> None:
+        with self.get_session() as session:
+            session.execute(
+                update(DBCrawlJob)
+                .where(DBCrawlJob.job_id == job_id, DBCrawlJob.status == "running")
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            session.commit()
+
+    def finish(self, job_id: int, error: Optional[str] = None) -> None:
+        with self.get_session() as session:
+            session.execute(
+                update(DBCrawlJob)
+                .where(DBCrawlJob.job_id == job_id)
+                .values(
+                    status="failed" if error else "done",
+                    error=error,
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            session.commit()
+
+    def requeue_as_recovery(self, job_id: int, priority: int) -> None:
+        """Put a running job back in the queue so another worker resumes it."""
+        with self.get_session() as session:
+            session.execute(
+                update(DBCrawlJob)
+                .where(DBCrawlJob.job_id == job_id)
+                .values(status="queued", kind="recovery", priority=priority, worker_id=None, heartbeat_at=None)
+            )
+            session.commit()
+
+    def requeue_stale(self, lease_seconds: int, priority: int) -> int:
+        """Requeue running jobs whose worker stopped heartbeating (crashed or killed).
+
+        They come back as `recovery` jobs so the next worker resumes the crawl
+        instead of starting over. Returns the number of jobs requeued.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=lease_seconds)
+        with self.get_session() as session:
+            result = session.execute(
+                update(DBCrawlJob)
+                .where(DBCrawlJob.status == "running", DBCrawlJob.heartbeat_at < cutoff)
+                .values(status="queued", kind="recovery", priority=priority, worker_id=None, heartbeat_at=None)
+            )
+            session.commit()
+            return result.rowcount or 0
+
+    def is_active(self, config_path: str) -> bool:
+        with self.get_session() as session:
+            q = select(DBCrawlJob.job_id).where(
+                DBCrawlJob.config_path == config_path,
+                DBCrawlJob.status.in_(ACTIVE_STATUSES),
+            )
+            return session.execute(q.limit(1)).first() is not None
+
+    def list_active(self) -> List[dict]:
+        """Running jobs, then queued jobs in claim order."""
+        with self.get_session() as session:
+            q = (
+                select(DBCrawlJob)
+                .where(DBCrawlJob.status.in_(ACTIVE_STATUSES))
+                .order_by(DBCrawlJob.status.desc(), DBCrawlJob.priority, DBCrawlJob.job_id)
+            )
+            return [_to_dict(j) for j in session.execute(q).scalars().all()]
+
+    def delete_finished(self, older_than_seconds: int) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+        with self.get_session() as session:
+            result = session.execute(
+                delete(DBCrawlJob).where(
+                    DBCrawlJob.status.in_(("done", "failed")),
+                    DBCrawlJob.finished_at < cutoff,
+                )
+            )
+            session.commit()
+            return result.rowcount or 0
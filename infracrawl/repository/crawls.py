@@ -23,7 +23,7 @@ class CrawlsRepository:
             session.refresh(r)
             return r.run_id
 
-    def finish_run(self, run_id: int, exception: Optional[str] = None):
+    def finish_run(self, run_id: int, exception: Optional[str] = None, stop_reason: Optional[str] = None):
         now = datetime.utcnow()
         with self.get_session() as session:
             q = select(DBCrawlRun).where(DBCrawlRun.run_id == run_id)
@@ -32,6 +32,7 @@ class CrawlsRepository:
                 raise ValueError(f"CrawlRun with run_id={run_id} not found")
             r.end_timestamp = now
             r.exception = exception
+            r.stop_reason = stop_reason
             session.add(r)
             session.commit()
 
@@ -48,7 +49,7 @@ class CrawlsRepository:
             cfg = cfg_repo.get_config_by_id(r.config_id)
             if cfg:
                 cfg_path = cfg.config_path
-        return DomainCrawlRun(r.run_id, r.config_id, cfg_path, r.start_timestamp, r.end_timestamp, r.exception)
+        return DomainCrawlRun(r.run_id, r.config_id, cfg_path, r.start_timestamp, r.end_timestamp, r.exception, r.stop_reason)
 
     def list_runs(self, limit: int = 20, offset: int = 0):
         """Return recent runs as domain objects, including config path if available."""
@@ -64,7 +65,7 @@ class CrawlsRepository:
                 cfg = cfg_repo.get_config_by_id(r.config_id)
                 if cfg:
                     cfg_path = cfg.config_path
-            out.append(DomainCrawlRun(r.run_id, r.config_id, cfg_path, r.start_timestamp, r.end_timestamp, r.exception))
+            out.append(DomainCrawlRun(r.run_id, r.config_id, cfg_path, r.start_timestamp, r.end_timestamp, r.exception, r.stop_reason))
         return out
 
     def clear_incomplete_runs(self, config_id: int, within_seconds: Optional[int] = None, message: Optional[str] = None) -> int:
@@ -74,9 +75,8 @@ class CrawlsRepository:
         """
         from datetime import timedelta
 
-        # lazy imports to avoid cycles
+        # lazy import to avoid cycles
         from infracrawl.repository.pages import PagesRepository
-        from infracrawl.repository.links import LinksRepository
 
         now = datetime.utcnow()
         cutoff = None
@@ -102,12 +102,9 @@ class CrawlsRepository:
         if count:
             # best-effort cleanup of pages/links for this config
             pages_repo = PagesRepository(self.session_factory)
-            links_repo = LinksRepository(self.session_factory)
             try:
-                page_ids = pages_repo.get_page_ids_by_config(config_id)
-                if page_ids:
-                    links_repo.delete_links_for_page_ids(page_ids)
-                    pages_repo.delete_pages_by_ids(page_ids)
+                while pages_repo.delete_config_pages_chunk(config_id) != (0, 0):
+                    pass
             except Exception:
                 import logging
 
@@ -115,6 +112,17 @@ class CrawlsRepository:
 
         return count
 
+    def latest_stop_reason(self, config_id: int) -> Optional[str]:
+        """`stop_reason` of the config's most recent run (None if it ran to completion or never ran)."""
+        with self.get_session() as session:
+            q = (
+                select(DBCrawlRun.stop_reason)
+                .where(DBCrawlRun.config_id == config_id)
+                .order_by(DBCrawlRun.run_id.desc())
+                .limit(1)
+            )
+            return session.execute(q).scalars().first()
+
     def has_incomplete_runs(self, config_id: int, within_seconds: Optional[int] = None) -> bool:
         """Check if there are incomplete (still-running) crawl runs for a config.
 
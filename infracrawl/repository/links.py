@@ -1,10 +1,11 @@
-from typing import Optional, List
-from sqlalchemy import select, or_
+from typing import Iterator, Optional, List
+from sqlalchemy import select, or_, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from infracrawl.db.models import Link as DBLink
 from infracrawl.domain import Link
 from infracrawl.db.engine import make_engine
+from infracrawl.repository.config_stats import bump_config_stats
 
 
 class LinksRepository:
@@ -32,25 +33,44 @@ class LinksRepository:
                 anchor_text=db_link.anchor_text
             )
     
-    def insert_links_batch(self, links: List[Link]):
+    def insert_links_batch(self, links: List[Link], config_id: Optional[int] = None) -> List[int]:
         """Insert multiple links in a single transaction.
         
-        Batch operation to reduce N+1 queries.
+        Batch operation to reduce N+1 queries. Links whose (from, to) pair is
+        already stored, e.g. when a page is refetched, are not inserted again;
+        the first anchor text of a pair wins. When `config_id` (the config of
+        the source pages) is given, its `config_stats.links` counter is bumped
+        by the inserted links in the same transaction.
+
+        Returns the `link_to_id` of each inserted link.
         """
         if not links:
-            return
+            return []
         
+        new_links = {}
+        for link in links:
+            new_links.setdefault((link.link_from_id, link.link_to_id), link)
         with self.get_session() as session:
+            existing = session.execute(
+                select(DBLink.link_from_id, DBLink.link_to_id).where(
+                    DBLink.link_from_id.in_(sorted({from_id for from_id, _ in new_links})),
+                    DBLink.link_to_id.in_(sorted({to_id for _, to_id in new_links})),
+                )
+            ).all()
+            for pair in existing:
+                new_links.pop(tuple(pair), None)
             db_links = [
                 DBLink(
                     link_from_id=link.link_from_id,
                     link_to_id=link.link_to_id,
                     anchor_text=link.anchor_text
                 )
-                for link in links
+                for link in new_links.values()
             ]
             session.add_all(db_links)
+            bump_config_stats(session, config_id, links=len(db_links))
             session.commit()
+            return [link.link_to_id for link in db_links]
 
     def fetch_links(self, limit: Optional[int] = None, config_id: Optional[int] = None) -> List[Link]:
         with self.get_session() as session:
@@ -75,45 +95,31 @@ class LinksRepository:
                 anchor_text=row.anchor_text
             ) for row in rows]
 
-    def delete_links_for_page_ids(self, page_ids: List[int]) -> int:
-        """Delete any links referencing any of the provided page IDs. Returns number deleted."""
-        if not page_ids:
-            return 0
+    def count_links_by_config(self, config_id: int) -> int:
+        """Count links discovered from pages belonging to the config."""
+        from infracrawl.db.models import Page as DBPage
         with self.get_session() as session:
-            q = session.query(DBLink).filter(or_(DBLink.link_from_id.in_(page_ids), DBLink.link_to_id.in_(page_ids)))
-            deleted = q.delete(synchronize_session=False)
-            session.commit()
-            return deleted
+            q = (
+                select(func.count(DBLink.link_id))
+                .select_from(DBLink)
+                .join(DBPage, DBLink.link_from_id == DBPage.page_id)
+                .where(DBPage.config_id == config_id)
+            )
+            return int(session.execute(q).scalar() or 0)
 
-    def count_links_for_page_ids(self, page_ids: List[int]) -> int:
-        """Count links that reference any of the provided page IDs."""
-        if not page_ids:
-            return 0
-        with self.get_session() as session:
-            q = select(DBLink).where(or_(DBLink.link_from_id.in_(page_ids), DBLink.link_to_id.in_(page_ids)))
-            count = session.execute(q).scalars().all()
-            return len(count)
-    def get_all_page_ids_referenced_by_pages(self, page_ids: List[int]) -> List[int]:
-        """Get all page IDs that are referenced by the given page IDs (i.e., reachable pages).
-        
-        Returns both the original page_ids plus any page_ids that appear as link targets
-        or sources from those pages.
+    def iter_edge_batches(self, config_id: int, batch_size: int = 100_000) -> Iterator[List[tuple[int, int]]]:
+        """Stream `(link_from_id, link_to_id)` pairs for links discovered from the config's pages.
+
+        Yields lists of up to `batch_size` tuples read through a server-side
+        cursor, so memory stays bounded by one batch regardless of graph size.
         """
-        if not page_ids:
-            return []
-        
+        from infracrawl.db.models import Page as DBPage
+        q = (
+            select(DBLink.link_from_id, DBLink.link_to_id)
+            .join(DBPage, DBLink.link_from_id == DBPage.page_id)
+            .where(DBPage.config_id == config_id)
+            .execution_options(yield_per=batch_size, stream_results=True)
+        )
         with self.get_session() as session:
-            # Find all links where the source is in page_ids
-            q = select(DBLink).where(or_(
-                DBLink.link_from_id.in_(page_ids),
-                DBLink.link_to_id.in_(page_ids)
-            ))
-            links = session.execute(q).scalars().all()
-            
-            # Collect all page IDs that appear in these links
-            referenced_ids = set(page_ids)
-            for link in links:
-                referenced_ids.add(link.link_from_id)
-                referenced_ids.add(link.link_to_id)
-            
-            return list(referenced_ids)
\ No newline at end of file
+            for partition in session.execute(q).partitions():
+                yield [tuple(row) for row in partition]
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from infracrawl.db.models import Page as DBPage
+from infracrawl.db.models import PageScore as DBPageScore
+
+
+class PageScoresRepository:
+    """Stores link-graph scores (degrees, PageRank) per page."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get_session(self) -> Session:
+        return self.session_factory()
+
+    def replace_for_config(
+        self,
+        config_id: int,
+        rows: Iterable[tuple[int, int, int, float]],
+        computed_at: datetime,
+        batch_size: int = 10_000,
+    ) -> int:
+        """Replace all scores of a config with `(page_id, in_degree, out_degree, pagerank)` rows.
+
+        Runs in one transaction, so readers see either the previous or the new
+        scores. Rows are inserted in multi-row batches of `batch_size`.
+        Returns the number of rows written.
+        """
+        written = 0
+        with self.get_session() as session:
+            session.execute(delete(DBPageScore).where(DBPageScore.config_id == config_id))
+            batch: List[dict] = []
+            for page_id, in_degree, out_degree, pagerank in rows:
+                batch.append({
+                    "page_id": int(page_id),
+                    "config_id": config_id,
+                    "in_degree": int(in_degree),
+                    "out_degree": int(out_degree),
+                    "pagerank": float(pagerank),
+                    "computed_at": computed_at,
+                })
+                if len(batch) >= batch_size:
+                    session.execute(insert(DBPageScore), batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                session.execute(insert(DBPageScore), batch)
+                written += len(batch)
+            session.commit()
+        return written
+
+    def top_pages(self, config_id: int, limit: int = 50, order_by: str = "pagerank") -> List[dict]:
+        """Highest scoring pages of a config by `pagerank`, `in_degree` or `out_degree`."""
+        if order_by not in ("pagerank", "in_degree", "out_degree"):
+            raise ValueError(f"cannot order page scores by {order_by!r}")
+        column = getattr(DBPageScore, order_by)
+        q = (
+            select(
+                DBPageScore.page_id,
+                DBPage.page_url,
+                DBPageScore.in_degree,
+                DBPageScore.out_degree,
+                DBPageScore.pagerank,
+                DBPageScore.computed_at,
+            )
+            .join(DBPage, DBPage.page_id == DBPageScore.page_id)
+            .where(DBPageScore.config_id == config_id)
+            .order_by(column.desc(), DBPageScore.page_id)
+            .limit(limit)
+        )
+        with self.get_session() as session:
+            return [row._asdict() for row in session.execute(q)]
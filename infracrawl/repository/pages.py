@@ -1,12 +1,43 @@
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import select, delete
-from sqlalchemy.orm import Session, sessionmaker
+from typing import Callable, Iterable, Iterator, Optional, List, Sequence
+from datetime import datetime, timedelta
+from sqlalchemy import cast, select, delete, func, literal_column, or_, union, update
+from sqlalchemy.orm import Session, aliased, sessionmaker
 from sqlalchemy.exc import IntegrityError
 
-from infracrawl.db.models import Page as DBPage
+from infracrawl.db.models import Link as DBLink, Page as DBPage, PageScore as DBPageScore
 from infracrawl.domain import Page
+from infracrawl.domain.fetch_state import FetchState
 from infracrawl.db.engine import make_engine
+from infracrawl.repository.config_stats import STATE_COUNTERS, bump_config_stats, content_bytes
+from infracrawl.utils.datetime_utils import parse_to_utc_naive
+from infracrawl.utils.url_fingerprint import url_hash
+from infracrawl.utils.simhash import (
+    SIMHASH_BANDS,
+    from_signed64,
+    hamming_distance,
+    simhash_bands,
+    to_signed64,
+)
+
+
+# Columns that can be selected for export, in output order.
+EXPORT_FIELDS = (
+    "page_id",
+    "page_url",
+    "page_content",
+    "plain_text",
+    "filtered_plain_text",
+    "http_status",
+    "fetched_at",
+    "config_id",
+    "content_hash",
+    "discovered_depth",
+)
+
+
+# Text search configuration used by the pages.search_vector trigger.
+SEARCH_CONFIG = "english"
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
 
 
 class PagesRepository:
@@ -31,6 +62,14 @@ class PagesRepository:
 
     def get_session(self) -> Session:
         return self.session_factory()
+
+    @staticmethod
+    def _url_equals(page_url: str):
+        """Match a page by URL via the fixed-width `url_hash` index.
+
+        The `page_url` comparison resolves (astronomically rare) hash collisions.
+        """
+        return (DBPage.url_hash == url_hash(page_url)) & (DBPage.page_url == page_url)
     
     def _to_domain(self, db_page: DBPage, full: bool = True) -> Page:
         """Convert database Page to domain Page."""
@@ -45,8 +84,79 @@ class PagesRepository:
             config_id=db_page.config_id,
             content_hash=db_page.content_hash,
             discovered_depth=db_page.discovered_depth,
+            simhash=from_signed64(db_page.simhash) if db_page.simhash is not None else None,
+            sitemap_lastmod=db_page.sitemap_lastmod,
+            next_visit_at=db_page.next_visit_at,
+            fetch_state=db_page.fetch_state,
+        )
+
+    @staticmethod
+    def _set_simhash(p: DBPage, fingerprint: Optional[int]) -> None:
+        if fingerprint is None:
+            return
+        p.simhash = to_signed64(fingerprint)
+        p.simhash_b0, p.simhash_b1, p.simhash_b2, p.simhash_b3 = simhash_bands(fingerprint)
+
+    @staticmethod
+    def _stats_snapshot(p: DBPage) -> tuple:
+        """(config_id, fetched, failed, bytes, fetch_state) of a row, for config_stats deltas."""
+        fetched = p.fetch_state == FetchState.FETCHED
+        failed = fetched and p.http_status is not None and p.http_status >= 400
+        return p.config_id, fetched, failed, content_bytes(p.page_content), p.fetch_state
+
+    @staticmethod
+    def _state_deltas(old_state: Optional[str], new_state: Optional[str], n: int = 1) -> dict:
+        """Per-state counter deltas for `n` pages moving from `old_state` to `new_state`."""
+        deltas: dict = {}
+        if old_state != new_state:
+            if old_state in STATE_COUNTERS:
+                deltas[STATE_COUNTERS[old_state]] = -n
+            if new_state in STATE_COUNTERS:
+                deltas[STATE_COUNTERS[new_state]] = n
+        return deltas
+
+    def _bump_for_change(self, session: Session, before: Optional[tuple], p: DBPage) -> None:
+        """Apply the config_stats delta between `before` (None for a new row) and `p`."""
+        config_id, fetched, failed, size, state = self._stats_snapshot(p)
+        if before is not None and before[0] != config_id:
+            # Page moved between configs: take it out of the old config's counters.
+            bump_config_stats(
+                session, before[0],
+                pages_discovered=-1, pages_fetched=-int(before[1]),
+                pages_failed=-int(before[2]), bytes_stored=-before[3],
+                **self._state_deltas(before[4], None),
+            )
+            before = None
+        _, was_fetched, was_failed, old_size, old_state = before or (config_id, False, False, 0, None)
+        bump_config_stats(
+            session, config_id,
+            pages_discovered=1 if before is None else 0,
+            pages_fetched=int(fetched) - int(was_fetched),
+            pages_failed=int(failed) - int(was_failed),
+            bytes_stored=size - old_size,
+            last_fetched_at=p.fetched_at if fetched else None,
+            **self._state_deltas(old_state, state),
         )
 
+    def _move_to_state(self, session: Session, where, state: str, from_states: Sequence[str], **values) -> int:
+        """UPDATE the rows matching `where` (and in `from_states`) to `state`; returns how many.
+
+        When skipped or failed pages are involved, the moved rows are counted
+        per (config, old state) first so the config_stats counters follow.
+        """
+        where = where & DBPage.fetch_state.in_(from_states)
+        moved = []
+        if any(s in STATE_COUNTERS for s in (state, *from_states)):
+            moved = session.execute(
+                select(DBPage.config_id, DBPage.fetch_state, func.count(DBPage.page_id))
+                .where(where & (DBPage.fetch_state != state))
+                .group_by(DBPage.config_id, DBPage.fetch_state)
+            ).all()
+        result = session.execute(update(DBPage).where(where).values(fetch_state=state, **values))
+        for config_id, old_state, n in moved:
+            bump_config_stats(session, config_id, **self._state_deltas(old_state, state, n))
+        return result.rowcount or 0
+
     def ensure_page(self, page) -> None:
         """Ensure page exists in database and set page.page_id.
         
@@ -55,7 +165,7 @@ class PagesRepository:
         """
         page_url = page.page_url
         with self.get_session() as session:
-            q = select(DBPage).where(DBPage.page_url == page_url)
+            q = select(DBPage).where(self._url_equals(page_url))
             row = session.execute(q).scalars().first()
             if row:
                 page.page_id = row.page_id
@@ -66,13 +176,14 @@ class PagesRepository:
                 discovered_depth=page.discovered_depth if hasattr(page, 'discovered_depth') else None
             )
             session.add(p)
+            bump_config_stats(session, p.config_id, pages_discovered=1)
             # Handle possible unique constraint races: if another worker inserted
             # the same URL concurrently, catch IntegrityError, rollback and re-query.
             try:
                 session.commit()
             except IntegrityError:
                 session.rollback()
-                q = select(DBPage).where(DBPage.page_url == page_url)
+                q = select(DBPage).where(self._url_equals(page_url))
                 existing = session.execute(q).scalars().first()
                 if existing:
                     page.page_id = existing.page_id
@@ -95,38 +206,144 @@ class PagesRepository:
         logger.info("ensure_pages_batch: urls=%d, discovered_depth=%s, config_id=%s", len(page_urls), discovered_depth, config_id)
         
         with self.get_session() as session:
-            # Find existing pages
-            q = select(DBPage).where(DBPage.page_url.in_(page_urls))
-            existing = session.execute(q).scalars().all()
-            url_to_id = {p.page_url: p.page_id for p in existing}
+            # Find existing pages by hash, then drop any hash-collision rows
+            wanted = set(page_urls)
+            q = select(DBPage.page_id, DBPage.page_url).where(
+                DBPage.url_hash.in_({url_hash(url) for url in wanted})
+            )
+            existing = session.execute(q).all()
+            url_to_id = {row.page_url: row.page_id for row in existing if row.page_url in wanted}
             
             # Insert missing pages
-            missing_urls = set(page_urls) - set(url_to_id.keys())
+            missing_urls = wanted - set(url_to_id.keys())
             if missing_urls:
                 logger.info("Creating %d new pages with discovered_depth=%s, config_id=%s", len(missing_urls), discovered_depth, config_id)
                 new_pages = [DBPage(page_url=url, discovered_depth=discovered_depth, config_id=config_id) for url in missing_urls]
                 session.add_all(new_pages)
-                session.commit()
+                bump_config_stats(session, config_id, pages_discovered=len(new_pages))
+                # The flush's INSERT ... RETURNING fills in page_id; no per-row refresh
+                session.flush()
                 for p in new_pages:
-                    session.refresh(p)
                     url_to_id[p.page_url] = p.page_id
+                session.commit()
             
             return url_to_id
 
+    def add_sitemap_urls(
+        self,
+        entries: Sequence[tuple[str, Optional[datetime]]],
+        config_id: int,
+        discovered_depth: Optional[int] = None,
+    ) -> List[str]:
+        """Add `(url, lastmod)` sitemap entries to the frontier and record their lastmod.
+
+        New URLs become pending pages. Returns the URLs of this config's
+        already-fetched pages whose lastmod is newer than their last fetch,
+        i.e. pages the sitemap says have changed.
+        """
+        if not entries:
+            return []
+        url_to_id = self.ensure_pages_batch([url for url, _ in entries], discovered_depth=discovered_depth, config_id=config_id)
+        lastmods = {url_to_id[url]: lastmod for url, lastmod in entries if lastmod is not None}
+        if not lastmods:
+            return []
+        with self.get_session() as session:
+            session.execute(
+                update(DBPage),
+                [{"page_id": page_id, "sitemap_lastmod": lastmod} for page_id, lastmod in lastmods.items()],
+            )
+            q = select(DBPage.page_url).where(
+                DBPage.page_id.in_(sorted(lastmods)),
+                DBPage.config_id == config_id,
+                DBPage.fetch_state == FetchState.FETCHED,
+                DBPage.fetched_at < DBPage.sitemap_lastmod,
+            )
+            changed = list(session.execute(q).scalars().all())
+            session.commit()
+            return changed
+
+    def add_inlinks(
+        self,
+        page_ids: Iterable[int],
+        score: Optional[Callable[[str, Optional[int], int], float]] = None,
+    ) -> None:
+        """Count one more discovered inlink for each page and refresh frontier priorities.
+
+        `score(url, discovered_depth, inlink_count)` computes the new priority
+        of pages that are still pending; fetched pages only get the count.
+        """
+        page_ids = sorted(set(page_ids))
+        if not page_ids:
+            return
+        with self.get_session() as session:
+            session.execute(
+                update(DBPage)
+                .where(DBPage.page_id.in_(page_ids))
+                .values(inlink_count=DBPage.inlink_count + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if score is not None:
+                pending = session.execute(
+                    select(DBPage.page_id, DBPage.page_url, DBPage.discovered_depth, DBPage.inlink_count)
+                    .where(DBPage.page_id.in_(page_ids) & (DBPage.fetch_state == FetchState.PENDING))
+                ).all()
+                if pending:
+                    session.execute(
+                        update(DBPage),
+                        [
+                            {"page_id": row.page_id, "priority": score(row.page_url, row.discovered_depth, row.inlink_count)}
+                            for row in pending
+                        ],
+                    )
+            session.commit()
+
     def get_page_by_url(self, page_url: str) -> Optional[Page]:
         with self.get_session() as session:
-            q = select(DBPage).where(DBPage.page_url == page_url)
+            q = select(DBPage).where(self._url_equals(page_url))
             p = session.execute(q).scalars().first()
             if not p:
                 return None
             return self._to_domain(p)
 
-    def upsert_page(self, page: Page) -> Page:
+    @staticmethod
+    def _record_revisit(
+        p: DBPage,
+        prev_hash: Optional[str],
+        prev_fetched_at,
+        revisit_interval: Optional[Callable[[int, int, float], float]],
+    ) -> None:
+        """Update a page's change history after a fetch and schedule its next visit.
+
+        `revisit_interval(checks, changes, observed_seconds)` returns the
+        seconds until the page is due again; without it only history is kept.
+        """
+        fetched = parse_to_utc_naive(p.fetched_at)
+        if fetched is None:
+            return
+        prev = parse_to_utc_naive(prev_fetched_at)
+        if prev is not None and fetched > prev:
+            changed = p.content_hash is not None and prev_hash is not None and p.content_hash != prev_hash
+            p.revisit_checks = (p.revisit_checks or 0) + 1
+            p.revisit_changes = (p.revisit_changes or 0) + int(changed)
+            p.revisit_observed_seconds = (p.revisit_observed_seconds or 0.0) + (fetched - prev).total_seconds()
+            if changed:
+                p.last_changed_at = fetched
+        if revisit_interval is not None:
+            seconds = revisit_interval(p.revisit_checks or 0, p.revisit_changes or 0, p.revisit_observed_seconds or 0.0)
+            p.next_visit_at = fetched + timedelta(seconds=seconds)
+
+    def upsert_page(
+        self,
+        page: Page,
+        revisit_interval: Optional[Callable[[int, int, float], float]] = None,
+    ) -> Page:
         """Upsert page using domain object. Accepts Page with page_id (ignored for upsert).
         
         Deduplication: If config_id and content_hash are both present and non-empty,
-        check for an existing page with the same (config_id, content_hash) pair.
-        If found, return the existing page without creating a duplicate.
+        check for an existing page at another URL with the same (config_id,
+        content_hash) pair. If found, return the existing page without creating
+        a duplicate (a pending row for this URL is marked skipped). A refetch of the same URL always updates it, and records
+        whether its content changed (see `_record_revisit`).
         """
         # Check for dedup: if config_id and content_hash both exist, look for existing
         if (page.config_id is not None and 
@@ -134,19 +351,30 @@ class PagesRepository:
             with self.get_session() as session:
                 q = select(DBPage).where(
                     (DBPage.config_id == page.config_id) &
-                    (DBPage.content_hash == page.content_hash)
+                    (DBPage.content_hash == page.content_hash) &
+                    ~self._url_equals(page.page_url)
                 )
                 existing = session.execute(q).scalars().first()
                 if existing:
-                    # Return the existing page without modifying or creating a new one
+                    # Return the existing page without modifying or creating a new one;
+                    # this URL's own row (if pending) leaves the frontier
+                    self._move_to_state(
+                        session, self._url_equals(page.page_url), FetchState.SKIPPED, FetchState.UNFETCHED,
+                        skip_reason="duplicate",
+                    )
+                    session.commit()
                     return self._to_domain(existing)
         
         with self.get_session() as session:
-            q = select(DBPage).where(DBPage.page_url == page.page_url)
+            q = select(DBPage).where(self._url_equals(page.page_url))
             p = session.execute(q).scalars().first()
             if p:
                 # TODO: No optimistic locking - concurrent updates will overwrite
                 # CLAUDE: Add version column if this becomes issue. Unlikely with current single-crawler design.
+                before = self._stats_snapshot(p)
+                prev_hash, prev_fetched_at = p.content_hash, p.fetched_at
+                p.fetch_state = FetchState.FETCHED
+                p.skip_reason = None
                 p.page_content = self._sanitize_text(page.page_content)
                 p.plain_text = self._sanitize_text(page.plain_text)
                 p.filtered_plain_text = self._sanitize_text(page.filtered_plain_text)
@@ -166,7 +394,10 @@ class PagesRepository:
                 # Update content_hash if provided
                 if getattr(page, 'content_hash', None) is not None:
                     p.content_hash = page.content_hash
+                self._set_simhash(p, getattr(page, 'simhash', None))
+                self._record_revisit(p, prev_hash, prev_fetched_at, revisit_interval)
                 session.add(p)
+                self._bump_for_change(session, before, p)
                 session.commit()
                 session.refresh(p)
                 return self._to_domain(p)
@@ -189,12 +420,61 @@ class PagesRepository:
                 fetched_at=fetched_at_val,
                 config_id=page.config_id,
                 content_hash=getattr(page, 'content_hash', None),
+                fetch_state=FetchState.FETCHED,
             )
+            self._set_simhash(p, getattr(page, 'simhash', None))
+            self._record_revisit(p, None, None, revisit_interval)
             session.add(p)
+            self._bump_for_change(session, None, p)
             session.commit()
             session.refresh(p)
             return self._to_domain(p)
 
+    def find_near_duplicate(
+        self,
+        config_id: int,
+        fingerprint: int,
+        max_distance: int = 3,
+        exclude_url: Optional[str] = None,
+    ) -> Optional[Page]:
+        """Return the closest fetched page of the config within `max_distance` bits of `fingerprint`.
+
+        Candidates are pages sharing at least one indexed 16-bit SimHash band,
+        which is guaranteed to include every match when
+        `max_distance < SIMHASH_BANDS`. Postgres (14+) checks the Hamming
+        distance in SQL and returns only the closest candidate, so a band
+        shared by many pages cannot crowd out the match; other dialects scan
+        all candidates in Python.
+        """
+        if max_distance >= SIMHASH_BANDS:
+            raise ValueError(f"max_distance must be < {SIMHASH_BANDS} for band lookup")
+        b0, b1, b2, b3 = simhash_bands(fingerprint)
+        q = select(DBPage.page_id, DBPage.simhash).where(
+            (DBPage.config_id == config_id)
+            & or_(
+                DBPage.simhash_b0 == b0,
+                DBPage.simhash_b1 == b1,
+                DBPage.simhash_b2 == b2,
+                DBPage.simhash_b3 == b3,
+            )
+        )
+        if exclude_url is not None:
+            q = q.where(~self._url_equals(exclude_url))
+        with self.get_session() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                from sqlalchemy.dialects.postgresql import BIT
+
+                distance = func.bit_count(cast(DBPage.simhash.op("#")(to_signed64(fingerprint)), BIT(64)))
+                q = q.where(distance <= max_distance).order_by(distance, DBPage.page_id).limit(1)
+            best = None
+            for row in session.execute(q.execution_options(yield_per=1000)):
+                d = hamming_distance(from_signed64(row.simhash), fingerprint)
+                if d <= max_distance and (best is None or d < best[0]):
+                    best = (d, row.page_id)
+            if best is None:
+                return None
+            return self._to_domain(session.get(DBPage, best[1]), full=False)
+
     def fetch_pages(self, full: bool = False, limit: Optional[int] = None, offset: Optional[int] = None, config_id: Optional[int] = None) -> List[Page]:
         with self.get_session() as session:
             q = select(DBPage)
@@ -208,6 +488,105 @@ class PagesRepository:
             rows = session.execute(q).scalars().all()
             return [self._to_domain(row, full=full) for row in rows]
 
+    def iter_pages(
+        self,
+        *,
+        config_id: Optional[int] = None,
+        after_page_id: Optional[int] = None,
+        max_page_id: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict]:
+        """Stream pages as dicts in page_id order from a server-side cursor.
+
+        Rows are fetched `batch_size` at a time (`yield_per` + `stream_results`),
+        so memory stays flat regardless of how many pages match. Only the
+        requested `fields` (see EXPORT_FIELDS) are selected; `page_id` is always
+        included so callers can resume with `after_page_id` (keyset pagination).
+        `max_page_id` (inclusive) bounds the range, e.g. for sharded exports.
+        """
+        fields = list(fields) if fields else list(EXPORT_FIELDS)
+        unknown = [f for f in fields if f not in EXPORT_FIELDS]
+        if unknown:
+            raise ValueError(f"unknown export fields: {', '.join(unknown)}")
+        if "page_id" not in fields:
+            fields.insert(0, "page_id")
+
+        q = select(*(getattr(DBPage, f) for f in fields))
+        if config_id is not None:
+            q = q.where(DBPage.config_id == config_id)
+        if after_page_id is not None:
+            q = q.where(DBPage.page_id > after_page_id)
+        if max_page_id is not None:
+            q = q.where(DBPage.page_id <= max_page_id)
+        q = q.order_by(DBPage.page_id)
+        if limit:
+            q = q.limit(limit)
+        q = q.execution_options(yield_per=batch_size, stream_results=True)
+
+        with self.get_session() as session:
+            for row in session.execute(q):
+                yield row._asdict()
+
+    def get_page_id_range(self, config_id: Optional[int] = None) -> Optional[tuple[int, int]]:
+        """Return (min page_id, max page_id) for the config (or all pages), or None if empty."""
+        with self.get_session() as session:
+            q = select(func.min(DBPage.page_id), func.max(DBPage.page_id))
+            if config_id is not None:
+                q = q.where(DBPage.config_id == config_id)
+            lo, hi = session.execute(q).one()
+            return None if lo is None else (int(lo), int(hi))
+
+    def search_pages(
+        self,
+        query: str,
+        *,
+        config_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[dict]:
+        """Full-text search over filtered_plain_text (Postgres only).
+
+        Matches `websearch_to_tsquery` syntax (quoted phrases, `or`, `-term`)
+        against the GIN-indexed `search_vector` column, ranked by `ts_rank_cd`.
+        Snippets (`ts_headline`, matches wrapped in <mark>) are computed only
+        for the returned page of results, not for every match.
+        """
+        tsq = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+        search_vector = literal_column("pages.search_vector")
+        rank = func.ts_rank_cd(search_vector, tsq).label("rank")
+        hits = (
+            select(DBPage.page_id, rank)
+            .where(search_vector.op("@@")(tsq))
+        )
+        if config_id is not None:
+            hits = hits.where(DBPage.config_id == config_id)
+        hits = hits.order_by(rank.desc(), DBPage.page_id).limit(limit).offset(offset).subquery()
+
+        q = (
+            select(
+                DBPage.page_id,
+                DBPage.page_url,
+                DBPage.config_id,
+                DBPage.fetched_at,
+                hits.c.rank,
+                func.ts_headline(
+                    literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+                    DBPage.filtered_plain_text,
+                    tsq,
+                    _HEADLINE_OPTIONS,
+                ).label("snippet"),
+            )
+            .join(hits, hits.c.page_id == DBPage.page_id)
+            .order_by(hits.c.rank.desc(), DBPage.page_id)
+        )
+        with self.get_session() as session:
+            return [
+                {**row._asdict(), "rank": float(row.rank)}
+                for row in session.execute(q)
+            ]
+
     def get_page_by_id(self, page_id: int) -> Optional[Page]:
         with self.get_session() as session:
             q = select(DBPage).where(DBPage.page_id == page_id)
@@ -216,25 +595,19 @@ class PagesRepository:
                 return None
             return self._to_domain(p)
 
-    def get_page_ids_by_config(self, config_id: int) -> List[int]:
-        with self.get_session() as session:
-            q = select(DBPage.page_id).where(DBPage.config_id == config_id)
-            rows = session.execute(q).scalars().all()
-            return rows
-
     def get_fetched_page_ids_by_config(self, config_id: int) -> List[int]:
-        """Get page IDs for a config that have been fetched (have content).
+        """Get page IDs for a config that have been fetched.
         
         Args:
             config_id: The crawler config ID
             
         Returns:
-            List of page IDs that have page_content (not NULL)
+            List of page IDs in the fetched state
         """
         with self.get_session() as session:
             q = select(DBPage.page_id).where(
                 (DBPage.config_id == config_id) &
-                (DBPage.page_content.is_not(None))
+                (DBPage.fetch_state == FetchState.FETCHED)
             )
             rows = session.execute(q).scalars().all()
             return rows
@@ -242,13 +615,13 @@ class PagesRepository:
     def get_recent_fetched_urls_by_config(self, config_id: int, limit: int = 10) -> List[str]:
         """Return the most recent fetched page URLs for a given config.
 
-        Only includes pages with non-null content (actually crawled). Ordered by
+        Only includes pages in the fetched state (actually crawled). Ordered by
         fetched_at descending, then by page_id descending as a stable tie-breaker.
         """
         with self.get_session() as session:
             q = select(DBPage.page_url).where(
                 (DBPage.config_id == config_id) &
-                (DBPage.page_content.is_not(None))
+                (DBPage.fetch_state == FetchState.FETCHED)
             ).order_by(DBPage.fetched_at.desc(), DBPage.page_id.desc()).limit(limit)
             rows = session.execute(q).scalars().all()
             return list(rows)
@@ -256,39 +629,160 @@ class PagesRepository:
     def get_visited_urls_by_config(self, config_id: int) -> List[str]:
         """Get all page URLs that have been visited for a given config.
         
-        Only returns pages that have content (were actually fetched), not pages
-        that were only discovered but never crawled.
+        Only returns pages that were actually fetched, not pages that were only
+        discovered, skipped or failed.
         
         Args:
             config_id: The crawler config ID
             
         Returns:
-            List of page URLs that have been crawled (have content)
+            List of page URLs that have been crawled
         """
         with self.get_session() as session:
             q = select(DBPage.page_url).where(
                 DBPage.config_id == config_id,
-                DBPage.page_content.isnot(None)
+                DBPage.fetch_state == FetchState.FETCHED
             )
             rows = session.execute(q).scalars().all()
             return list(rows)
     
+    def is_url_fetched(self, config_id: int, page_url: str) -> bool:
+        """Return True if `page_url` was already fetched for the config.
+
+        Point lookup on the page URL; used by resumed crawls instead of
+        preloading every visited URL into memory.
+        """
+        with self.get_session() as session:
+            q = select(DBPage.page_id).where(
+                self._url_equals(page_url) &
+                (DBPage.config_id == config_id) &
+                (DBPage.fetch_state == FetchState.FETCHED)
+            ).limit(1)
+            return session.execute(q).scalars().first() is not None
+
+    def count_fetched_pages_by_config(self, config_id: int) -> int:
+        """Count pages for a config that have been fetched."""
+        with self.get_session() as session:
+            q = select(func.count(DBPage.page_id)).where(
+                (DBPage.config_id == config_id) &
+                (DBPage.fetch_state == FetchState.FETCHED)
+            )
+            return int(session.execute(q).scalar() or 0)
+
+    def get_config_stats(self, config_id: int) -> dict:
+        """Aggregate page and link statistics for a config in one query.
+
+        Pages are grouped in SQL by (discovered_depth, HTTP status class,
+        fetch_state) and the link count is a scalar subquery, so only a handful of
+        aggregate rows cross the wire regardless of crawl size.
+
+        Returns a dict with `pages` (fetched), `pending` (pending or in
+        flight), `skipped`, `total_pages`, `links`, `by_depth` ({depth:
+        {"fetched", "pending"}}), `by_status_class` ({"2xx": n, ...}, fetched
+        pages only) and `by_state` ({fetch_state: n}).
+        """
+        src = aliased(DBPage)
+        links_count = (
+            select(func.count(DBLink.link_id))
+            .join(src, DBLink.link_from_id == src.page_id)
+            .where(src.config_id == config_id)
+            .scalar_subquery()
+        )
+        status_class = (DBPage.http_status // 100).label("status_class")
+        q = (
+            select(
+                DBPage.discovered_depth,
+                status_class,
+                DBPage.fetch_state,
+                func.count(DBPage.page_id).label("n"),
+                links_count.label("links"),
+            )
+            .where(DBPage.config_id == config_id)
+            .group_by(DBPage.discovered_depth, status_class, DBPage.fetch_state)
+        )
+        with self.get_session() as session:
+            rows = session.execute(q).all()
+
+        stats = {
+            "pages": 0, "pending": 0, "skipped": 0, "total_pages": 0, "links": 0,
+            "by_depth": {}, "by_status_class": {}, "by_state": {},
+        }
+        for row in rows:
+            n = int(row.n)
+            stats["links"] = int(row.links or 0)
+            stats["total_pages"] += n
+            stats["by_state"][row.fetch_state] = stats["by_state"].get(row.fetch_state, 0) + n
+            depth_key = str(row.discovered_depth) if row.discovered_depth is not None else "unknown"
+            depth = stats["by_depth"].setdefault(depth_key, {"fetched": 0, "pending": 0})
+            if row.fetch_state == FetchState.FETCHED:
+                stats["pages"] += n
+                depth["fetched"] += n
+                cls = f"{int(row.status_class)}xx" if row.status_class is not None else "unknown"
+                stats["by_status_class"][cls] = stats["by_status_class"].get(cls, 0) + n
+            elif row.fetch_state == FetchState.SKIPPED:
+                stats["skipped"] += n
+            elif row.fetch_state in FetchState.UNFETCHED:
+                stats["pending"] += n
+                depth["pending"] += n
+        return stats
+
+    def set_fetch_state(self, page_url: str, state: str, from_states: Sequence[str] = FetchState.UNFETCHED) -> bool:
+        """Move a page to `state` if it is currently in one of `from_states`.
+
+        Returns whether the page changed state; a fetched page is never
+        moved back by a late in-flight or failure update.
+        """
+        if state not in FetchState.ALL:
+            raise ValueError(f"unknown fetch state: {state!r}")
+        with self.get_session() as session:
+            changed = self._move_to_state(session, self._url_equals(page_url), state, tuple(from_states))
+            session.commit()
+            return bool(changed)
+
+    def mark_skipped(self, page_url: str, reason: str) -> None:
+        """Take a never-fetched page out of the frontier (e.g. blocked by robots.txt).
+
+        Skipped pages are not returned as pending or unvisited, so a crawl and
+        its recoveries stop picking them up. Fetched pages are left alone.
+        """
+        with self.get_session() as session:
+            self._move_to_state(
+                session, self._url_equals(page_url), FetchState.SKIPPED,
+                FetchState.UNFETCHED + (FetchState.FAILED,), skip_reason=reason,
+            )
+            session.commit()
+
+    def requeue_unfetched(self, config_id: int, states: Sequence[str] = (FetchState.FAILED, FetchState.SKIPPED)) -> int:
+        """Put a config's pages in `states` back in the frontier; returns how many.
+
+        A fresh crawl requeues failed and skipped pages, so they are checked
+        against the current robots.txt and config and retried; a resumed
+        crawl requeues pages left in flight by the interrupted one.
+        """
+        with self.get_session() as session:
+            requeued = self._move_to_state(
+                session, DBPage.config_id == config_id, FetchState.PENDING, tuple(states), skip_reason=None,
+            )
+            session.commit()
+            return requeued
+
     def get_unvisited_urls_by_config(self, config_id: int, limit: Optional[int] = None) -> List[str]:
-        """Get all page URLs that exist but have no content (unvisited) for a config.
+        """Get all page URLs that exist but are unfetched (unvisited) for a config.
         
-        These are pages that were discovered (inserted into DB) but not yet fetched.
-        Useful for resuming crawls that were interrupted mid-discovery.
+        These are pages that were discovered (inserted into DB) but not yet
+        fetched, or left in flight by an interrupted crawl. Useful for
+        resuming crawls that were interrupted mid-discovery.
         
         Args:
             config_id: The crawler config ID
             
         Returns:
-            List of page URLs with no page_content
+            List of pending or in-flight page URLs
         """
         with self.get_session() as session:
             q = select(DBPage.page_url).where(
                 (DBPage.config_id == config_id) &
-                (DBPage.page_content.is_(None))
+                (DBPage.fetch_state.in_(FetchState.UNFETCHED))
             )
             if limit is not None:
                 q = q.limit(limit)
@@ -296,11 +790,11 @@ class PagesRepository:
             return list(rows)
 
     def has_unvisited_urls_by_config(self, config_id: int) -> bool:
-        """Fast check for any unvisited pages for the given config."""
+        """Fast check for any pending or in-flight pages for the given config."""
         with self.get_session() as session:
             q = select(DBPage.page_id).where(
                 (DBPage.config_id == config_id) &
-                (DBPage.page_content.is_(None))
+                (DBPage.fetch_state.in_(FetchState.UNFETCHED))
             ).limit(1)
             row = session.execute(q).scalars().first()
             return row is not None
@@ -309,7 +803,9 @@ class PagesRepository:
         """Get page URLs at a specific depth that haven't been fetched yet.
         
         Used for iterative depth-based crawling: fetch all pages at depth N,
-        then all at depth N+1, etc.
+        then all at depth N+1, etc. Within a depth, pages come highest
+        `priority` first (unscored pages last), so a crawl that is cut short
+        has fetched the best-linked pages.
         
         Args:
             config_id: The crawler config ID
@@ -317,32 +813,86 @@ class PagesRepository:
             limit: Maximum pages to return
             
         Returns:
-            List of page URLs at the given depth with no page_content
+            List of pending page URLs at the given depth
         """
         with self.get_session() as session:
             q = select(DBPage.page_url).where(
                 (DBPage.config_id == config_id) &
                 (DBPage.discovered_depth == discovered_depth) &
-                (DBPage.page_content.is_(None))
-            ).limit(limit)
+                (DBPage.fetch_state == FetchState.PENDING)
+            ).order_by(DBPage.priority.desc().nulls_last(), DBPage.page_id).limit(limit)
             rows = session.execute(q).scalars().all()
             return list(rows)
 
-    def delete_pages_by_ids(self, page_ids: List[int]) -> int:
-        """Delete pages by their IDs.
-        
-        Args:
-            page_ids: List of page IDs to delete
-            
-        Returns:
-            Number of pages deleted
+    def get_due_urls(
+        self,
+        config_id: int,
+        now: datetime,
+        max_depth: Optional[int] = None,
+        limit: int = 1000,
+    ) -> List[tuple[str, int]]:
+        """Get fetched non-root pages whose adaptive revisit time has come.
+
+        Returns `(page_url, discovered_depth)` pairs, most overdue first, at
+        depths 1..max_depth. Pages without a `next_visit_at` (no revisit
+        policy when they were fetched) are never returned; roots are refetched
+        by the crawl's depth-0 phase instead.
         """
-        if not page_ids:
-            return 0
-            
         with self.get_session() as session:
-            stmt = delete(DBPage).where(DBPage.page_id.in_(page_ids))
-            result = session.execute(stmt)
-            session.commit()
-            return result.rowcount
+            q = select(DBPage.page_url, DBPage.discovered_depth).where(
+                (DBPage.config_id == config_id) &
+                (DBPage.fetch_state == FetchState.FETCHED) &
+                (DBPage.next_visit_at <= now) &
+                (DBPage.discovered_depth >= 1)
+            )
+            if max_depth is not None:
+                q = q.where(DBPage.discovered_depth <= max_depth)
+            q = q.order_by(DBPage.next_visit_at, DBPage.page_id).limit(limit)
+            return [(url, depth) for url, depth in session.execute(q).all()]
+
+    def count_pages_by_config(self, config_id: int) -> int:
+        """Count all pages (fetched or not) belonging to the config."""
+        with self.get_session() as session:
+            q = select(func.count(DBPage.page_id)).where(DBPage.config_id == config_id)
+            return int(session.execute(q).scalar() or 0)
+
+    def delete_config_pages_chunk(self, config_id: int, chunk_size: int = 1000) -> tuple[int, int]:
+        """Delete up to `chunk_size` of the config's pages and their links in one transaction.
+
+        Pages without a config that are linked to/from the chunk (discovered
+        via this config before pages carried config_id) go with it; pages of
+        other configs are never touched. Links and pages are deleted together,
+        so stopping between chunks never leaves dangling links.
+
+        Returns (pages_deleted, links_deleted); (0, 0) once the config is empty.
+        """
+        with self.get_session() as session:
+            chunk_ids = session.execute(
+                select(DBPage.page_id)
+                .where(DBPage.config_id == config_id)
+                .order_by(DBPage.page_id)
+                .limit(chunk_size)
+            ).scalars().all()
+            if not chunk_ids:
+                return 0, 0
 
+            neighbours = union(
+                select(DBLink.link_to_id.label("page_id")).where(DBLink.link_from_id.in_(chunk_ids)),
+                select(DBLink.link_from_id.label("page_id")).where(DBLink.link_to_id.in_(chunk_ids)),
+            ).subquery()
+            orphan_ids = session.execute(
+                select(DBPage.page_id)
+                .where(DBPage.page_id.in_(select(neighbours.c.page_id)))
+                .where(DBPage.config_id.is_(None))
+            ).scalars().all()
+            page_ids = list(chunk_ids) + list(orphan_ids)
+
+            links_deleted = session.execute(
+                delete(DBLink).where(or_(DBLink.link_from_id.in_(page_ids), DBLink.link_to_id.in_(page_ids)))
+            ).rowcount
+            session.execute(delete(DBPageScore).where(DBPageScore.page_id.in_(page_ids)))
+            pages_deleted = session.execute(
+                delete(DBPage).where(DBPage.page_id.in_(page_ids))
+            ).rowcount
+            session.commit()
+            return int(pages_deleted or 0), int(links_deleted or 0)
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from infracrawl.db.models import RobotsTxt as DBRobotsTxt
+
+
+def _to_dict(row: DBRobotsTxt) -> dict:
+    return {
+        "base_url": row.base_url,
+        "status_code": row.status_code,
+        "body": row.body,
+        "etag": row.etag,
+        "last_modified": row.last_modified,
+        "fetched_at": row.fetched_at,
+        "expires_at": row.expires_at,
+    }
+
+
+class RobotsTxtRepository:
+    """Persistent robots.txt cache shared by the API process and crawl workers."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def get_session(self) -> Session:
+        return self.session_factory()
+
+    def get(self, base_url: str) -> Optional[dict]:
+        with self.get_session() as session:
+            row = session.get(DBRobotsTxt, base_url)
+            return _to_dict(row) if row is not None else None
+
+    def save(
+        self,
+        base_url: str,
+        status_code: int,
+        body: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fetched_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        """Insert or replace the copy for `base_url`."""
+        values = {
+            "status_code": status_code,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+            "expires_at": expires_at,
+        }
+        with self.get_session() as session:
+            row = session.get(DBRobotsTxt, base_url)
+            if row is None:
+                session.add(DBRobotsTxt(base_url=base_url, **values))
+            else:
+                for key, value in values.items():
+                    setattr(row, key, value)
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another process stored it first; its copy is just as fresh
+                session.rollback()
+
+    def extend(self, base_url: str, fetched_at: datetime, expires_at: datetime) -> None:
+        """Mark the stored copy as revalidated (HTTP 304) until `expires_at`."""
+        with self.get_session() as session:
+            session.execute(
+                update(DBRobotsTxt)
+                .where(DBRobotsTxt.base_url == base_url)
+                .values(fetched_at=fetched_at, expires_at=expires_at)
+            )
+            session.commit()
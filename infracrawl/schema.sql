@@ -14,7 +14,7 @@ CREATE TABLE IF NOT EXISTS links (
   anchor_text TEXT
 );
 
-CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (page_url);
+-- URL lookups use pages.url_hash (see migrations/20260118_add_url_hash_to_pages.sql)
 CREATE INDEX IF NOT EXISTS idx_links_from ON links (link_from_id);
 
 -- Table for crawler configurations loaded from YAML files
@@ -38,7 +38,7 @@ CREATE TABLE IF NOT EXISTS migrations (
 
 -- Ensure pages table has config_id column for association
 ALTER TABLE pages ADD COLUMN IF NOT EXISTS config_id INTEGER;
-CREATE INDEX IF NOT EXISTS idx_pages_config ON pages (config_id);
+-- Config-scoped indexes: see migrations/20260119_add_config_scoped_indexes.sql
 
 -- Add robots flag to crawler configs (default true)
 ALTER TABLE crawler_configs ADD COLUMN IF NOT EXISTS robots BOOLEAN DEFAULT true;
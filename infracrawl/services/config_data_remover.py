@@ -0,0 +1,129 @@
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RemovalJob:
+    id: str
+    config_path: str
+    config_id: int
+    status: str  # pending | running | completed | cancelled | failed
+    created_at: datetime
+    total_pages: Optional[int] = None
+    deleted_pages: int = 0
+    deleted_links: int = 0
+    chunks: int = 0
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> dict:
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "cancel_event"}
+        d["job_id"] = d.pop("id")
+        return d
+
+
+class ConfigDataRemover:
+    """Removes a config's pages and links in chunked background jobs.
+
+    Each chunk is one transaction (`PagesRepository.delete_config_pages_chunk`),
+    so progress is visible while a large config is being removed and a
+    cancellation takes effect at the next chunk boundary with the data left
+    consistent. Only one job per config runs at a time.
+    """
+
+    _FINISHED = ("completed", "cancelled", "failed")
+
+    def __init__(self, pages_repo, config_stats_repo=None, *, chunk_size: int = 1000, max_jobs: int = 100):
+        self.pages_repo = pages_repo
+        self.config_stats_repo = config_stats_repo
+        self.chunk_size = int(chunk_size)
+        self.max_jobs = int(max_jobs)
+        self._jobs: Dict[str, RemovalJob] = {}
+        self._lock = threading.Lock()
+
+    def create_job(self, config_id: int, config_path: str) -> dict:
+        """Register a removal job for the config, or return the one already in progress."""
+        with self._lock:
+            for job in self._jobs.values():
+                if job.config_id == config_id and job.status not in self._FINISHED:
+                    return job.to_dict()
+            job = RemovalJob(
+                id=str(uuid.uuid4()),
+                config_path=config_path,
+                config_id=config_id,
+                status="pending",
+                created_at=datetime.now(timezone.utc),
+            )
+            self._jobs[job.id] = job
+            self._evict_finished()
+            return job.to_dict()
+
+    def _evict_finished(self) -> None:
+        finished = [j for j in self._jobs.values() if j.status in self._FINISHED]
+        excess = len(self._jobs) - self.max_jobs
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(excess, 0)]:
+            self._jobs.pop(job.id, None)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def list_jobs(self) -> List[dict]:
+        with self._lock:
+            return [j.to_dict() for j in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation. Returns False if the job is unknown or already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in self._FINISHED:
+                return False
+            job.cancel_event.set()
+            return True
+
+    def run(self, job_id: str) -> None:
+        """Execute a registered job until the config is empty, cancelled or an error occurs."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != "pending":
+                return
+            job.status = "running"
+        try:
+            job.total_pages = self.pages_repo.count_pages_by_config(job.config_id)
+            while not job.cancel_event.is_set():
+                pages, links = self.pages_repo.delete_config_pages_chunk(job.config_id, self.chunk_size)
+                if pages == 0:
+                    break
+                with self._lock:
+                    job.deleted_pages += pages
+                    job.deleted_links += links
+                    job.chunks += 1
+            status = "cancelled" if job.cancel_event.is_set() else "completed"
+            error = None
+        except Exception:
+            # Details go to the log only; the job record is served over the API.
+            logger.exception("Removal job %s for config %s failed", job_id, job.config_path)
+            status, error = "failed", "error removing data"
+
+        if self.config_stats_repo is not None:
+            try:
+                self.config_stats_repo.reconcile(job.config_id)
+            except Exception:
+                logger.exception("Failed to reconcile config stats after removal of %s", job.config_path)
+
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.finished_at = datetime.now(timezone.utc)
+        logger.info(
+            "Removal job %s for %s %s: %d pages, %d links",
+            job_id, job.config_path, status, job.deleted_pages, job.deleted_links,
+        )
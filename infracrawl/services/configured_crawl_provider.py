@@ -6,13 +6,18 @@ from datetime import datetime
 from typing import Callable, Optional
 
 from infracrawl.domain.crawl_session import CrawlSession
+from infracrawl.domain.fetch_state import FetchState
 from infracrawl.domain.http_response import HttpResponse
 from infracrawl.domain.page import Page
-from infracrawl.exceptions import HttpFetchError
+from infracrawl.exceptions import HttpFetchError, ResponseTooLargeError
 from infracrawl.services.fetcher import Fetcher
+from infracrawl.services.revisit_policy import RevisitPolicy
+from infracrawl.utils.simhash import SIMHASH_BANDS
 
 logger = logging.getLogger(__name__)
 
+ROBOTS_BLOCKED = "blocked by robots.txt"
+
 
 class ConfiguredCrawlProvider:
     """Per-crawl coordinator that owns state, fetching, and traversal logic.
@@ -36,6 +41,32 @@ class ConfiguredCrawlProvider:
         self.link_processor = link_processor
         self.fetch_persist_service = fetch_persist_service
 
+    def _near_duplicate_kwargs(self) -> dict:
+        """Options for `extract_and_persist` from the config's `near_duplicate` section.
+
+            near_duplicate:
+              max_distance: 3   # Hamming distance in bits, clamped to 0-3
+              skip: true        # don't store bodies of near-duplicates
+              follow_links: false  # don't extract their outlinks (default: follow)
+        """
+        options = getattr(self.context.config, "near_duplicate_options", None)
+        if not options or not options.get("enabled", True):
+            return {}
+        return {
+            "near_duplicate_distance": min(max(int(options.get("max_distance", 3)), 0), SIMHASH_BANDS - 1),
+            "store_near_duplicates": not bool(options.get("skip", False)),
+        }
+
+    def _follows_near_duplicate_links(self) -> bool:
+        """Whether outlinks of near-duplicates are followed (`near_duplicate.follow_links`)."""
+        options = getattr(self.context.config, "near_duplicate_options", None) or {}
+        return bool(options.get("follow_links", True))
+
+    def _revisit_kwargs(self) -> dict:
+        """`revisit_interval` for `extract_and_persist` when the config has a `revisit` section."""
+        policy = RevisitPolicy.for_config(self.context.config)
+        return {"revisit_interval": policy.interval} if policy.enabled else {}
+
     def fetch_and_persist(self, page: Page) -> bool:
         """Fetch a URL, persist the page, and mutate page in-place.
         
@@ -52,15 +83,26 @@ class ConfiguredCrawlProvider:
                 raise ValueError("context.config is required")
             
             response: HttpResponse = self.fetcher.fetch(url, stop_event=self.context.stop_event)
+        except ResponseTooLargeError as e:
+            # Refetching would hit the same limit; leave the frontier until the next fresh crawl
+            logger.info("Skipping %s: %s", url, e.original)
+            self.pages_repo.mark_skipped(url, "too_large")
+            return False
         except HttpFetchError as e:
             logger.warning("Fetch failed for %s: %s", url, e)
+            self.pages_repo.set_fetch_state(url, FetchState.FAILED)
             return False
         except Exception as e:
             logger.error("Fetch error for %s: %s", url, e, exc_info=True)
+            self.pages_repo.set_fetch_state(url, FetchState.FAILED)
             return False
 
-        # Skip unsupported content types
+        # Every fetched body counts against the byte budget, stored or not
+        self.context.add_bytes_fetched(len((response.text or "").encode("utf-8")))
+
+        # Skip unsupported content types; they would be refetched on every crawl
         if not self.fetch_persist_service.should_persist(response, url):
+            self.pages_repo.mark_skipped(url, "content_type")
             return False
 
         # Mutate page with fetch results
@@ -70,9 +112,12 @@ class ConfiguredCrawlProvider:
         page.config_id = self.context.config.config_id
 
         # Extract text and persist (mutates page with plain_text, filtered_plain_text, content_hash, page_id)
-        success = self.fetch_persist_service.extract_and_persist(page)
+        success = self.fetch_persist_service.extract_and_persist(
+            page, **self._near_duplicate_kwargs(), **self._revisit_kwargs()
+        )
         if not success:
             logger.error("Failed to extract and persist %s", url)
+            self.pages_repo.set_fetch_state(url, FetchState.FAILED)
             return False
 
         logger.info(
@@ -134,7 +179,7 @@ class ConfiguredCrawlProvider:
             return False, "max depth reached"
         
         if self.crawl_policy.should_skip_due_to_robots(url, self.context):
-            return False, "blocked by robots.txt"
+            return False, ROBOTS_BLOCKED
         
         if self.crawl_policy.should_skip_due_to_refresh(url, self.context):
             return False, "refresh policy"
@@ -159,9 +204,12 @@ class ConfiguredCrawlProvider:
             logger.info("Fetch cancelled for %s", url)
             return False
         
-        # Fetch and persist
+        # Fetch and persist; the page is in flight until fetch_and_persist settles it
+        self.pages_repo.set_fetch_state(url, FetchState.IN_FLIGHT, from_states=(FetchState.PENDING,))
         success = self.fetch_and_persist(page)
         if not success:
+            # Not fetched, failed or skipped (e.g. cancelled): back to the frontier
+            self.pages_repo.set_fetch_state(url, FetchState.PENDING, from_states=(FetchState.IN_FLIGHT,))
             return False
         
         self.context.increment_pages_crawled(1)
@@ -192,6 +240,9 @@ class ConfiguredCrawlProvider:
         should_fetch, reason = self._should_fetch_page(page, depth)
         if not should_fetch:
             logger.debug("Skipping (%s) %s", reason, url)
+            if reason == ROBOTS_BLOCKED:
+                # Out of the frontier, or recovery would keep resuming for it
+                self.pages_repo.mark_skipped(url, "robots")
             return False
         
         self.context.mark_visited(page)
@@ -200,6 +251,12 @@ class ConfiguredCrawlProvider:
         if not self.fetch_page(page):
             return False
         
+        # Their outlinks may still be the only path to some pages (followed at a
+        # lower frontier priority, see LinkProcessor); opt out per config
+        if page.near_duplicate_of is not None and not self._follows_near_duplicate_links():
+            logger.debug("Not following links of near-duplicate %s", url)
+            return False
+
         # Process links and recurse
         was_cancelled = self.process_links(page, depth)
         
@@ -1,12 +1,19 @@
 import logging
+from datetime import datetime
 
 from infracrawl.domain import CrawlSession
+from infracrawl.domain.fetch_state import FetchState
 from infracrawl.domain.page import Page
 from infracrawl.domain.crawl_result import CrawlResult
 from infracrawl.services.configured_crawl_provider_factory import ConfiguredCrawlProviderFactory
+from infracrawl.services.revisit_policy import RevisitPolicy
+from infracrawl.services.url_canonicalizer import UrlCanonicalizer
 
 logger = logging.getLogger(__name__)
 
+# Pending pages read per frontier query; a depth is drained batch by batch.
+FRONTIER_BATCH_SIZE = 1000
+
 class CrawlExecutor:
     """Thin orchestration layer for multi-root crawls.
 
@@ -20,16 +27,76 @@ class CrawlExecutor:
         self,
         *,
         provider_factory: ConfiguredCrawlProviderFactory,
+        sitemap_seeder=None,
+        robots_prefetcher=None,
     ):
         self.provider_factory = provider_factory
+        self.sitemap_seeder = sitemap_seeder
+        self.robots_prefetcher = robots_prefetcher
+
+    def _seed_from_sitemaps(self, session: CrawlSession) -> list[str]:
+        """Add sitemap URLs at depth 1; returns fetched pages the sitemap says changed."""
+        if self.sitemap_seeder is None:
+            return []
+        try:
+            return self.sitemap_seeder.seed(session, discovered_depth=1)
+        except Exception:
+            logger.exception("Sitemap discovery failed for config %s", session.config.config_id)
+            return []
+
+    def _frontier_batches(self, provider, session: CrawlSession, depth: int):
+        """Yield batches of `(url, depth)` to crawl at a depth phase.
+
+        At depth 1 this starts with pages to refetch: fetched pages whose
+        sitemap lastmod changed, then pages at any depth whose adaptive
+        revisit time has come (most overdue first). Then the depth's pending
+        pages, best first. Each source is re-read from the top after every
+        batch: crawling a page moves it out of the source (fetched, failed or
+        skipped, or rescheduled when revisited). A batch identical to the
+        previous one means none of it could be crawled, so the source is
+        given up rather than re-read forever.
+        """
+        config = session.config
+        sources = []
+        if depth == 1:
+            changed = self._seed_from_sitemaps(session)
+            if changed:
+                yield [(url, 1) for url in changed]
+            if RevisitPolicy.for_config(config).enabled:
+                now = datetime.utcnow()
+                sources.append(lambda limit: provider.pages_repo.get_due_urls(
+                    config.config_id, now, max_depth=config.max_depth, limit=limit,
+                ))
+        sources.append(lambda limit: [
+            (url, depth)
+            for url in provider.pages_repo.get_undiscovered_urls_by_depth(config.config_id, depth, limit=limit)
+        ])
+
+        for source in sources:
+            previous = None
+            while True:
+                batch = list(source(FRONTIER_BATCH_SIZE))
+                if not batch:
+                    break
+                if batch == previous:
+                    logger.warning(
+                        "%d page(s) at depth %s of config %s stay selectable after being crawled; moving on",
+                        len(batch), depth, config.config_id,
+                    )
+                    break
+                previous = batch
+                yield batch
 
     def crawl(self, session: CrawlSession) -> CrawlResult:
         """Execute an iterative depth-based crawl for the given session.
         
         Crawling proceeds by depth level:
         - Depth 0: Root URLs (fetched, links stored as undiscovered)
-        - Depth 1: All pages discovered from roots (fetched, their links stored)
-        - Depth N: All pages discovered at depth N-1 (up to max_depth)
+        - Depth 1: All pages discovered from roots and, if the config enables
+          it, from sitemaps; first, fetched pages that are due again (changed
+          sitemap lastmod, or adaptive revisit time reached)
+        - Depth N: All pages discovered at depth N-1 (up to max_depth),
+          highest frontier priority first
         
         This allows resumption: if interrupted, undiscovered pages remain in DB.
         
@@ -45,30 +112,53 @@ class CrawlExecutor:
         # Build per-crawl provider from session
         provider = self.provider_factory.build(session)
         logger.info("Crawl started for config %s (iterative depth-based crawling)", session.config.config_id)
+        session.start_budget_clock()
+        if self.robots_prefetcher is not None and session.config.robots:
+            # All root hosts' robots.txt load in parallel instead of one by one
+            self.robots_prefetcher.prefetch(session.config.root_urls or [])
 
         was_cancelled = False
+        budget_hit = False
         max_depth = session.config.max_depth
         
         # Start depth: 0 for roots, or resume from interrupted depth
         current_depth = 0
-        if len(session.visited_tracker._visited) > 0:
-            logger.info("Resuming crawl with %d pre-loaded visited URLs", len(session.visited_tracker._visited))
+        if session.resumed:
+            logger.info("Resuming crawl for config %s", session.config.config_id)
             current_depth = 0  # Always start at roots for resume, they'll be skipped if already visited
+            if session.config.config_id is not None:
+                # Pages the interrupted crawl was fetching go back to the frontier
+                requeued = provider.pages_repo.requeue_unfetched(session.config.config_id, (FetchState.IN_FLIGHT,))
+                if requeued:
+                    logger.info("Re-queued %d page(s) left in flight", requeued)
+        elif session.config.config_id is not None:
+            # Fresh crawl: retry failed pages and recheck skipped ones against current robots.txt and config
+            requeued = provider.pages_repo.requeue_unfetched(session.config.config_id)
+            if requeued:
+                logger.info("Re-queued %d previously failed or skipped page(s)", requeued)
         
         while current_depth is None or current_depth <= (max_depth or float('inf')):
             if was_cancelled:
                 logger.info("Crawl cancelled at depth %s", current_depth)
                 break
+            if budget_hit:
+                logger.info("Crawl budget %s reached at depth %s", session.stop_reason, current_depth)
+                break
             
             # Phase 1: Root URLs at depth 0
             if current_depth == 0:
                 logger.info("Crawling depth 0: root URLs")
-                roots = session.config.root_urls or []
+                canonicalizer = UrlCanonicalizer.for_config(session.config)
+                roots = [canonicalizer.canonicalize(url) for url in (session.config.root_urls or [])]
                 logger.info("Processing %d root URL(s)", len(roots))
                 
                 for root_url in roots:
                     if was_cancelled:
                         break
+                    # Stop handing out URLs; the previous fetch has already been persisted
+                    if session.budget_exhausted():
+                        budget_hit = True
+                        break
                     
                     page = Page(page_url=root_url, config_id=session.config.config_id)
                     page.discovered_depth = 0  # Mark as root
@@ -86,43 +176,53 @@ class CrawlExecutor:
                     # Update registry progress after each root (for real-time visibility)
                     session.update_progress()
             else:
-                # Phase 2+: Crawl all discovered pages at current depth
+                # Phase 2+: Crawl all discovered pages at current depth, best first
                 logger.info("Crawling depth %s: discovered pages", current_depth)
-                undiscovered = provider.pages_repo.get_undiscovered_urls_by_depth(
-                    session.config.config_id, 
-                    current_depth,
-                    limit=1000
-                )
-                
-                if not undiscovered:
+                crawled_at_depth = 0
+                for batch in self._frontier_batches(provider, session, current_depth):
+                    if was_cancelled or budget_hit:
+                        break
+                    logger.info("Found %d pages to crawl at depth %s", len(batch), current_depth)
+                    for page_url, page_depth in batch:
+                        if was_cancelled:
+                            break
+                        if session.budget_exhausted():
+                            budget_hit = True
+                            break
+
+                        page = Page(page_url=page_url, config_id=session.config.config_id)
+                        page.discovered_depth = page_depth
+                        logger.info("  Crawling: %s (depth %s)", page_url, page_depth)
+                        was_cancelled = provider.crawl_from(page, max_depth)
+                        crawled_at_depth += 1
+
+                        # Update registry progress after each page (for real-time visibility)
+                        session.update_progress()
+
+                if crawled_at_depth == 0 and not was_cancelled and not budget_hit:
                     logger.info("No more undiscovered pages at depth %s, stopping", current_depth)
                     break
-                
-                logger.info("Found %d undiscovered pages at depth %s", len(undiscovered), current_depth)
-                
-                for page_url in undiscovered:
-                    if was_cancelled:
-                        break
-                    
-                    page = Page(page_url=page_url, config_id=session.config.config_id)
-                    page.discovered_depth = current_depth
-                    logger.info("  Crawling: %s (depth %s)", page_url, current_depth)
-                    was_cancelled = provider.crawl_from(page, max_depth)
-                    
-                    # Update registry progress after each page (for real-time visibility)
-                    session.update_progress()
             
             current_depth += 1
 
         # Update registry with final page count via session
         session.update_progress()
 
+        if was_cancelled:
+            session.stop_reason = "cancelled"
+
         logger.info(
-            "Crawl completed for config %s (depth reached %s): pages=%s stopped=%s",
+            "Crawl completed for config %s (depth reached %s): pages=%s bytes=%s stopped=%s stop_reason=%s",
             session.config.config_id,
             current_depth - 1,
             provider.context.pages_crawled,
+            session.bytes_fetched,
             was_cancelled,
+            session.stop_reason,
         )
 
-        return CrawlResult(pages_crawled=provider.context.pages_crawled, stopped=was_cancelled)
+        return CrawlResult(
+            pages_crawled=provider.context.pages_crawled,
+            stopped=was_cancelled,
+            stop_reason=session.stop_reason,
+        )
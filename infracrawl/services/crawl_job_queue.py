@@ -0,0 +1,179 @@
+import heapq
+import itertools
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first.
+PRIORITIES = {"manual": 0, "scheduled": 1, "recovery": 2}
+
+
+@dataclass
+class CrawlJob:
+    id: str
+    config_path: str
+    kind: str  # manual | scheduled | recovery
+    priority: int
+    status: str  # queued | running
+    enqueued_at: datetime
+    started_at: Optional[datetime] = None
+    fn: Callable[..., Any] = field(default=None, repr=False)
+    args: tuple = field(default=(), repr=False)
+
+    def to_dict(self) -> dict:
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.name not in ("fn", "args")}
+        d["job_id"] = d.pop("id")
+        return d
+
+
+class CrawlJobQueue:
+    """Single in-process queue for every crawl: manual, scheduled and recovery.
+
+    At most `max_concurrent` crawls run at once on the queue's own worker
+    threads. A config can be queued or running only once (single-flight);
+    further submits for it are rejected. Waiting jobs start in priority order
+    (manual, then scheduled, then recovery), FIFO within a priority.
+    """
+
+    def __init__(self, max_concurrent: int = 2):
+        if int(max_concurrent) < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self.max_concurrent = int(max_concurrent)
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._jobs: Dict[str, CrawlJob] = {}  # config_path -> queued or running job
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, config_path: str, fn: Callable[..., Any], *args, kind: str = "manual") -> Optional[dict]:
+        """Queue `fn(*args)` for the config.
+
+        Returns the queued job as a dict, or None if the config already has a
+        queued or running crawl (or the queue is shut down).
+        """
+        if kind not in PRIORITIES:
+            raise ValueError(f"unknown crawl job kind: {kind!r}")
+        with self._cond:
+            if self._closed:
+                return None
+            if config_path in self._jobs:
+                logger.info("Crawl for %s already %s; not queuing %s run", config_path, self._jobs[config_path].status, kind)
+                return None
+            job = CrawlJob(
+                id=str(uuid.uuid4()),
+                config_path=config_path,
+                kind=kind,
+                priority=PRIORITIES[kind],
+                status="queued",
+                enqueued_at=datetime.now(timezone.utc),
+                fn=fn,
+                args=args,
+            )
+            self._jobs[config_path] = job
+            heapq.heappush(self._heap, (job.priority, next(self._seq), job))
+            self._ensure_workers()
+            self._cond.notify()
+            logger.info("Queued %s crawl for %s (queue depth %d)", kind, config_path, len(self._heap))
+            return job.to_dict()
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_concurrent:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"crawl-worker-{len(self._workers) + 1}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                job.status = "running"
+                job.started_at = datetime.now(timezone.utc)
+            try:
+                job.fn(*job.args)
+            except Exception:
+                logger.exception("Crawl job %s for %s failed", job.id, job.config_path)
+            finally:
+                with self._cond:
+                    self._jobs.pop(job.config_path, None)
+
+    def is_active(self, config_path: str) -> bool:
+        with self._cond:
+            return config_path in self._jobs
+
+    def snapshot(self) -> dict:
+        """Queue state for the API: running jobs and queued jobs in start order."""
+        with self._cond:
+            running = [j.to_dict() for j in self._jobs.values() if j.status == "running"]
+            queued = [job.to_dict() for _, _, job in sorted(self._heap, key=lambda e: e[:2])]
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": running,
+            "queued": queued,
+            "queue_depth": len(queued),
+        }
+
+    def shutdown(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """Drop queued jobs and stop workers after their current crawl."""
+        with self._cond:
+            self._closed = True
+            for _, _, job in self._heap:
+                self._jobs.pop(job.config_path, None)
+            self._heap.clear()
+            self._cond.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout)
+
+
+class DbCrawlJobQueue:
+    """CrawlJobQueue stand-in that only records jobs in the `crawl_jobs` table.
+
+    Used by the API process when crawls run in separate worker processes
+    (`INFRACRAWL_CRAWL_EXECUTION=worker`). `fn` and its arguments are not
+    stored: the worker picks the runner method from the job kind (resume for
+    `recovery`, a fresh crawl otherwise). Single-flight per config holds
+    across all processes via a unique index.
+    """
+
+    max_concurrent = None  # set per worker process
+
+    def __init__(self, jobs_repo):
+        self.jobs_repo = jobs_repo
+
+    def submit(self, config_path: str, fn: Callable[..., Any] = None, *args, kind: str = "manual") -> Optional[dict]:
+        if kind not in PRIORITIES:
+            raise ValueError(f"unknown crawl job kind: {kind!r}")
+        job = self.jobs_repo.enqueue(config_path, kind, PRIORITIES[kind])
+        if job is None:
+            logger.info("Crawl for %s already queued or running; not queuing %s run", config_path, kind)
+        return job
+
+    def is_active(self, config_path: str) -> bool:
+        return self.jobs_repo.is_active(config_path)
+
+    def snapshot(self) -> dict:
+        jobs = self.jobs_repo.list_active()
+        queued = [j for j in jobs if j["status"] == "queued"]
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": [j for j in jobs if j["status"] == "running"],
+            "queued": queued,
+            "queue_depth": len(queued),
+        }
+
+    def shutdown(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """Queued jobs stay in the table for the workers."""
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Optional
 from infracrawl.domain.crawl_session import CrawlSession
 from infracrawl.repository.pages import PagesRepository
+from infracrawl.services.revisit_policy import RevisitPolicy
+from infracrawl.services.sitemap_service import SitemapOptions
 from infracrawl.utils.datetime_utils import parse_to_utc_naive
 import logging
 
@@ -40,12 +42,22 @@ class CrawlPolicy:
         return False
     
     def should_skip_due_to_refresh(self, url: str, context: CrawlSession) -> bool:
-        """Check if URL should be skipped due to recent fetch (within refresh_days)."""
+        """Check if URL should be skipped due to recent fetch (within refresh_days).
+
+        With sitemap discovery on, a known sitemap `<lastmod>` decides instead:
+        skip if the page has not changed since it was fetched, refetch if it has.
+        Otherwise, with adaptive revisits on, a page is skipped until its
+        `next_visit_at`.
+        """
         cfg_refresh_days = None
+        use_lastmod = False
+        use_revisit = False
         if context and context.config is not None:
             cfg_refresh_days = context.config.refresh_days
+            use_lastmod = SitemapOptions.for_config(context.config).enabled
+            use_revisit = RevisitPolicy.for_config(context.config).enabled
         
-        if cfg_refresh_days is None:
+        if cfg_refresh_days is None and not use_lastmod and not use_revisit:
             return False
         
         page = self.pages_repo.get_page_by_url(url)
@@ -55,6 +67,23 @@ class CrawlPolicy:
         last_dt_utc = parse_to_utc_naive(page.fetched_at)
         if last_dt_utc is None:
             return False
+
+        lastmod = parse_to_utc_naive(getattr(page, "sitemap_lastmod", None)) if use_lastmod else None
+        if lastmod is not None:
+            if lastmod <= last_dt_utc:
+                logger.info("Skipping %s; unchanged since last fetch (sitemap lastmod %s)", url, lastmod)
+                return True
+            return False
+
+        next_visit = parse_to_utc_naive(getattr(page, "next_visit_at", None)) if use_revisit else None
+        if next_visit is not None:
+            if datetime.utcnow() < next_visit:
+                logger.info("Skipping %s; next revisit due %s", url, next_visit)
+                return True
+            return False
+
+        if cfg_refresh_days is None:
+            return False
         
         delta_days = (datetime.utcnow() - last_dt_utc).days
         if delta_days < int(cfg_refresh_days):
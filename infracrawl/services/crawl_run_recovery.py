@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor
 
+from infracrawl.domain.crawl_budget import BUDGET_STOP_REASONS
 from infracrawl.repository.crawls import CrawlsRepository
 from infracrawl.services.protocols import ConfigProvider
 
@@ -71,6 +72,23 @@ class CrawlRunRecovery:
                 logger.debug("Recovery: no incomplete runs or unvisited pages for config %s (id=%s)", cfg_path, cfg_id)
                 continue
 
+            if count <= 0:
+                # A crawl stopped by its budget leaves pending pages on purpose;
+                # resuming it on every restart would grant it a fresh budget
+                try:
+                    stop_reason = self.crawls_repo.latest_stop_reason(cfg_id)
+                except Exception:
+                    logger.exception("Recovery: could not read last stop reason for %s", cfg_path)
+                    stop_reason = None
+                if stop_reason in BUDGET_STOP_REASONS:
+                    logger.info(
+                        "Recovery: not resuming %s (id=%s); its last run stopped at budget %s",
+                        cfg_path,
+                        cfg_id,
+                        stop_reason,
+                    )
+                    continue
+
             logger.info("Recovery: marked %d incomplete run(s) for %s", count, cfg_path)
 
             # Always load full config to check resume flag (may have been updated since DB last synced)
@@ -12,16 +12,22 @@ class CrawlSessionFactory:
         self,
         *,
         registry=None,
-        visited_tracker_max_urls: int = 100_000,
+        visited_tracker_max_urls: int = 1_000_000,
+        visited_bloom_capacity: int = 10_000_000,
+        visited_bloom_error_rate: float = 0.001,
     ):
         """Initialize factory.
         
         Args:
             registry: Optional crawl registry for tracking/cancellation (InMemoryCrawlRegistry)
-            visited_tracker_max_urls: Maximum URLs to track as visited per session
+            visited_tracker_max_urls: Maximum URLs held exactly in the visited tracker per session
+            visited_bloom_capacity: URLs the Bloom-filter overflow tier is sized for (0 disables it)
+            visited_bloom_error_rate: Target false-positive rate of the Bloom-filter tier
         """
         self.registry = registry
         self.visited_tracker_max_urls = int(visited_tracker_max_urls)
+        self.visited_bloom_capacity = int(visited_bloom_capacity)
+        self.visited_bloom_error_rate = float(visited_bloom_error_rate)
     
     def create(self, config: CrawlerConfig) -> CrawlSession:
         """Create a new crawl session for the given config.
@@ -38,7 +44,11 @@ class CrawlSessionFactory:
         # Create session with registry reference (tracking not started yet)
         session = CrawlSession(
             config=config,
-            visited_tracker=VisitedTracker(max_size=self.visited_tracker_max_urls),
+            visited_tracker=VisitedTracker(
+                max_size=self.visited_tracker_max_urls,
+                bloom_capacity=self.visited_bloom_capacity,
+                bloom_error_rate=self.visited_bloom_error_rate,
+            ),
             registry=self.registry,
         )
         
@@ -13,7 +13,7 @@ class CrawlSessionResumeFactory:
     """Rebuilds CrawlSession instances for resuming incomplete crawls.
     
     This factory is specifically for resume operations and requires access
-    to the pages repository to load previously-visited URLs.
+    to the pages repository to look up previously-visited URLs.
     """
     
     def __init__(
@@ -22,70 +22,71 @@ class CrawlSessionResumeFactory:
         pages_repo: PagesRepository,
         links_repo=None,
         registry=None,
-        visited_tracker_max_urls: int = 100_000,
+        visited_tracker_max_urls: int = 1_000_000,
+        visited_bloom_capacity: int = 10_000_000,
+        visited_bloom_error_rate: float = 0.001,
     ):
         """Initialize resume factory.
         
         Args:
-            pages_repo: Repository for loading visited URLs from database
+            pages_repo: Repository for looking up visited URLs in the database
             links_repo: Optional repository for loading link counts
             registry: Optional crawl registry for tracking/cancellation
-            visited_tracker_max_urls: Maximum URLs to track as visited per session
+            visited_tracker_max_urls: Maximum URLs held exactly in the visited tracker per session
+            visited_bloom_capacity: URLs the Bloom-filter overflow tier is sized for (0 disables it)
+            visited_bloom_error_rate: Target false-positive rate of the Bloom-filter tier
         """
         self.pages_repo = pages_repo
         self.links_repo = links_repo
         self.registry = registry
         self.visited_tracker_max_urls = int(visited_tracker_max_urls)
+        self.visited_bloom_capacity = int(visited_bloom_capacity)
+        self.visited_bloom_error_rate = float(visited_bloom_error_rate)
     
     def rebuild(self, config: CrawlerConfig) -> CrawlSession:
         """Rebuild a crawl session for resuming from a previous incomplete run.
         
-        Loads all previously-visited URLs from the database and pre-populates
-        the visited tracker so the crawler will skip already-crawled pages.
+        The database is the source of truth for what has already been crawled:
+        the frontier query only returns pages not yet fetched, and the visited
+        tracker falls back to a per-URL lookup for anything it has not seen in
+        this session. Nothing is preloaded, so startup cost does not grow with
+        the number of URLs already crawled.
         
         Args:
             config: The crawler configuration for this session
             
         Returns:
-            A CrawlSession with pre-populated visited tracker, ready to resume
+            A CrawlSession marked `resumed` whose visited tracker consults the database
         """
-        # Load previously-visited URLs from database
-        visited_urls = []
-        if config.config_id is not None:
-            visited_urls = self.pages_repo.get_visited_urls_by_config(config.config_id)
-            logger.info("Resume factory: loaded %d visited URLs for config %s (ID: %s)", 
-                       len(visited_urls), config.config_path, config.config_id)
-            if visited_urls:
-                logger.debug("Visited URLs: %s", visited_urls[:5])  # Log first 5 for brevity
+        config_id = config.config_id
+        fallback = None
+        if config_id is not None:
+            fallback = lambda url: self.pages_repo.is_url_fetched(config_id, url)
         else:
-            logger.warning("Resume factory: config_id is None, cannot load visited URLs")
-        
-        # Create visited tracker and pre-populate with previous URLs
-        visited_tracker = VisitedTracker(max_size=self.visited_tracker_max_urls)
-        for url in visited_urls:
-            visited_tracker.mark(url)
-        
-        logger.info("Resume factory: pre-populated visited tracker with %d URLs", len(visited_urls))
+            logger.warning("Resume factory: config_id is None, cannot consult visited URLs")
+
+        visited_tracker = VisitedTracker(
+            max_size=self.visited_tracker_max_urls,
+            bloom_capacity=self.visited_bloom_capacity,
+            bloom_error_rate=self.visited_bloom_error_rate,
+            fallback=fallback,
+        )
         
-        # Create session with pre-populated tracker
         session = CrawlSession(
             config=config,
             visited_tracker=visited_tracker,
             registry=self.registry,
+            resumed=True,
         )
         
         # Pre-populate session with existing page and link counts from database
-        if config.config_id is not None:
-            # Get count of already-fetched pages
-            fetched_page_ids = self.pages_repo.get_fetched_page_ids_by_config(config.config_id)
-            session.pages_crawled = len(fetched_page_ids) if fetched_page_ids else 0
-            
-            # Get count of existing links if links_repo is available
-            if self.links_repo is not None and fetched_page_ids:
-                session.links_discovered = self.links_repo.count_links_for_page_ids(fetched_page_ids)
+        if config_id is not None:
+            session.pages_crawled = self.pages_repo.count_fetched_pages_by_config(config_id)
+            if self.links_repo is not None:
+                session.links_discovered = self.links_repo.count_links_by_config(config_id)
             
-            logger.info("Resume factory: pre-populated session counts: pages=%d, links=%d",
-                       session.pages_crawled, session.links_discovered)
+            logger.info("Resume factory: pre-populated session counts for %s: pages=%d, links=%d",
+                       config.config_path, session.pages_crawled, session.links_discovered)
         
         # Start tracking if registry is available
         session.start_tracking()
@@ -0,0 +1,130 @@
+import logging
+import os
+import socket
+import threading
+from types import SimpleNamespace
+from typing import Optional
+
+from infracrawl.services.crawl_job_queue import PRIORITIES
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlWorker:
+    """Runs crawl jobs claimed from the `crawl_jobs` table (see `worker.py`).
+
+    Each of `concurrency` threads loops claim -> crawl -> finish. A running
+    job is heartbeated every `lease_seconds / 3`; jobs whose heartbeat is
+    older than `lease_seconds` (their worker died) are requeued as recovery
+    jobs and resumed by whichever worker claims them next.
+    """
+
+    def __init__(
+        self,
+        jobs_repo,
+        job_runner,
+        *,
+        crawl_registry=None,
+        worker_id: Optional[str] = None,
+        concurrency: int = 1,
+        poll_interval_seconds: float = 2.0,
+        lease_seconds: int = 300,
+        finished_retention_seconds: int = 7 * 24 * 3600,
+    ):
+        self.jobs_repo = jobs_repo
+        self.job_runner = job_runner
+        self.crawl_registry = crawl_registry
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = max(1, int(concurrency))
+        self.poll_interval = float(poll_interval_seconds)
+        self.lease_seconds = int(lease_seconds)
+        self.finished_retention_seconds = int(finished_retention_seconds)
+        self.stop_event = threading.Event()
+
+    def run_once(self) -> bool:
+        """Claim and run one job. Returns False if the queue was empty."""
+        job = self.jobs_repo.claim_next(self.worker_id)
+        if job is None:
+            return False
+        logger.info("Worker %s running %s crawl job %s for %s", self.worker_id, job["kind"], job["job_id"], job["config_path"])
+
+        done = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job["job_id"], done), daemon=True)
+        beat.start()
+        error = None
+        try:
+            if job["kind"] == "recovery":
+                # run_config_resume reloads the full config from its path
+                self.job_runner.run_config_resume(SimpleNamespace(config_path=job["config_path"]))
+            else:
+                self.job_runner.run(job["config_path"])
+        except Exception as e:
+            logger.exception("Crawl job %s for %s failed", job["job_id"], job["config_path"])
+            error = str(e) or type(e).__name__
+        finally:
+            done.set()
+            beat.join()
+
+        if self.stop_event.is_set() and error is None:
+            # Interrupted by shutdown: let the next worker resume where this one stopped
+            self.jobs_repo.requeue_as_recovery(job["job_id"], PRIORITIES["recovery"])
+        else:
+            self.jobs_repo.finish(job["job_id"], error=error)
+        return True
+
+    def _heartbeat(self, job_id: int, done: threading.Event) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while not done.wait(interval):
+            try:
+                self.jobs_repo.heartbeat(job_id)
+            except Exception:
+                logger.exception("Could not heartbeat crawl job %s", job_id)
+
+    def _loop(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.exception("Worker %s could not claim a crawl job", self.worker_id)
+            self.stop_event.wait(self.poll_interval)
+
+    def _requeue_stale(self) -> None:
+        try:
+            requeued = self.jobs_repo.requeue_stale(self.lease_seconds, PRIORITIES["recovery"])
+            if requeued:
+                logger.info("Requeued %d crawl jobs from dead workers", requeued)
+        except Exception:
+            logger.exception("Could not requeue stale crawl jobs")
+
+    def run_forever(self) -> None:
+        """Process jobs until `stop()` is called, then wait for running crawls to end."""
+        self._requeue_stale()
+        try:
+            self.jobs_repo.delete_finished(self.finished_retention_seconds)
+        except Exception:
+            logger.exception("Could not delete old crawl jobs")
+
+        threads = [
+            threading.Thread(target=self._loop, name=f"crawl-worker-{i + 1}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for t in threads:
+            t.start()
+        logger.info("Crawl worker %s started with %d slots", self.worker_id, self.concurrency)
+        while not self.stop_event.wait(self.lease_seconds):
+            self._requeue_stale()
+        for t in threads:
+            t.join()
+        logger.info("Crawl worker %s stopped", self.worker_id)
+
+    def stop(self) -> None:
+        """Stop claiming jobs and cancel running crawls so they checkpoint and get requeued."""
+        self.stop_event.set()
+        if self.crawl_registry is None:
+            return
+        for rec in self.crawl_registry.list_active() or []:
+            try:
+                self.crawl_registry.cancel(rec.get("id"))
+            except Exception:
+                logger.exception("Could not cancel crawl %s", rec.get("id"))
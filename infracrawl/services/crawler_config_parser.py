@@ -2,6 +2,8 @@ import os
 from typing import Optional
 
 from infracrawl.domain.config import CrawlerConfig
+from infracrawl.domain.crawl_budget import parse_duration_seconds, parse_size_bytes
+from infracrawl.services.revisit_policy import RevisitPolicy
 
 
 class CrawlerConfigParser:
@@ -42,6 +44,11 @@ class CrawlerConfigParser:
             elif fetch_mode.startswith("headless"):
                 headless_options = mode_options
 
+        # Fail at load time rather than on the first fetch
+        RevisitPolicy.from_options(data.get("revisit"), data.get("refresh_days"))
+        if http_options:
+            parse_size_bytes(http_options.get("max_body_bytes"))
+
         return CrawlerConfig(
             config_id=config_id,
             config_path=os.path.basename(config_path),
@@ -59,4 +66,21 @@ class CrawlerConfigParser:
             delay_seconds=data.get("delay_seconds", 1.0),
             # Default to True so jobs resume unless explicitly disabled
             resume_on_application_restart=data.get("resume_on_application_restart", True),
+            canonicalize_options=data.get("canonicalize"),
+            near_duplicate_options=data.get("near_duplicate"),
+            priority_options=data.get("priority"),
+            sitemap_options=data.get("sitemap"),
+            revisit_options=data.get("revisit"),
+            # Per-crawl budgets, e.g. max_pages: 5000, max_duration: 45m, max_bytes: 500MB
+            max_pages=self._parse_max_pages(data.get("max_pages")),
+            max_duration_seconds=parse_duration_seconds(data.get("max_duration")),
+            max_bytes=parse_size_bytes(data.get("max_bytes")),
         )
+
+    @staticmethod
+    def _parse_max_pages(value) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, bool) or int(value) <= 0:
+            raise ValueError(f"max_pages must be a positive integer: {value!r}")
+        return int(value)
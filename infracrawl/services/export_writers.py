@@ -0,0 +1,209 @@
+"""Serializers that turn a stream of page rows into export file formats.
+
+Each writer consumes the row iterator produced by `PagesRepository.iter_pages`
+and yields `bytes` chunks suitable for a `StreamingResponse` (or a file), so
+output is produced incrementally and nothing holds the whole export in memory.
+"""
+import gzip
+import io
+import json
+import uuid
+import zlib
+from datetime import datetime, timezone
+from http import HTTPStatus
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Sequence
+
+# Fields a WARC record is built from.
+WARC_FIELDS = ("page_url", "page_content", "http_status", "fetched_at")
+
+_GZIP_FLUSH_BYTES = 64 * 1024
+
+
+def ndjson_stream(rows: Iterable[dict]) -> Iterator[bytes]:
+    """One JSON object per line."""
+    for row in rows:
+        yield (json.dumps(row, default=str) + "\n").encode("utf-8")
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream on the fly, emitting roughly 64 KiB at a time."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    pending = 0
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        pending += len(chunk)
+        if pending >= _GZIP_FLUSH_BYTES:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush(zlib.Z_FINISH)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except Exception as e:
+        raise RuntimeError("Parquet export requested but pyarrow is not installed. Install 'pyarrow' (see requirements-parquet.txt).") from e
+    return pa, pq
+
+
+def parquet_available() -> bool:
+    try:
+        _import_pyarrow()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _arrow_schema(pa, fields: Sequence[str]):
+    types = {
+        "page_id": pa.int64(),
+        "page_url": pa.string(),
+        "page_content": pa.string(),
+        "plain_text": pa.string(),
+        "filtered_plain_text": pa.string(),
+        "http_status": pa.int32(),
+        "fetched_at": pa.timestamp("us", tz="UTC"),
+        "config_id": pa.int32(),
+        "content_hash": pa.string(),
+        "discovered_depth": pa.int32(),
+    }
+    return pa.schema([(f, types[f]) for f in fields])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that buffers output until drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+def parquet_stream(rows: Iterable[dict], fields: Sequence[str], row_group_size: int = 10_000) -> Iterator[bytes]:
+    """Write rows as Parquet, one row group per `row_group_size` rows.
+
+    Each row group is flushed to the output as soon as it is written; only the
+    current group is held in memory. Requires the optional `pyarrow` package
+    (requirements-parquet.txt).
+    """
+    pa, pq = _import_pyarrow()
+    schema = _arrow_schema(pa, fields)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd")
+    rows = iter(rows)
+    try:
+        while True:
+            batch = list(islice(rows, row_group_size))
+            if not batch:
+                break
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema), row_group_size=row_group_size)
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def _warc_record(headers: list[tuple[str, str]], block: bytes) -> bytes:
+    head = "WARC/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers)
+    head += f"Content-Length: {len(block)}\r\n\r\n"
+    # Each record is its own gzip member, as is conventional for .warc.gz
+    return gzip.compress(head.encode("utf-8") + block + b"\r\n\r\n")
+
+
+def _warc_date(value) -> str:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            value = None
+    if not isinstance(value, datetime):
+        value = datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def warc_stream(
+    rows: Iterable[dict],
+    software: str = "InfraCrawl",
+    filename: Optional[str] = None,
+    warcinfo: bool = True,
+) -> Iterator[bytes]:
+    """Write fetched pages as gzipped WARC/1.1 `response` records.
+
+    Only the decoded body, status and fetch time are stored, so each HTTP
+    response block is reconstructed with a minimal header set
+    (`Content-Type: text/html; charset=utf-8`). Rows without content are skipped.
+    Pass `warcinfo=False` when appending to a file that already starts with one.
+    """
+    if warcinfo:
+        yield _warcinfo_record(software, filename)
+    for row in rows:
+        record = warc_response_record(row)
+        if record is not None:
+            yield record
+
+
+def _warcinfo_record(software: str, filename: Optional[str]) -> bytes:
+    info = f"software: {software}\r\nformat: WARC File Format 1.1\r\n".encode("utf-8")
+    info_headers = [
+        ("WARC-Type", "warcinfo"),
+        ("WARC-Record-ID", f"<urn:uuid:{uuid.uuid4()}>"),
+        ("WARC-Date", _warc_date(None)),
+        ("Content-Type", "application/warc-fields"),
+    ]
+    if filename:
+        info_headers.insert(3, ("WARC-Filename", filename))
+    return _warc_record(info_headers, info)
+
+
+def warc_response_record(row: dict) -> Optional[bytes]:
+    """Gzipped WARC `response` record for one page row, or None if it has no content."""
+    content = row.get("page_content")
+    if content is None:
+        return None
+    body = content.encode("utf-8")
+    status = int(row.get("http_status") or 200)
+    try:
+        reason = HTTPStatus(status).phrase
+    except ValueError:
+        reason = ""
+    http_head = (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: text/html; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1")
+    return _warc_record(
+        [
+            ("WARC-Type", "response"),
+            ("WARC-Record-ID", f"<urn:uuid:{uuid.uuid4()}>"),
+            ("WARC-Date", _warc_date(row.get("fetched_at"))),
+            ("WARC-Target-URI", row["page_url"]),
+            ("Content-Type", "application/http; msgtype=response"),
+        ],
+        http_head + body,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from typing import Callable, Optional, Protocol
 
 from infracrawl.domain.http_response import HttpResponse
 
@@ -16,8 +16,28 @@ class Fetcher(Protocol):
 
 
 class HttpServiceFetcher:
-    def __init__(self, http_service):
+    """Fetch pages with `HttpService.fetch_page`.
+
+    Bodies whose Content-Type `accept_content_type` rejects are not
+    downloaded. With `probe`, a HEAD (or Range) request checks type and size
+    first, so rejected URLs never open a GET.
+    """
+
+    def __init__(
+        self,
+        http_service,
+        accept_content_type: Optional[Callable[[Optional[str]], bool]] = None,
+        probe: bool = False,
+    ):
         self._http_service = http_service
+        self._accept_content_type = accept_content_type
+        self._probe = probe
 
     def fetch(self, url: str, stop_event=None) -> HttpResponse:
-        return self._http_service.fetch(url)
+        if self._probe:
+            head = self._http_service.probe(url)
+            if head.status_code < 400:
+                if self._accept_content_type is not None and not self._accept_content_type(head.content_type):
+                    return head
+                self._http_service.check_size(url, head.headers)
+        return self._http_service.fetch_page(url, accept_content_type=self._accept_content_type)
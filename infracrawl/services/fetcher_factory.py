@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from infracrawl.domain.crawl_budget import parse_size_bytes
 from infracrawl.services.fetcher import Fetcher
 
 
@@ -16,6 +17,8 @@ class DisabledHeadlessFetcher:
 class FetcherFactory:
     http_fetcher: Fetcher
     headless_fetcher: Fetcher
+    # Configured HTTP fetchers, built once per config and its http options
+    _http_fetchers: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def get(self, config) -> Fetcher:
         if config is None or config.fetch_mode is None:
@@ -24,19 +27,11 @@ class FetcherFactory:
         if mode == "http":
             # Return configured HTTP fetcher if options provided
             if config and hasattr(config, 'http_options') and config.http_options:
-                from infracrawl.services.fetcher import HttpServiceFetcher
-                from infracrawl.services.http_service import HttpService
-                # Extract timeout, convert ms to seconds
-                timeout = config.http_options.get("timeout_ms", 10000) / 1000
-                # Get user_agent and http_client from base fetcher
-                base_service = self.http_fetcher._http_service
-                import requests
-                configured_service = HttpService(
-                    user_agent=base_service.user_agent,
-                    http_client=requests.get,
-                    timeout=int(timeout)
-                )
-                return HttpServiceFetcher(configured_service)
+                key = (config.config_id, config.config_path, repr(sorted(config.http_options.items())))
+                fetcher = self._http_fetchers.get(key)
+                if fetcher is None:
+                    fetcher = self._http_fetchers.setdefault(key, self._configured_http_fetcher(config.http_options))
+                return fetcher
             return self.http_fetcher
         if mode == "headless_chromium":
             # Return configured headless fetcher if options provided
@@ -52,3 +47,25 @@ class FetcherFactory:
                 return PlaywrightHeadlessFetcher(user_agent=base_user_agent, options=configured_options)
             return self.headless_fetcher
         raise ValueError(f"Unknown fetch_mode: {config.fetch_mode!r}")
+
+    def _configured_http_fetcher(self, http_options: dict) -> Fetcher:
+        from infracrawl.services.fetcher import HttpServiceFetcher
+        from infracrawl.services.http_service import HttpService
+        # Extract timeout, convert ms to seconds
+        timeout = http_options.get("timeout_ms", 10000) / 1000
+        # Get user_agent and http_client from base fetcher
+        base_service = self.http_fetcher._http_service
+        import requests
+        max_body_bytes = parse_size_bytes(http_options.get("max_body_bytes"))
+        configured_service = HttpService(
+            user_agent=base_service.user_agent,
+            http_client=requests.get,
+            timeout=int(timeout),
+            max_body_bytes=base_service.max_body_bytes if max_body_bytes is None else max_body_bytes,
+            head_client=requests.head,
+        )
+        return HttpServiceFetcher(
+            configured_service,
+            accept_content_type=getattr(self.http_fetcher, "_accept_content_type", None),
+            probe=bool(http_options.get("probe", False)),
+        )
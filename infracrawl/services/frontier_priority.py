@@ -0,0 +1,62 @@
+import math
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class FrontierPriority:
+    """Scores pending URLs so the most valuable pages are fetched first.
+
+    priority = inlink_weight * ln(1 + inlinks) - depth_weight * depth + url weight
+
+    where the URL weight is the sum of the weights of all matching
+    `url_weights` patterns (fnmatch, case-sensitive). Links found on a
+    near-duplicate page are scored `near_duplicate_penalty` lower (see
+    `for_near_duplicate_links`). Built from the optional `priority` section of
+    a crawler YAML:
+
+        priority:
+          inlink_weight: 1.0
+          depth_weight: 1.0
+          near_duplicate_penalty: 2.0
+          url_weights:
+            "*/docs/*": 2.0
+            "*/tag/*": -3.0
+    """
+
+    inlink_weight: float = 1.0
+    depth_weight: float = 1.0
+    url_weights: tuple[tuple[str, float], ...] = ()
+    near_duplicate_penalty: float = 2.0
+    offset: float = 0.0
+
+    @classmethod
+    def from_options(cls, options: Optional[dict]) -> "FrontierPriority":
+        if not options:
+            return cls()
+        return cls(
+            inlink_weight=float(options.get("inlink_weight", 1.0)),
+            depth_weight=float(options.get("depth_weight", 1.0)),
+            url_weights=tuple((str(p), float(w)) for p, w in (options.get("url_weights") or {}).items()),
+            near_duplicate_penalty=float(options.get("near_duplicate_penalty", 2.0)),
+        )
+
+    @classmethod
+    def for_config(cls, config) -> "FrontierPriority":
+        options = getattr(config, "priority_options", None) if config is not None else None
+        return cls.from_options(options)
+
+    def for_near_duplicate_links(self) -> "FrontierPriority":
+        """Scorer for links found on a near-duplicate page.
+
+        A later inlink from a regular page rescores the target without the penalty.
+        """
+        return replace(self, offset=self.offset - self.near_duplicate_penalty)
+
+    def score(self, url: str, depth: Optional[int], inlinks: int) -> float:
+        value = self.offset + self.inlink_weight * math.log1p(max(inlinks, 0)) - self.depth_weight * (depth or 0)
+        for pattern, weight in self.url_weights:
+            if fnmatchcase(url, pattern):
+                value += weight
+        return value
@@ -1,38 +1,179 @@
 import requests
-from typing import Callable
+from contextlib import contextmanager
+from typing import Callable, Iterator, Mapping, Optional
 
-from infracrawl.domain.http_response import HttpResponse
-from infracrawl.exceptions import HttpFetchError
+from infracrawl.domain.http_response import HttpResponse, HttpStream
+from infracrawl.exceptions import HttpFetchError, ResponseTooLargeError
 
 
 class HttpService:
     """
     HTTP client wrapper for fetching web pages.
-    
+
     Requires http_client callable for dependency injection (DIP compliance).
     This enables easy testing without patching and allows swapping HTTP libraries.
+
+    `fetch_page` streams page bodies and stops reading past `max_body_bytes`
+    (0 means no limit); `head_client` (e.g. `requests.head`) is used by
+    `probe`, which falls back to a one-byte Range GET without it.
     """
-    
-    def __init__(self, user_agent: str, http_client: Callable, timeout: int = 10):
+
+    def __init__(
+        self,
+        user_agent: str,
+        http_client: Callable,
+        timeout: int = 10,
+        max_body_bytes: int = 0,
+        head_client: Optional[Callable] = None,
+    ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.http_client = http_client
+        self.max_body_bytes = max(0, int(max_body_bytes or 0))
+        self.head_client = head_client
 
-    def fetch(self, url: str) -> HttpResponse:
-        """Fetch URL and return response with status code, body text, and Content-Type."""
-        headers = {"User-Agent": self.user_agent}
+    def fetch(self, url: str, extra_headers: Optional[Mapping[str, str]] = None) -> HttpResponse:
+        """Fetch URL and return response with status code, body text, Content-Type and headers."""
+        headers = {"User-Agent": self.user_agent, **(extra_headers or {})}
         try:
             resp = self.http_client(url, headers=headers, timeout=self.timeout)
         except requests.exceptions.RequestException as e:
             raise HttpFetchError(url, e) from e
-        
+
         # Extract Content-Type if response has headers; let real exceptions bubble up.
         ct = None
-        if hasattr(resp, 'headers'):
-            ct = resp.headers.get('Content-Type')
-        
-        return HttpResponse(resp.status_code, resp.text, ct)
-
-    def fetch_robots(self, robots_url: str) -> HttpResponse:
-        """Fetch robots.txt - delegates to fetch()."""
-        return self.fetch(robots_url)
+        resp_headers = getattr(resp, 'headers', None)
+        if resp_headers is not None:
+            ct = resp_headers.get('Content-Type')
+
+        return HttpResponse(resp.status_code, resp.text, ct, resp_headers)
+
+    def fetch_page(
+        self,
+        url: str,
+        accept_content_type: Optional[Callable[[Optional[str]], bool]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> HttpResponse:
+        """Fetch a page, deciding from its headers whether to read the body.
+
+        When `accept_content_type(content_type)` is false the body is never
+        downloaded and the response comes back with empty text, for the
+        caller's own content-type check to skip. Raises ResponseTooLargeError
+        when Content-Length, or the body as it streams in, exceeds
+        `max_body_bytes`.
+        """
+        headers = {"User-Agent": self.user_agent}
+        try:
+            resp = self.http_client(url, headers=headers, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            raise HttpFetchError(url, e) from e
+        try:
+            resp_headers = getattr(resp, 'headers', None)
+            ct = resp_headers.get('Content-Type') if resp_headers is not None else None
+            if accept_content_type is not None and not accept_content_type(ct):
+                return HttpResponse(resp.status_code, "", ct, resp_headers)
+            self.check_size(url, resp_headers)
+
+            body = bytearray()
+            for chunk in resp.iter_content(chunk_size=chunk_size):
+                body += chunk
+                if self.max_body_bytes and len(body) > self.max_body_bytes:
+                    raise ResponseTooLargeError(url, self.max_body_bytes)
+            return HttpResponse(resp.status_code, self._decode(resp, bytes(body)), ct, resp_headers)
+        except requests.exceptions.RequestException as e:
+            raise HttpFetchError(url, e) from e
+        finally:
+            resp.close()
+
+    def probe(self, url: str) -> HttpResponse:
+        """Status and headers of URL without downloading its body.
+
+        Sends HEAD; servers that reject it (405/501) or an unset `head_client`
+        get a `Range: bytes=0-0` GET that is closed before its body is read.
+        The response text is always empty.
+        """
+        headers = {"User-Agent": self.user_agent}
+        resp = None
+        if self.head_client is not None:
+            try:
+                resp = self.head_client(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+            except requests.exceptions.RequestException:
+                resp = None
+            if resp is not None and resp.status_code in (405, 501):
+                resp = None
+        if resp is None:
+            try:
+                resp = self.http_client(url, headers={**headers, "Range": "bytes=0-0"}, timeout=self.timeout, stream=True)
+            except requests.exceptions.RequestException as e:
+                raise HttpFetchError(url, e) from e
+            resp.close()
+        resp_headers = getattr(resp, 'headers', None)
+        ct = resp_headers.get('Content-Type') if resp_headers is not None else None
+        return HttpResponse(resp.status_code, "", ct, resp_headers)
+
+    def check_size(self, url: str, headers: Optional[Mapping[str, str]]) -> None:
+        """Raise ResponseTooLargeError when response headers announce a body over the limit."""
+        size = self.content_length(headers)
+        if self.max_body_bytes and size is not None and size > self.max_body_bytes:
+            raise ResponseTooLargeError(url, self.max_body_bytes)
+
+    @staticmethod
+    def content_length(headers: Optional[Mapping[str, str]]) -> Optional[int]:
+        """Full body size from Content-Range (`bytes 0-0/12345`) or Content-Length, if known."""
+        if not headers:
+            return None
+        content_range = headers.get('Content-Range') or ""
+        total = content_range.rpartition("/")[2].strip()
+        if total.isdigit():
+            return int(total)
+        length = (headers.get('Content-Length') or "").strip()
+        return int(length) if length.isdigit() else None
+
+    @staticmethod
+    def _decode(resp, body: bytes) -> str:
+        # Same charset requests would use for `resp.text` (declared or its text/* default)
+        encoding = getattr(resp, 'encoding', None)
+        if not isinstance(encoding, str) or not encoding:
+            encoding = "utf-8"
+        try:
+            return body.decode(encoding, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
+    @contextmanager
+    def stream(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[HttpStream]:
+        """Open URL and yield its body as byte chunks without buffering it.
+
+        Content-Encoding is undone by the client; a `.gz` file body is passed
+        through as-is. The connection is released when the block exits.
+        """
+        headers = {"User-Agent": self.user_agent}
+        try:
+            resp = self.http_client(url, headers=headers, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as e:
+            raise HttpFetchError(url, e) from e
+        try:
+            ct = resp.headers.get('Content-Type') if hasattr(resp, 'headers') else None
+            yield HttpStream(resp.status_code, resp.iter_content(chunk_size=chunk_size), ct)
+        except requests.exceptions.RequestException as e:
+            raise HttpFetchError(url, e) from e
+        finally:
+            resp.close()
+
+    def fetch_robots(
+        self,
+        robots_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> HttpResponse:
+        """Fetch robots.txt - delegates to fetch().
+
+        With `etag` / `last_modified` from a cached copy the request is
+        conditional; an unchanged file comes back as HTTP 304 with no body.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return self.fetch(robots_url, extra_headers=headers)
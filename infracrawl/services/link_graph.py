@@ -0,0 +1,148 @@
+"""Link-graph analytics: in/out-degree and PageRank per config.
+
+Edges are streamed from the links table into int64 numpy arrays, page_ids are
+remapped to dense indexes and every PageRank iteration is a gather plus one
+`np.bincount` (a sparse matrix-vector product), so graphs with millions of
+edges are ranked in seconds on one core.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class LinkGraph:
+    """Directed page graph with dense node indexes.
+
+    Duplicate edges (the same link seen on several fetches) and self-links
+    are dropped, so degrees count distinct linked pages.
+    """
+
+    def __init__(self, src: np.ndarray, dst: np.ndarray):
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if src.shape != dst.shape:
+            raise ValueError("src and dst must have the same length")
+        self.page_ids, src_idx, dst_idx = self._remap(src, dst)
+        n = len(self.page_ids)
+        keep = src_idx != dst_idx
+        # Sorting the combined key dedupes edges and leaves them ordered by source
+        keys = src_idx[keep] * n + dst_idx[keep]
+        keys.sort()
+        if len(keys):
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        self.src = keys // n
+        self.dst = keys % n
+
+    @staticmethod
+    def _remap(src: np.ndarray, dst: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Map page_ids to dense 0..n-1 indexes; returns (page_ids, src_idx, dst_idx)."""
+        if len(src) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        lo = int(min(src.min(), dst.min()))
+        hi = int(max(src.max(), dst.max()))
+        if lo >= 0 and hi < 8 * (len(src) + len(dst)) + 1024:
+            # page_ids are serial, so a direct-address table is cheap and avoids sorting
+            present = np.zeros(hi + 1, dtype=bool)
+            present[src] = True
+            present[dst] = True
+            index = np.cumsum(present) - 1
+            return np.flatnonzero(present), index[src], index[dst]
+        ids = np.sort(np.concatenate([src, dst]))
+        ids = ids[np.concatenate(([True], ids[1:] != ids[:-1]))]
+        return ids, np.searchsorted(ids, src), np.searchsorted(ids, dst)
+
+    @classmethod
+    def from_edge_batches(cls, batches: Iterable[List[tuple[int, int]]]) -> "LinkGraph":
+        chunks = []
+        for batch in batches:
+            if batch:
+                flat = np.fromiter(chain.from_iterable(batch), dtype=np.int64, count=2 * len(batch))
+                chunks.append(flat.reshape(-1, 2))
+        edges = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.int64)
+        return cls(edges[:, 0], edges[:, 1])
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.page_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    def in_degree(self) -> np.ndarray:
+        return np.bincount(self.dst, minlength=self.num_nodes)
+
+    def out_degree(self) -> np.ndarray:
+        return np.bincount(self.src, minlength=self.num_nodes)
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-8, max_iter: int = 100) -> np.ndarray:
+        """Power-iteration PageRank; scores sum to 1.
+
+        Rank of pages without outlinks is spread uniformly over all pages.
+        Stops when the L1 change between iterations drops below `tol`.
+        """
+        n = self.num_nodes
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+        out_degree = self.out_degree()
+        dangling = out_degree == 0
+        # Edge weights 1/outdeg(src), computed once
+        weights = 1.0 / out_degree[self.src]
+        rank = np.full(n, 1.0 / n)
+        for iteration in range(1, max_iter + 1):
+            spread = np.bincount(self.dst, weights=rank[self.src] * weights, minlength=n)
+            new_rank = damping * spread + (damping * rank[dangling].sum() + 1.0 - damping) / n
+            delta = np.abs(new_rank - rank).sum()
+            rank = new_rank
+            if delta < tol:
+                break
+        logger.debug("PageRank converged after %d iterations (delta=%.2e)", iteration, delta)
+        return rank
+
+
+class LinkGraphService:
+    """Computes link-graph scores for a config and stores them in `page_scores`."""
+
+    def __init__(self, links_repo, page_scores_repo, damping: float = 0.85):
+        self.links_repo = links_repo
+        self.page_scores_repo = page_scores_repo
+        self.damping = damping
+
+    def load_graph(self, config_id: int) -> LinkGraph:
+        return LinkGraph.from_edge_batches(self.links_repo.iter_edge_batches(config_id))
+
+    def compute_scores(self, config_id: int, computed_at: Optional[datetime] = None) -> dict:
+        """Rebuild the config's page scores. Returns a summary with counts and timings."""
+        started = time.perf_counter()
+        graph = self.load_graph(config_id)
+        loaded = time.perf_counter()
+
+        in_degree = graph.in_degree()
+        out_degree = graph.out_degree()
+        rank = graph.pagerank(damping=self.damping)
+        ranked = time.perf_counter()
+
+        written = self.page_scores_repo.replace_for_config(
+            config_id,
+            zip(graph.page_ids.tolist(), in_degree.tolist(), out_degree.tolist(), rank.tolist()),
+            computed_at or datetime.now(timezone.utc),
+        )
+        finished = time.perf_counter()
+
+        summary = {
+            "config_id": config_id,
+            "pages": written,
+            "edges": graph.num_edges,
+            "load_seconds": round(loaded - started, 3),
+            "rank_seconds": round(ranked - loaded, 3),
+            "write_seconds": round(finished - ranked, 3),
+        }
+        logger.info("Computed page scores: %s", summary)
+        return summary
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Iterable, Optional
 
 from infracrawl.domain import Link
+from infracrawl.services.frontier_priority import FrontierPriority
 
 
 class LinkPersister:
@@ -15,7 +16,15 @@ class LinkPersister:
         self.pages_repo = pages_repo
         self.links_repo = links_repo
 
-    def persist_links(self, *, from_id: int, links: Iterable[tuple[str, str]], from_depth: Optional[int] = None, config_id: Optional[int] = None) -> None:
+    def persist_links(
+        self,
+        *,
+        from_id: int,
+        links: Iterable[tuple[str, str]],
+        from_depth: Optional[int] = None,
+        config_id: Optional[int] = None,
+        priority: Optional[FrontierPriority] = None,
+    ) -> None:
         """Persist a batch of (url, anchor_text) links from a given page id.
         
         Args:
@@ -23,6 +32,7 @@ class LinkPersister:
             links: Iterable of (url, anchor_text) tuples
             from_depth: The depth of the source page (discovered links will be at from_depth + 1)
             config_id: The config ID for the discovered pages
+            priority: Scorer for the frontier priority of linked pages (defaults apply if None)
         """
         # Materialize once because we need to iterate multiple times.
         links_list = list(links)
@@ -38,4 +48,9 @@ class LinkPersister:
             for link_url, anchor in links_list
         ]
 
-        self.links_repo.insert_links_batch(link_objects)
+        # Only new edges count as inlinks, so refetching a page does not inflate its targets' priority
+        inserted = self.links_repo.insert_links_batch(link_objects, config_id=config_id)
+        self.pages_repo.add_inlinks(
+            (to_id for to_id in inserted if to_id != from_id),
+            (priority or FrontierPriority()).score,
+        )
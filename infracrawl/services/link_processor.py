@@ -3,6 +3,8 @@ from typing import Callable, Optional
 from urllib.parse import urlparse
 
 from infracrawl.services.link_persister import LinkPersister
+from infracrawl.services.frontier_priority import FrontierPriority
+from infracrawl.services.url_canonicalizer import UrlCanonicalizer
 from infracrawl.domain.crawl_session import CrawlSession
 from infracrawl.domain.page import Page
 
@@ -10,9 +12,12 @@ logger = logging.getLogger(__name__)
 
 
 class LinkProcessor:
-    def __init__(self, content_review_service, link_persister: LinkPersister):
+    def __init__(self, content_review_service, link_persister: LinkPersister, robots_service=None):
         self.content_review_service = content_review_service
         self.link_persister = link_persister
+        # Disallowed links are dropped before they reach the frontier; robots.txt
+        # of newly linked hosts (subdomains) is loaded in the background
+        self.robots_service = robots_service
 
     def _same_host(self, base: str, other: str) -> bool:
         try:
@@ -32,29 +37,55 @@ class LinkProcessor:
         They are stored at depth+1 relative to the current page.
         They will be crawled in subsequent iterations at the next depth level.
         
+        URLs are canonicalized (per-config rules) and de-duplicated before
+        persistence so fragment, tracking-parameter and similar variants do
+        not become separate pages. With robots.txt on, links it disallows are
+        not persisted. Links of a near-duplicate page get a lower frontier
+        priority.
+        
         Note: crawl_child_page callback is ignored in iterative crawling mode.
         """
         links = self.content_review_service.extract_links(page.page_url, page.page_content)
+        canonicalizer = UrlCanonicalizer.for_config(context.config)
         
         # Filter to same-host links only
         same_host_links = []
+        seen_urls = set()
         for link_url, anchor in links:
+            link_url = canonicalizer.canonicalize(link_url)
+            if link_url in seen_urls:
+                continue
+            seen_urls.add(link_url)
             if not self._same_host(context.current_root, link_url):
                 logger.debug("Skipping (external) %s -> not same host as %s", link_url, context.current_root)
                 continue
             same_host_links.append((link_url, anchor))
         
+        if self.robots_service is not None and context.config.robots and same_host_links:
+            urls = [url for url, _ in same_host_links]
+            self.robots_service.prefetch(urls)
+            # Hosts still loading are checked again when their pages are fetched
+            allowed = set(self.robots_service.filter_allowed(urls, True, cached_only=True))
+            if len(allowed) < len(urls):
+                logger.debug("Dropping %d link(s) from %s disallowed by robots.txt", len(urls) - len(allowed), page.page_url)
+                same_host_links = [(url, anchor) for url, anchor in same_host_links if url in allowed]
+
         if not same_host_links:
             logger.debug("No same-host links found on %s", page.page_url)
             return
 
+        priority = FrontierPriority.for_config(context.config)
+        if getattr(page, "near_duplicate_of", None) is not None:
+            priority = priority.for_near_duplicate_links()
+
         # Persist links (batch DB work) - these will be discovered but not yet fetched
         # Pass depth so discovered pages can be marked at next depth level
         self.link_persister.persist_links(
             from_id=page.page_id, 
             links=same_host_links,
             from_depth=page.discovered_depth,
-            config_id=page.config_id
+            config_id=page.config_id,
+            priority=priority,
         )
         
         # Update session stats
@@ -1,12 +1,15 @@
+import copy
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 from infracrawl.services.http_service import HttpService
 from infracrawl.services.html_text_extractor import HtmlTextExtractor, TextExtractor
 from infracrawl.repository.pages import PagesRepository
 from infracrawl.domain.crawl_session import CrawlSession
 from infracrawl.domain.page import Page as DomainPage
+from infracrawl.utils.content_type import is_text_content_type
+from infracrawl.utils.simhash import simhash
 import hashlib
 
 logger = logging.getLogger(__name__)
@@ -63,12 +66,7 @@ class PageFetchPersistService:
     def should_persist(self, response, url: str) -> bool:
         """Decide whether a fetched response should be persisted based on content-type."""
         ct = (getattr(response, "content_type", None) or "").lower()
-        is_supported = (
-            ct.startswith("text/")
-            or "text/html" in ct
-            or "application/xhtml+xml" in ct
-            or ct == ""
-        )
+        is_supported = is_text_content_type(ct)
         if not is_supported:
             logger.info("Content type not supported %s. Skipping %s", ct or "unknown", url)
         return is_supported
@@ -76,10 +74,22 @@ class PageFetchPersistService:
     def extract_and_persist(
         self,
         page: DomainPage,
+        near_duplicate_distance: Optional[int] = None,
+        store_near_duplicates: bool = True,
+        revisit_interval: Optional[Callable[[int, int, float], float]] = None,
     ) -> bool:
         """Extract text from page content, persist it, and mutate page in-place.
-        
-        Mutates: page.plain_text, page.filtered_plain_text, page.content_hash, page.page_id, page.fetched_at
+
+        When `near_duplicate_distance` is set, the page's SimHash is compared
+        against other pages of the same config; on a match `page.near_duplicate_of`
+        is set. With `store_near_duplicates=False` such a page is recorded as
+        fetched (status, fingerprint) but its bodies are not stored; the
+        in-memory page keeps them so its links can still be followed.
+        `revisit_interval` schedules the page's next visit from its change
+        history (see `PagesRepository.upsert_page`).
+
+        Mutates: page.plain_text, page.filtered_plain_text, page.content_hash, page.simhash,
+                 page.near_duplicate_of, page.page_id, page.fetched_at
         Returns: True on success, False on failure
         """
         if page.page_content is None:
@@ -95,13 +105,33 @@ class PageFetchPersistService:
         page.plain_text = plain
         page.filtered_plain_text = filtered
         page.content_hash = content_hash
+        page.simhash = simhash(base_for_hash)
         page.config_id = config_id
         if page.fetched_at is None:
             page.fetched_at = datetime.now(timezone.utc)
+
+        page.near_duplicate_of = None
+        to_store = page
+        if near_duplicate_distance is not None and page.simhash is not None and config_id is not None:
+            try:
+                match = self.pages_repo.find_near_duplicate(
+                    config_id, page.simhash, near_duplicate_distance, exclude_url=page.page_url
+                )
+            except Exception:
+                logger.exception("Near-duplicate lookup failed for %s", page.page_url)
+                match = None
+            if match is not None:
+                page.near_duplicate_of = match.page_id
+                logger.info("Near-duplicate of page_id=%s: %s", match.page_id, page.page_url)
+                if not store_near_duplicates:
+                    to_store = copy.copy(page)
+                    to_store.page_content = ""
+                    to_store.plain_text = None
+                    to_store.filtered_plain_text = None
         
         # Persist and get page_id
         try:
-            persisted_page = self.pages_repo.upsert_page(page)
+            persisted_page = self.pages_repo.upsert_page(to_store, revisit_interval=revisit_interval)
             page.page_id = persisted_page.page_id
             return True
         except Exception as e:
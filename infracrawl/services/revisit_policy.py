@@ -0,0 +1,73 @@
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from infracrawl.domain.crawl_budget import parse_duration_seconds
+
+DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class RevisitPolicy:
+    """Per-page revisit intervals estimated from each page's change history.
+
+    Every refetch of a page is a check; it counts as a change when the
+    content hash differs from the previous fetch. With n checks, X changes
+    and a mean check interval I, the change rate is estimated as
+
+        rate = -ln((n - X + 0.5) / (n + 0.5)) / I
+
+    (Cho & Garcia-Molina's bias-reduced estimator for pages that may change
+    several times between checks). The page is next due after 1 / rate,
+    clamped to [min_interval, max_interval] and at most twice the mean
+    observed interval, so an unchanged page backs off geometrically instead
+    of jumping straight to max_interval. Built from the optional `revisit`
+    section of a crawler YAML:
+
+        revisit:                  # or just `revisit: true`
+          initial_interval: 7d    # before a page has history (default: refresh_days)
+          min_interval: 1d
+          max_interval: 90d
+    """
+
+    enabled: bool = False
+    initial_seconds: float = 7 * DAY
+    min_seconds: float = DAY
+    max_seconds: float = 90 * DAY
+
+    @classmethod
+    def from_options(cls, options, refresh_days: Optional[int] = None) -> "RevisitPolicy":
+        if not options:
+            return cls()
+        initial = float(refresh_days) * DAY if refresh_days else cls.initial_seconds
+        if options is True:  # `revisit: true`
+            return cls(enabled=True, initial_seconds=initial)
+        min_seconds = parse_duration_seconds(options.get("min_interval")) or cls.min_seconds
+        max_seconds = parse_duration_seconds(options.get("max_interval")) or cls.max_seconds
+        if min_seconds > max_seconds:
+            raise ValueError("revisit min_interval must not exceed max_interval")
+        return cls(
+            enabled=bool(options.get("enabled", True)),
+            initial_seconds=parse_duration_seconds(options.get("initial_interval")) or initial,
+            min_seconds=min_seconds,
+            max_seconds=max_seconds,
+        )
+
+    @classmethod
+    def for_config(cls, config) -> "RevisitPolicy":
+        if config is None:
+            return cls()
+        return cls.from_options(getattr(config, "revisit_options", None), getattr(config, "refresh_days", None))
+
+    def _clamp(self, seconds: float) -> float:
+        return min(max(seconds, self.min_seconds), self.max_seconds)
+
+    def interval(self, checks: int, changes: int, observed_seconds: float) -> float:
+        """Seconds until the page should be fetched again."""
+        if checks <= 0 or observed_seconds <= 0:
+            return self._clamp(self.initial_seconds)
+        mean = observed_seconds / checks
+        changes = min(max(changes, 0), checks)
+        rate = -math.log((checks - changes + 0.5) / (checks + 0.5)) / mean
+        estimate = 1.0 / rate if rate > 0 else math.inf
+        return self._clamp(min(estimate, 2 * mean))
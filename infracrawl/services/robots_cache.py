@@ -1,19 +1,21 @@
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
-from urllib.robotparser import RobotFileParser
+
+from infracrawl.services.robots_rules import RobotsRules
 
 
 @dataclass(frozen=True)
 class _RobotsCacheEntry:
-    parser: Optional[RobotFileParser]
+    parser: Optional[RobotsRules]
     stored_at: float
 
 
 class RobotsCache:
     """
-    Cache for RobotFileParser instances keyed by domain base URL.
+    Cache for compiled RobotsRules keyed by domain base URL.
     
     Extracted from RobotsService to follow Single Responsibility Principle.
     This class focuses solely on caching, making it easier to:
@@ -39,6 +41,8 @@ class RobotsCache:
             self._ttl_seconds = 0
 
         self._cache: "OrderedDict[str, _RobotsCacheEntry]" = OrderedDict()
+        # Crawl threads and robots.txt prefetch threads share the cache
+        self._lock = threading.Lock()
 
     def _is_expired(self, entry: _RobotsCacheEntry) -> bool:
         if self._ttl_seconds == 0:
@@ -49,27 +53,31 @@ class RobotsCache:
         while len(self._cache) > self._max_size:
             self._cache.popitem(last=False)
     
-    def get(self, base_url: str) -> Optional[RobotFileParser]:
-        """Get cached parser for a domain, or None if not cached."""
-        entry = self._cache.get(base_url)
-        if entry is None:
-            return None
-        if self._is_expired(entry):
-            try:
+    def get(self, base_url: str, default=None) -> Optional[RobotsRules]:
+        """Get cached rules for a domain, or `default` if not cached.
+
+        A cached failed fetch returns None, so pass a sentinel `default` to
+        tell it apart from a miss.
+        """
+        with self._lock:
+            entry = self._cache.get(base_url)
+            if entry is None:
+                return default
+            if self._is_expired(entry):
                 del self._cache[base_url]
-            except KeyError:
-                pass
-            return None
-        # Refresh LRU order on hit
-        self._cache.move_to_end(base_url)
-        return entry.parser
+                return default
+            # Refresh LRU order on hit
+            self._cache.move_to_end(base_url)
+            return entry.parser
     
-    def set(self, base_url: str, parser: Optional[RobotFileParser]) -> None:
-        """Cache a parser for a domain. None indicates fetch failed."""
-        self._cache[base_url] = _RobotsCacheEntry(parser=parser, stored_at=time.time())
-        self._cache.move_to_end(base_url)
-        self._evict_if_needed()
+    def set(self, base_url: str, parser: Optional[RobotsRules]) -> None:
+        """Cache rules for a domain. None indicates fetch failed."""
+        with self._lock:
+            self._cache[base_url] = _RobotsCacheEntry(parser=parser, stored_at=time.time())
+            self._cache.move_to_end(base_url)
+            self._evict_if_needed()
     
     def clear(self) -> None:
         """Clear entire cache. Useful for testing or manual cache invalidation."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
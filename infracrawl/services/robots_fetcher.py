@@ -1,10 +1,20 @@
-from urllib.robotparser import RobotFileParser
+import logging
+from typing import NamedTuple, Optional
 
 from infracrawl.exceptions import HttpFetchError
+from infracrawl.services.robots_rules import RobotsRules
+
+
+class RobotsFetchResult(NamedTuple):
+    """Outcome of a robots.txt request; status 304 means the cached copy is still valid."""
+    status_code: int
+    body: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class RobotsFetcher:
-    """Fetch robots.txt content and return a parsed RobotFileParser or None.
+    """Fetch robots.txt content and return compiled RobotsRules or None.
 
     Uses an `http_service` with a `fetch_robots(url)` method that returns
     an HttpResponse.
@@ -12,22 +22,35 @@ class RobotsFetcher:
     def __init__(self, http_service):
         self.http_service = http_service
 
-    def fetch(self, robots_url: str):
-        import logging
+    def fetch_conditional(
+        self,
+        robots_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[RobotsFetchResult]:
+        """Fetch robots.txt, revalidating a cached copy when validators are given.
 
+        Returns None on network errors. The body is kept for 2xx responses only.
+        """
         try:
-            response = self.http_service.fetch_robots(robots_url)
+            if etag or last_modified:
+                response = self.http_service.fetch_robots(robots_url, etag=etag, last_modified=last_modified)
+            else:
+                response = self.http_service.fetch_robots(robots_url)
         except HttpFetchError:
             logging.exception("Network error fetching robots.txt from %s", robots_url)
             return None
 
-        if response.status_code != 200 or not response.text:
-            return None
-
-        try:
-            robots_parser = RobotFileParser()
-            robots_parser.parse(response.text.splitlines())
-            return robots_parser
-        except Exception:
-            logging.exception("Error parsing robots.txt from %s", robots_url)
+        headers = getattr(response, "headers", None) or {}
+        return RobotsFetchResult(
+            status_code=response.status_code,
+            body=response.text if 200 <= response.status_code < 300 else None,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+    def fetch(self, robots_url: str, user_agent: str = "*") -> Optional[RobotsRules]:
+        result = self.fetch_conditional(robots_url)
+        if result is None or result.status_code != 200 or not result.body:
             return None
+        return RobotsRules.parse(result.body, user_agent)
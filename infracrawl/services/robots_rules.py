@@ -0,0 +1,125 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+# Characters left as-is when normalizing rule paths and URL paths, so that
+# `/a%2Fb`, `/a/b` and `/%61/b` compare the way the server would see them.
+_SAFE = "/?=&;:@+,!~'()*$[]"
+_END = ""  # trie key holding a rule's verdict (never a path character)
+
+
+def _normalize(path: str) -> str:
+    return quote(unquote(path), safe=_SAFE)
+
+
+def product_token(user_agent: str) -> str:
+    """The crawler name robots.txt groups are matched against: `InfraCrawl/0.1` -> `infracrawl`."""
+    match = re.match(r"[A-Za-z_-]+", (user_agent or "").strip())
+    return match.group(0).lower() if match else "*"
+
+
+class RobotsRules:
+    """robots.txt rules of one site, compiled for one user agent.
+
+    Follows RFC 9309 (and Google's handling): the group naming the crawler's
+    product token applies, else the `*` group; groups repeated for the same
+    agent are merged. For a path the longest matching rule wins, `Allow` on
+    a tie; no matching rule means allowed. `*` matches any run of characters
+    and a trailing `$` anchors the end.
+
+    Plain prefix rules, the common case, live in a character trie, so a
+    check walks the path once instead of scanning every rule; wildcard rules
+    are regexes tried longest first, only while they can still beat the best
+    prefix match.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, bool]] = (), sitemaps: Iterable[str] = ()):
+        self.sitemaps: List[str] = list(sitemaps)
+        self._trie: dict = {}
+        self._patterns: List[Tuple[int, bool, "re.Pattern[str]"]] = []
+        self.rule_count = 0
+        for path, allow in rules:
+            self._add(_normalize(path), allow)
+        # Longest first; Allow before Disallow at equal length
+        self._patterns.sort(key=lambda p: (-p[0], not p[1]))
+
+    def _add(self, path: str, allow: bool) -> None:
+        self.rule_count += 1
+        body = path[:-1] if path.endswith("$") else path
+        if "*" not in body and not path.endswith("$"):
+            node = self._trie
+            for ch in path:
+                node = node.setdefault(ch, {})
+            # Allow wins over Disallow for the same path
+            node[_END] = node.get(_END, False) or allow
+            return
+        regex = ".*".join(re.escape(part) for part in body.split("*"))
+        if path.endswith("$"):
+            regex += r"\Z"
+        self._patterns.append((len(path), allow, re.compile(regex)))
+
+    @classmethod
+    def parse(cls, body: Optional[str], user_agent: str = "*") -> "RobotsRules":
+        """Compile the rules of `body` that apply to `user_agent`."""
+        token = product_token(user_agent)
+        groups: List[Tuple[List[str], List[Tuple[str, bool]]]] = []
+        sitemaps: List[str] = []
+        in_rules = True  # a user-agent line after rules starts a new group
+        for raw in (body or "").splitlines():
+            line = raw.split("#", 1)[0].strip()
+            if ":" not in line:
+                continue
+            key, value = (part.strip() for part in line.split(":", 1))
+            key = key.lower()
+            if key in ("user-agent", "useragent"):
+                if in_rules:
+                    groups.append(([], []))
+                    in_rules = False
+                groups[-1][0].append(value.lower())
+            elif key in ("allow", "disallow"):
+                # Rules before the first user-agent line belong to no group
+                if groups:
+                    in_rules = True
+                    if value:  # an empty `Disallow:` allows everything
+                        groups[-1][1].append((value, key == "allow"))
+            elif key == "sitemap" and value:
+                sitemaps.append(value)
+
+        matched = [group for group in groups if token in group[0]]
+        if not matched:
+            matched = [group for group in groups if "*" in group[0]]
+        return cls([rule for _, rules in matched for rule in rules], sitemaps)
+
+    def _path_of(self, url: str) -> str:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        return _normalize(path)
+
+    def allowed(self, url: str) -> bool:
+        """Whether the compiled user agent may fetch `url` (absolute URL or path)."""
+        path = self._path_of(url)
+        if path == "/robots.txt":
+            return True
+
+        best_len, verdict = -1, True
+        node = self._trie
+        for depth, ch in enumerate(path):
+            node = node.get(ch)
+            if node is None:
+                break
+            if _END in node:
+                best_len, verdict = depth + 1, node[_END]
+
+        for length, allow, pattern in self._patterns:
+            if length < best_len or (length == best_len and not (allow and not verdict)):
+                break
+            if pattern.match(path):
+                if length > best_len or allow:
+                    best_len, verdict = length, allow
+                break
+        return verdict
+
+    def site_maps(self) -> List[str]:
+        return list(self.sitemaps)
@@ -1,49 +1,204 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 import logging
-from typing import Optional
+import threading
+import zlib
+from typing import Iterable, List, Optional
 
 from infracrawl.services.robots_fetcher import RobotsFetcher
 from infracrawl.services.robots_cache import RobotsCache
+from infracrawl.services.robots_rules import RobotsRules
+from infracrawl.utils.datetime_utils import parse_to_utc_naive
+
+_MISSING = object()
+_LOCK_STRIPES = 64
 
 
 class RobotsService:
     """
     Service for checking robots.txt permissions.
-    
+
     Orchestrates fetching, caching, and permission checking for robots.txt files.
     Cache is now injectable for testing and independent cache strategy changes.
+    Each host's rules are compiled once for `user_agent` (see RobotsRules)
+    and cached compiled.
+
+    With a `store` (RobotsTxtRepository), robots.txt is also kept in the
+    database for `ttl_seconds`, shared by every process; an expired copy is
+    revalidated with a conditional GET, and kept in use while the site is
+    unreachable. `prefetch()` loads robots.txt for new hosts on background
+    threads so crawl threads find it cached.
     """
-    
-    def __init__(self, http_service, user_agent: str, 
+
+    def __init__(self, http_service, user_agent: str,
                  robots_fetcher: Optional[RobotsFetcher] = None,
-                 cache: Optional[RobotsCache] = None):
+                 cache: Optional[RobotsCache] = None,
+                 store=None,
+                 ttl_seconds: int = 86400,
+                 prefetch_workers: int = 8):
         # Backwards-compatible: callers may still pass an http_service with fetch_robots
         self.http_service = http_service
         self.user_agent = user_agent
         self.robots_fetcher = robots_fetcher if robots_fetcher is not None else RobotsFetcher(http_service)
         self.cache = cache if cache is not None else RobotsCache()
+        self.store = store
+        self.ttl_seconds = max(0, int(ttl_seconds))
+        self.prefetch_workers = max(1, int(prefetch_workers))
+        # One fetch per host at a time, whether from a crawl or a prefetch thread
+        self._locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._prefetching: set = set()
+        self._prefetch_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _base(url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _parser_for(self, base: str):
+        robots_parser = self.cache.get(base, _MISSING)
+        if robots_parser is not _MISSING:
+            return robots_parser
+        with self._locks[zlib.crc32(base.encode()) % _LOCK_STRIPES]:
+            # Another thread may have loaded it while we waited
+            robots_parser = self.cache.get(base, _MISSING)
+            if robots_parser is _MISSING:
+                robots_parser = self._load(base)
+                self.cache.set(base, robots_parser)
+        return robots_parser
+
+    def _load(self, base: str):
+        robots_url = urljoin(base, "/robots.txt")
+        if self.store is None:
+            return self.robots_fetcher.fetch(robots_url, self.user_agent)
+
+        stored = self._stored(base)
+        now = datetime.utcnow()
+        if stored is not None and parse_to_utc_naive(stored["expires_at"]) > now:
+            return self._parser_from(stored)
+
+        result = self.robots_fetcher.fetch_conditional(
+            robots_url,
+            etag=stored["etag"] if stored else None,
+            last_modified=stored["last_modified"] if stored else None,
+        )
+        if result is None or result.status_code >= 500:
+            # Site unreachable: keep using the last known copy, if any
+            return self._parser_from(stored) if stored is not None else None
+
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+        try:
+            if result.status_code == 304 and stored is not None:
+                self.store.extend(base, now, expires_at)
+                return self._parser_from(stored)
+            self.store.save(base, result.status_code, result.body, result.etag, result.last_modified, now, expires_at)
+        except Exception:
+            logging.exception("Could not store robots.txt of %s", base)
+        return self._compile(result.body) if result.status_code == 200 else None
+
+    def _stored(self, base: str) -> Optional[dict]:
+        try:
+            return self.store.get(base)
+        except Exception:
+            logging.exception("Could not read stored robots.txt of %s", base)
+            return None
+
+    def _compile(self, body: Optional[str]) -> Optional[RobotsRules]:
+        return RobotsRules.parse(body, self.user_agent) if body else None
+
+    def _parser_from(self, stored: dict) -> Optional[RobotsRules]:
+        return self._compile(stored["body"]) if stored["status_code"] == 200 else None
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Load robots.txt for the URLs' hosts in the background; returns immediately.
+
+        Hosts already cached or being loaded are skipped, so this is cheap
+        to call with every batch of discovered links.
+        """
+        for url in urls:
+            base = self._base(url)
+            if base is None or self.cache.get(base, _MISSING) is not _MISSING:
+                continue
+            with self._prefetch_lock:
+                if base in self._prefetching:
+                    continue
+                self._prefetching.add(base)
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.prefetch_workers,
+                        thread_name_prefix="robots-prefetch",
+                    )
+                self._executor.submit(self._prefetch_one, base)
+
+    def _prefetch_one(self, base: str) -> None:
+        try:
+            self._parser_for(base)
+        except Exception:
+            logging.exception("Error prefetching robots.txt of %s", base)
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(base)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop prefetch threads; pending prefetches are dropped."""
+        with self._prefetch_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def sitemaps(self, base: str) -> List[str]:
+        """`Sitemap:` URLs listed in the robots.txt of `base` (scheme://host)."""
+        robots_parser = self._parser_for(base)
+        if robots_parser is None:
+            return []
+        return list(robots_parser.site_maps() or [])
 
     def allowed_by_robots(self, url: str, robots_enabled: bool) -> bool:
         if not robots_enabled:
             return True
 
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
+        base = self._base(url)
+        if base is None:
             # Fail open: invalid/relative URLs should not block crawling.
             return True
 
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        robots_parser = self.cache.get(base)
-        if robots_parser is None:
-            robots_url = urljoin(base, "/robots.txt")
-            robots_parser = self.robots_fetcher.fetch(robots_url)
-            self.cache.set(base, robots_parser)
+        return self._allowed(self._parser_for(base), url)
 
-        if robots_parser is None:
-            return True
+    def filter_allowed(self, urls: Iterable[str], robots_enabled: bool, cached_only: bool = False) -> List[str]:
+        """Drop the URLs robots.txt disallows, looking up each host's rules once.
+
+        With `cached_only`, hosts whose rules are not cached yet are kept
+        unchecked instead of fetching robots.txt (it is prefetched instead).
+        """
+        urls = list(urls)
+        if not robots_enabled:
+            return urls
+        rules_by_base = {}
+        allowed = []
+        for url in urls:
+            base = self._base(url)
+            if base is None:
+                allowed.append(url)
+                continue
+            if base not in rules_by_base:
+                if cached_only:
+                    rules_by_base[base] = self.cache.get(base, _MISSING)
+                else:
+                    rules_by_base[base] = self._parser_for(base)
+            rules = rules_by_base[base]
+            if rules is _MISSING or self._allowed(rules, url):
+                allowed.append(url)
+        return allowed
 
+    @staticmethod
+    def _allowed(rules: Optional[RobotsRules], url: str) -> bool:
+        if rules is None:
+            return True
         try:
-            return robots_parser.can_fetch(self.user_agent, url)
+            return rules.allowed(url)
         except Exception:
             logging.exception("Error checking robots permission for %s", url)
             return True
@@ -4,6 +4,14 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def _stop_reason(result) -> Optional[str]:
+    """`CrawlResult.stop_reason`, tolerating callbacks that return nothing."""
+    reason = getattr(result, "stop_reason", None)
+    if reason is not None:
+        logger.info("Crawl ended early: %s", reason)
+    return reason if isinstance(reason, str) else None
+
+
 class ScheduledCrawlJobRunner:
     """Runs a crawl for a given config path and tracks it in the registry + DB.
 
@@ -58,14 +66,14 @@ class ScheduledCrawlJobRunner:
 
             try:
                 # Call crawl callback with session (may block; scheduler runs worker thread).
-                self.start_crawl_callback(session)
+                result = self.start_crawl_callback(session)
 
                 # Finish registry tracking via session
                 session.finish_tracking(status="finished")
 
                 if run_id is not None and self.crawls_repo is not None:
                     try:
-                        self.crawls_repo.finish_run(run_id)
+                        self.crawls_repo.finish_run(run_id, stop_reason=_stop_reason(result))
                     except Exception:
                         logger.exception("Could not finish run record for %s run=%s", cfg_path, run_id)
 
@@ -123,14 +131,14 @@ class ScheduledCrawlJobRunner:
 
             try:
                 # Execute crawl with resumed session
-                self.start_crawl_callback(session)
+                result = self.start_crawl_callback(session)
 
                 # Finish registry tracking via session
                 session.finish_tracking(status="finished")
 
                 if run_id is not None and self.crawls_repo is not None:
                     try:
-                        self.crawls_repo.finish_run(run_id)
+                        self.crawls_repo.finish_run(run_id, stop_reason=_stop_reason(result))
                     except Exception:
                         logger.exception("Could not finish run record for %s run=%s", cfg_path, run_id)
                 logger.info("Resumed crawl job finished for %s", cfg_path)
@@ -46,6 +46,10 @@ class SchedulerService:
         recovery_within_seconds: Optional[int] = None,
         recovery_message: str = "job found incomplete on startup",
         pages_repo=None,
+        config_stats_repo=None,
+        stats_reconcile_interval_seconds: int = 3600,
+        job_queue=None,
+        crawl_execution: str = "inline",
     ):
         self.config_service = config_provider
         self.session_factory = session_factory
@@ -56,6 +60,12 @@ class SchedulerService:
         self._recovery_mode = (recovery_mode or "restart").strip().lower()
         self._recovery_within_seconds = recovery_within_seconds
         self._recovery_message = recovery_message
+        self.config_stats_repo = config_stats_repo
+        self._stats_reconcile_interval = int(stats_reconcile_interval_seconds or 0)
+        # Shared CrawlJobQueue; when unset, crawls run on the calling thread.
+        self.job_queue = job_queue
+        # "worker": crawls run in worker.py processes, which recover their own jobs
+        self._crawl_execution = (crawl_execution or "inline").strip().lower()
 
         # Build pages repo if not provided and we have a session factory
         self.pages_repo = pages_repo or (PagesRepository(self.session_factory) if self.session_factory else None)
@@ -75,7 +85,7 @@ class SchedulerService:
         )
         # Wire resume callback so recovery can trigger an actual resumed job
         try:
-            self._recovery._resume_callback = lambda cfg: self._job_runner.run_config_resume(cfg)  # type: ignore[attr-defined]
+            self._recovery._resume_callback = self._resume_config  # type: ignore[attr-defined]
         except Exception:
             logger.exception("Failed wiring resume callback into recovery")
 
@@ -112,6 +122,19 @@ class SchedulerService:
         except Exception:
             logger.exception("Could not schedule config watcher")
 
+        # periodically recompute config_stats counters from base tables to fix drift
+        if self.config_stats_repo is not None and self._stats_reconcile_interval > 0:
+            try:
+                self._sched.add_job(
+                    self._run_stats_reconcile,
+                    trigger=IntervalTrigger(seconds=self._stats_reconcile_interval),
+                    id="config_stats_reconcile",
+                    replace_existing=True,
+                )
+                logger.info("Scheduled config stats reconcile every %s seconds", self._stats_reconcile_interval)
+            except Exception:
+                logger.exception("Could not schedule config stats reconcile")
+
     def _recover_incomplete_runs_on_startup(self):
         """Best-effort recovery for service disruptions.
 
@@ -121,6 +144,11 @@ class SchedulerService:
         mode_norm = (self._recovery_mode or "restart").strip().lower()
         if mode_norm in {"off", "0", "false", "none"}:
             return
+        if self._crawl_execution == "worker":
+            # Open runs may belong to live workers; jobs of dead workers are
+            # requeued by the workers themselves (CrawlWorker._requeue_stale)
+            logger.info("Crawls run in worker processes; skipping startup recovery in the API")
+            return
         
         logger.info("Checking for jobs to restart")
         self._recovery.recover()
@@ -175,7 +203,25 @@ class SchedulerService:
         """Execute a scheduled crawl job for the given config path."""
         # When APScheduler calls this job, we perform the same logic as the
         # HTTP `/crawl` endpoint.
-        self._job_runner.run(cfg_path)
+        if self.job_queue is None:
+            self._job_runner.run(cfg_path)
+            return
+        self.job_queue.submit(cfg_path, self._job_runner.run, cfg_path, kind="scheduled")
+
+    def _resume_config(self, cfg):
+        """Recovery callback: resume an interrupted run (queued behind manual/scheduled crawls)."""
+        if self.job_queue is None:
+            self._job_runner.run_config_resume(cfg)
+            return
+        self.job_queue.submit(cfg.config_path, self._job_runner.run_config_resume, cfg, kind="recovery")
+
+    def _run_stats_reconcile(self):
+        """Periodic job: recompute per-config counters from pages/links."""
+        try:
+            config_ids = self.config_stats_repo.reconcile_all()
+            logger.info("Reconciled config stats for %d configs", len(config_ids))
+        except Exception:
+            logger.exception("Unhandled error in config stats reconcile")
 
     def _run_config_watcher(self):
         """Periodic job: sync configs on disk with DB and reload scheduled crawl jobs."""
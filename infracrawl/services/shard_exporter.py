@@ -0,0 +1,230 @@
+"""Offline, sharded, resumable page export (used by `export.py`).
+
+A config's pages are split into N contiguous `page_id` ranges. Each shard is
+written by its own process straight from a server-side cursor. Output is
+appended in segments; after each segment the file is fsynced and a JSON
+checkpoint records the last exported `page_id` and the byte offset. A
+restarted export truncates the shard file to that offset and continues after
+that `page_id`. The checkpoint also records the shard's page_id range, format
+and fields; a checkpoint written for different ones restarts the shard.
+
+Segments are self-contained gzip members (NDJSON) or whole gzipped WARC
+records, so a shard file cut at any checkpoint is still valid.
+"""
+import json
+import logging
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from infracrawl.services.export_writers import WARC_FIELDS, warc_response_record, warc_stream
+
+logger = logging.getLogger(__name__)
+
+SHARD_FORMATS = ("ndjson", "warc")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    name: str
+    config_id: Optional[int]
+    index: int
+    count: int
+    min_page_id: int  # inclusive
+    max_page_id: int  # inclusive
+
+    def filename(self, fmt: str, compress: bool) -> str:
+        if fmt == "warc":
+            ext = "warc.gz"
+        else:
+            ext = "ndjson.gz" if compress else "ndjson"
+        return f"shard-{self.index:04d}-of-{self.count:04d}.{ext}"
+
+
+def plan_shards(name: str, config_id: Optional[int], page_id_range: Optional[tuple[int, int]], shards: int) -> List[ShardSpec]:
+    """Split [min, max] page_id into up to `shards` contiguous, non-empty ranges."""
+    if page_id_range is None:
+        return []
+    lo, hi = page_id_range
+    span = hi - lo + 1
+    count = max(1, min(int(shards), span))
+    step, extra = divmod(span, count)
+    specs = []
+    start = lo
+    for i in range(count):
+        end = start + step - 1 + (1 if i < extra else 0)
+        specs.append(ShardSpec(name, config_id, i, count, start, end))
+        start = end + 1
+    return specs
+
+
+def _checkpoint_params(spec: ShardSpec, fmt: str, compress: bool, fields: Optional[Sequence[str]]) -> dict:
+    """What a checkpoint is only valid for; JSON-shaped so it compares equal after a reload."""
+    return {
+        "config_id": spec.config_id,
+        "min_page_id": spec.min_page_id,
+        "max_page_id": spec.max_page_id,
+        "format": fmt,
+        "compress": compress,
+        "fields": list(fields) if fields is not None else None,
+    }
+
+
+def _load_checkpoint(path: Path, spec: ShardSpec, params: dict) -> dict:
+    if path.exists():
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("params") == params:
+            return checkpoint
+        logger.warning("Checkpoint %s was written for a different shard or format; restarting the shard", path)
+    return {"params": params, "last_page_id": spec.min_page_id - 1, "bytes_written": 0, "rows": 0, "done": False}
+
+
+def _save_checkpoint(path: Path, checkpoint: dict) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def export_shard(
+    pages_repo,
+    spec: ShardSpec,
+    out_dir: Path,
+    *,
+    fmt: str = "ndjson",
+    compress: bool = True,
+    fields: Optional[Sequence[str]] = None,
+    checkpoint_every: int = 10_000,
+) -> dict:
+    """Export one shard, resuming from its checkpoint if present. Returns the final checkpoint."""
+    if fmt not in SHARD_FORMATS:
+        raise ValueError(f"unsupported shard format: {fmt}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    data_path = out_dir / spec.filename(fmt, compress)
+    ckpt_path = data_path.with_name(data_path.name + ".ckpt")
+    if fmt == "warc":
+        fields = WARC_FIELDS
+    checkpoint = _load_checkpoint(ckpt_path, spec, _checkpoint_params(spec, fmt, compress, fields))
+    if checkpoint.get("done"):
+        return checkpoint
+
+    rows = pages_repo.iter_pages(
+        config_id=spec.config_id,
+        after_page_id=checkpoint["last_page_id"],
+        max_page_id=spec.max_page_id,
+        fields=list(fields) if fields is not None else None,
+    )
+
+    with open(data_path, "r+b" if data_path.exists() else "wb") as out:
+        # Drop anything written after the last checkpoint (partial segment).
+        out.truncate(checkpoint["bytes_written"])
+        out.seek(checkpoint["bytes_written"])
+        if fmt == "warc" and checkpoint["bytes_written"] == 0:
+            out.write(next(warc_stream((), filename=data_path.name)))
+
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if (fmt == "ndjson" and compress) else None
+        in_segment = 0
+        last_page_id = checkpoint["last_page_id"]
+
+        def commit_segment():
+            nonlocal compressor, in_segment
+            if compressor is not None:
+                out.write(compressor.flush(zlib.Z_FINISH))
+                compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            out.flush()
+            os.fsync(out.fileno())
+            checkpoint.update(
+                last_page_id=last_page_id,
+                bytes_written=out.tell(),
+                rows=checkpoint["rows"] + in_segment,
+            )
+            _save_checkpoint(ckpt_path, checkpoint)
+            in_segment = 0
+
+        for row in rows:
+            if fmt == "warc":
+                data = warc_response_record(row) or b""
+            else:
+                data = (json.dumps(row, default=str) + "\n").encode("utf-8")
+                if compressor is not None:
+                    data = compressor.compress(data)
+            out.write(data)
+            last_page_id = row["page_id"]
+            in_segment += 1
+            if in_segment >= checkpoint_every:
+                commit_segment()
+
+        commit_segment()
+        checkpoint["done"] = True
+        _save_checkpoint(ckpt_path, checkpoint)
+
+    logger.info("Exported shard %s/%s of %s: %d rows", spec.index + 1, spec.count, spec.name, checkpoint["rows"])
+    return checkpoint
+
+
+def _export_shard_in_worker(database_url: str, spec: ShardSpec, out_dir: str, options: dict) -> dict:
+    """Process-pool entry point: build a private engine/repository and export one shard."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from infracrawl.repository.pages import PagesRepository
+
+    engine = create_engine(database_url)
+    try:
+        repo = PagesRepository(sessionmaker(bind=engine, future=True))
+        return export_shard(repo, spec, Path(out_dir), **options)
+    finally:
+        engine.dispose()
+
+
+def export_sharded(
+    database_url: str,
+    specs: Sequence[ShardSpec],
+    out_dir: Path,
+    *,
+    workers: Optional[int] = None,
+    **options,
+) -> dict:
+    """Export `specs` in parallel processes and write a manifest.json next to the shards.
+
+    Options are passed through to `export_shard` (fmt, compress, fields,
+    checkpoint_every). Returns the manifest.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs) or 1))
+    # spawn: each worker opens its own DB connections instead of inheriting the parent's pool
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        futures = {
+            pool.submit(_export_shard_in_worker, database_url, spec, str(out_dir), options): spec
+            for spec in specs
+        }
+        for fut in as_completed(futures):
+            spec = futures[fut]
+            results[spec.index] = fut.result()
+
+    fmt = options.get("fmt", "ndjson")
+    compress = options.get("compress", True)
+    manifest = {
+        "format": fmt,
+        "compress": compress,
+        "shards": [
+            {
+                **asdict(spec),
+                "file": spec.filename(fmt, compress),
+                "rows": results[spec.index]["rows"],
+                "bytes": results[spec.index]["bytes_written"],
+            }
+            for spec in sorted(specs, key=lambda s: s.index)
+        ],
+    }
+    with open(out_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
@@ -0,0 +1,251 @@
+import logging
+import re
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from infracrawl.exceptions import HttpFetchError
+from infracrawl.services.url_canonicalizer import UrlCanonicalizer
+from infracrawl.utils.datetime_utils import parse_to_utc_naive
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_FRACTION = re.compile(r"(\.\d+)")
+
+
+class SitemapEntry(NamedTuple):
+    kind: str  # "url" (a page) or "sitemap" (a nested sitemap in an index)
+    loc: str
+    lastmod: Optional[datetime] = None
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime `<lastmod>` (YYYY, YYYY-MM, YYYY-MM-DD or full) to UTC-naive."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    if len(value) == 4:
+        value += "-01-01"
+    elif len(value) == 7:
+        value += "-01"
+    # fromisoformat before 3.11 only takes 3 or 6 fractional digits
+    value = _FRACTION.sub(lambda m: m.group(1)[:7].ljust(7, "0"), value, count=1)
+    return parse_to_utc_naive(value)
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_sitemap(chunks: Iterable[bytes], max_bytes: int = 50 * 1024 * 1024) -> Iterator[SitemapEntry]:
+    """Stream `<url>` and `<sitemap>` entries out of a sitemap or sitemap index.
+
+    Accepts the body as byte chunks, gzip-compressed or not (detected from
+    the magic bytes), and never holds more than one entry's elements in
+    memory. Stops with ValueError after `max_bytes` of uncompressed XML
+    (the sitemap protocol's limit is 50MB), which also bounds gzip bombs.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    root = None
+    inflater = None
+    first = True
+    total = 0
+
+    def entries():
+        nonlocal root
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            tag = _local(elem.tag)
+            if tag not in ("url", "sitemap"):
+                continue
+            loc = lastmod = None
+            for child in elem:
+                name = _local(child.tag)
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = parse_lastmod(child.text)
+            if loc:
+                yield SitemapEntry(tag, loc, lastmod)
+            # Drop finished entries so memory stays flat on huge files
+            root.clear()
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if first:
+            first = False
+            if chunk[:2] == _GZIP_MAGIC:
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        data = inflater.decompress(chunk) if inflater is not None else chunk
+        total += len(data)
+        if total > max_bytes:
+            raise ValueError(f"sitemap larger than {max_bytes} bytes")
+        parser.feed(data)
+        yield from entries()
+    if inflater is not None:
+        parser.feed(inflater.flush())
+    parser.close()
+    yield from entries()
+
+
+@dataclass(frozen=True)
+class SitemapOptions:
+    """Per-config sitemap discovery settings.
+
+    Built from the optional `sitemap` section of a crawler YAML:
+
+        sitemap:                # or just `sitemap: true`
+          urls: [https://example.gov/sitemap_index.xml]  # in addition to robots.txt
+          robots: true        # read `Sitemap:` lines from robots.txt
+          max_urls: 50000     # page URLs taken per crawl
+          max_sitemaps: 100   # sitemap files fetched per crawl (index nesting included)
+    """
+
+    enabled: bool = False
+    urls: tuple[str, ...] = ()
+    robots: bool = True
+    max_urls: int = 50_000
+    max_sitemaps: int = 100
+
+    @classmethod
+    def from_options(cls, options: Optional[dict]) -> "SitemapOptions":
+        if not options:
+            return cls()
+        if options is True:  # `sitemap: true`
+            return cls(enabled=True)
+        return cls(
+            enabled=bool(options.get("enabled", True)),
+            urls=tuple(str(u) for u in (options.get("urls") or [])),
+            robots=bool(options.get("robots", True)),
+            max_urls=max(0, int(options.get("max_urls", 50_000))),
+            max_sitemaps=max(1, int(options.get("max_sitemaps", 100))),
+        )
+
+    @classmethod
+    def for_config(cls, config) -> "SitemapOptions":
+        options = getattr(config, "sitemap_options", None) if config is not None else None
+        return cls.from_options(options)
+
+
+class SitemapService:
+    """Seed a crawl's frontier from the sites' sitemaps.
+
+    Sitemaps are found in robots.txt `Sitemap:` lines (falling back to
+    `/sitemap.xml` when a host lists none) plus any configured URLs; indexes
+    are followed breadth-first. Page URLs on the roots' hosts are added in
+    batches as pending pages with their `<lastmod>`, minus those robots.txt
+    disallows when the config obeys it.
+    """
+
+    def __init__(self, http_service, robots_service, pages_repo, batch_size: int = 1000):
+        self.http_service = http_service
+        self.robots_service = robots_service
+        self.pages_repo = pages_repo
+        self.batch_size = int(batch_size)
+
+    def _start_urls(self, config, options: SitemapOptions) -> List[str]:
+        urls = list(options.urls)
+        bases = []
+        for root in config.root_urls or []:
+            parts = urlsplit(root)
+            base = f"{parts.scheme}://{parts.netloc}"
+            if parts.netloc and base not in bases:
+                bases.append(base)
+        for base in bases:
+            listed = []
+            if options.robots and self.robots_service is not None:
+                try:
+                    listed = self.robots_service.sitemaps(base)
+                except Exception:
+                    logger.exception("Could not read sitemaps from robots.txt of %s", base)
+            urls.extend(listed or [f"{base}/sitemap.xml"])
+        return list(dict.fromkeys(urls))
+
+    def iter_page_entries(self, config, options: Optional[SitemapOptions] = None, stop=None) -> Iterator[SitemapEntry]:
+        """Yield page entries from all of the config's sitemaps, following indexes."""
+        options = options or SitemapOptions.for_config(config)
+        queue = deque(self._start_urls(config, options))
+        seen = set(queue)
+        fetched = 0
+        while queue and fetched < options.max_sitemaps:
+            if stop is not None and stop():
+                return
+            sitemap_url = queue.popleft()
+            fetched += 1
+            try:
+                with self.http_service.stream(sitemap_url) as resp:
+                    if resp.status_code != 200:
+                        logger.info("Sitemap %s: HTTP %s", sitemap_url, resp.status_code)
+                        continue
+                    for entry in iter_sitemap(resp.chunks):
+                        if entry.kind == "sitemap":
+                            if entry.loc not in seen:
+                                seen.add(entry.loc)
+                                queue.append(entry.loc)
+                        else:
+                            yield entry
+            except (HttpFetchError, ParseError, ValueError, zlib.error) as e:
+                logger.warning("Skipping sitemap %s: %s", sitemap_url, e)
+        if queue:
+            logger.info("Sitemap limit reached; %d sitemap(s) not fetched", len(queue))
+
+    def seed(self, session, discovered_depth: int = 1) -> List[str]:
+        """Add sitemap URLs to the session's frontier.
+
+        Returns the already-fetched URLs whose lastmod is newer than their
+        last fetch, for the caller to refetch; unchanged pages are left alone.
+        """
+        config = session.config
+        options = SitemapOptions.for_config(config)
+        if not options.enabled or options.max_urls == 0:
+            return []
+
+        canonicalizer = UrlCanonicalizer.for_config(config)
+        hosts = {urlsplit(u).hostname for u in (config.root_urls or []) if urlsplit(u).hostname}
+        hosts.update(urlsplit(u).hostname for u in options.urls if urlsplit(u).hostname)
+
+        added = 0
+        changed: List[str] = []
+        batch: dict = {}
+
+        def flush():
+            entries = list(batch.items())
+            if config.robots and self.robots_service is not None:
+                allowed = set(self.robots_service.filter_allowed([url for url, _ in entries], True))
+                entries = [entry for entry in entries if entry[0] in allowed]
+            changed.extend(self.pages_repo.add_sitemap_urls(entries, config.config_id, discovered_depth))
+            batch.clear()
+
+        for entry in self.iter_page_entries(config, options, stop=session.is_stopped):
+            if urlsplit(entry.loc).hostname not in hosts:
+                continue
+            url = canonicalizer.canonicalize(entry.loc)
+            if url in batch:
+                continue
+            batch[url] = entry.lastmod
+            added += 1
+            if len(batch) >= self.batch_size:
+                flush()
+            if added >= options.max_urls:
+                break
+        if batch:
+            flush()
+
+        logger.info(
+            "Sitemaps for config %s: %d URLs seeded, %d changed since last fetch",
+            config.config_id,
+            added,
+            len(changed),
+        )
+        return changed
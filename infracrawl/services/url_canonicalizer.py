@@ -0,0 +1,125 @@
+import re
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Optional
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+# Tracking and session parameters that never change the page being served.
+# Short, ambiguous names such as `sid` are often real content keys, so configs
+# opt in to them through `canonicalize.drop_query_params`.
+DEFAULT_DROP_QUERY_PARAMS = (
+    "utm_*",
+    "gclid",
+    "fbclid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "sessionid",
+    "jsessionid",
+    "phpsessid",
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PERCENT_ESCAPE = re.compile(r"%[0-9a-fA-F]{2}")
+
+
+@dataclass(frozen=True)
+class CanonicalizationRules:
+    """Per-config URL canonicalization settings.
+
+    Built from the optional `canonicalize` section of a crawler YAML:
+
+        canonicalize:
+          drop_query_params: [sid, ref, "session_*"]   # added to the defaults
+          strip_trailing_slash: true
+          sort_query: true
+    """
+
+    drop_query_params: tuple[str, ...] = DEFAULT_DROP_QUERY_PARAMS
+    strip_trailing_slash: bool = False
+    sort_query: bool = True
+
+    @classmethod
+    def from_options(cls, options: Optional[dict]) -> "CanonicalizationRules":
+        if not options:
+            return cls()
+        extra = tuple(str(p).lower() for p in (options.get("drop_query_params") or []))
+        return cls(
+            drop_query_params=DEFAULT_DROP_QUERY_PARAMS + extra,
+            strip_trailing_slash=bool(options.get("strip_trailing_slash", False)),
+            sort_query=bool(options.get("sort_query", True)),
+        )
+
+
+class UrlCanonicalizer:
+    """Rewrite URLs into a canonical form so equivalent URLs map to one page.
+
+    Lowercases scheme and host, drops default ports and fragments, removes
+    tracking/session query parameters (and `;jsessionid=`-style path
+    parameters), optionally sorts the query and strips trailing slashes.
+    Non-HTTP(S) URLs are returned unchanged.
+    """
+
+    def __init__(self, rules: Optional[CanonicalizationRules] = None):
+        self.rules = rules or CanonicalizationRules()
+
+    @classmethod
+    def for_config(cls, config) -> "UrlCanonicalizer":
+        options = getattr(config, "canonicalize_options", None) if config is not None else None
+        return cls(CanonicalizationRules.from_options(options))
+
+    def _is_dropped(self, name: str) -> bool:
+        name = unquote_plus(name).lower()
+        return any(fnmatchcase(name, pattern) for pattern in self.rules.drop_query_params)
+
+    def _canonical_path(self, path: str) -> str:
+        if ";" in path:
+            segments = []
+            for segment in path.split("/"):
+                base, *params = segment.split(";")
+                kept = [p for p in params if not self._is_dropped(p.split("=", 1)[0])]
+                segments.append(";".join([base] + kept))
+            path = "/".join(segments)
+        path = _PERCENT_ESCAPE.sub(lambda m: m.group(0).upper(), path) or "/"
+        if self.rules.strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+        return path
+
+    def _canonical_query(self, query: str) -> str:
+        if not query:
+            return ""
+        pairs = [p for p in query.split("&") if p and not self._is_dropped(p.split("=", 1)[0])]
+        if self.rules.sort_query:
+            pairs.sort()
+        return "&".join(pairs)
+
+    def canonicalize(self, url: str) -> str:
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS or not parts.hostname:
+            return url
+
+        host = parts.hostname.rstrip(".")
+        if ":" in host:
+            host = f"[{host}]"
+        try:
+            port = parts.port
+        except ValueError:
+            return url
+        netloc = host if port in (None, _DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+        if parts.username is not None:
+            userinfo = parts.username + (f":{parts.password}" if parts.password is not None else "")
+            netloc = f"{userinfo}@{netloc}"
+
+        return urlunsplit((
+            scheme,
+            netloc,
+            self._canonical_path(parts.path),
+            self._canonical_query(parts.query),
+            "",
+        ))
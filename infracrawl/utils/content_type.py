@@ -0,0 +1,15 @@
+from typing import Optional
+
+
+def is_text_content_type(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header names a page InfraCrawl stores (text or HTML).
+
+    A missing header counts as text: many small sites omit it on HTML pages.
+    """
+    ct = (content_type or "").lower()
+    return (
+        ct.startswith("text/")
+        or "text/html" in ct
+        or "application/xhtml+xml" in ct
+        or ct == ""
+    )
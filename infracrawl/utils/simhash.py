@@ -0,0 +1,92 @@
+import hashlib
+import re
+from collections import Counter
+from typing import Iterable, Optional
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Bit-counting "lanes": a byte value at byte position p is spread so that
+# each of its bits i lands at bit (p * 8 + i) * _LANE_BITS of a Python int.
+# Multiplying by how often the value occurs and summing adds up all 64
+# per-bit counters with at most 8 * 256 big-int operations per document.
+# 32-bit lanes cannot overflow below ~4e9 features.
+_LANE_BITS = 32
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_SPREAD = [
+    [
+        sum(1 << ((byte_pos * 8 + bit) * _LANE_BITS) for bit in range(8) if value >> bit & 1)
+        for value in range(256)
+    ]
+    for byte_pos in range(8)
+]
+
+
+def _features(text: str, shingle_size: int) -> set[bytes]:
+    words = _WORD.findall(text.lower())
+    if len(words) < shingle_size:
+        return {" ".join(words).encode("utf-8")} if words else set()
+    return {
+        " ".join(words[i:i + shingle_size]).encode("utf-8")
+        for i in range(len(words) - shingle_size + 1)
+    }
+
+
+def _feature_hashes(features: Iterable[bytes]) -> Iterable[bytes]:
+    for feature in features:
+        yield hashlib.blake2b(feature, digest_size=8).digest()
+
+
+def simhash(text: Optional[str], shingle_size: int = 3) -> Optional[int]:
+    """Return the unsigned 64-bit SimHash of `text`, or None if it has no words.
+
+    Features are distinct word `shingle_size`-grams, so pages that differ
+    only in a date stamp or a rotating banner differ in a few features and
+    their fingerprints end up a small Hamming distance apart.
+    """
+    if not text:
+        return None
+    features = _features(text, shingle_size)
+    if not features:
+        return None
+
+    digests = b"".join(_feature_hashes(features))
+    total = 0
+    for byte_pos, spread in enumerate(_SPREAD):
+        for value, count in Counter(digests[byte_pos::8]).items():
+            total += spread[value] * count
+
+    # Bit i is set when more than half of the features have it set
+    half = len(features) / 2
+    fingerprint = 0
+    for i in range(SIMHASH_BITS):
+        if (total >> (i * _LANE_BITS)) & _LANE_MASK > half:
+            fingerprint |= 1 << i
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def simhash_bands(fingerprint: int) -> tuple[int, ...]:
+    """Split a fingerprint into SIMHASH_BANDS 16-bit bands.
+
+    Two fingerprints within Hamming distance SIMHASH_BANDS - 1 share at least
+    one identical band (pigeonhole), so an equality lookup on the indexed band
+    columns finds every such candidate.
+    """
+    return tuple((fingerprint >> (i * BAND_BITS)) & _BAND_MASK for i in range(SIMHASH_BANDS))
+
+
+def to_signed64(value: int) -> int:
+    """Unsigned 64-bit -> signed (Postgres BIGINT) representation."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def from_signed64(value: int) -> int:
+    return value & ((1 << 64) - 1)
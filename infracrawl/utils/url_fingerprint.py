@@ -0,0 +1,20 @@
+import hashlib
+
+
+def url_fingerprint(url: str) -> int:
+    """Return a stable unsigned 64-bit fingerprint for `url`.
+
+    Uses the first 8 bytes of the MD5 digest so the same value can be
+    reproduced inside Postgres (`md5()`), which keeps fingerprints stored in
+    the database comparable with fingerprints computed in Python.
+    """
+    return int.from_bytes(hashlib.md5(url.encode("utf-8")).digest()[:8], "big")
+
+
+def url_hash(url: str) -> int:
+    """Return the signed 64-bit form of `url_fingerprint`, as stored in `pages.url_hash`.
+
+    Postgres BIGINT is signed; the SQL equivalent is
+    `('x' || substr(md5(page_url), 1, 16))::bit(64)::bigint`.
+    """
+    return int.from_bytes(hashlib.md5(url.encode("utf-8")).digest()[:8], "big", signed=True)
@@ -0,0 +1,26 @@
+-- Migration: Add a fixed-width url_hash column for URL lookups
+-- url_hash is the first 8 bytes of md5(page_url) as a signed BIGINT, matching
+-- infracrawl.utils.url_fingerprint.url_hash(). Lookups filter on url_hash and
+-- recheck page_url, so collisions are harmless.
+--
+-- The B-tree on page_url (UNIQUE constraint plus the redundant idx_pages_url)
+-- grows with URL length; it is replaced by an 8-byte B-tree on url_hash and a
+-- hash-index exclusion constraint that keeps page_url unique.
+
+BEGIN;
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS url_hash BIGINT;
+
+UPDATE pages
+SET url_hash = ('x' || substr(md5(page_url), 1, 16))::bit(64)::bigint
+WHERE url_hash IS NULL;
+
+ALTER TABLE pages ALTER COLUMN url_hash SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_pages_url_hash ON pages (url_hash);
+
+ALTER TABLE pages ADD CONSTRAINT pages_page_url_excl EXCLUDE USING hash (page_url WITH =);
+ALTER TABLE pages DROP CONSTRAINT IF EXISTS pages_page_url_key;
+DROP INDEX IF EXISTS idx_pages_url;
+
+COMMIT;
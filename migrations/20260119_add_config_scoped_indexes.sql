@@ -0,0 +1,26 @@
+-- Migration: Composite indexes for config-scoped page and link queries
+-- Built CONCURRENTLY so existing crawls keep writing while they build; this
+-- file must therefore not be wrapped in a transaction.
+
+-- Fetched pages per config, newest first:
+--   get_recent_fetched_urls_by_config (ORDER BY fetched_at DESC, page_id DESC),
+--   get_fetched_page_ids_by_config, count_fetched_pages_by_config
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_fetched
+  ON pages (config_id, fetched_at DESC, page_id DESC)
+  WHERE page_content IS NOT NULL;
+
+-- Content dedup probe in upsert_page: WHERE config_id = ? AND content_hash = ?
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_content_hash
+  ON pages (config_id, content_hash)
+  WHERE content_hash IS NOT NULL;
+
+-- get_page_ids_by_config and fetch_pages(config_id=...) ORDER BY page_id;
+-- supersedes the single-column idx_pages_config.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_page_id
+  ON pages (config_id, page_id);
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_config;
+
+-- Outlinks/inlinks of a page, config link counts, and ON DELETE CASCADE
+-- from pages (which probes both columns).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_links_from ON links (link_from_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_links_to ON links (link_to_id);
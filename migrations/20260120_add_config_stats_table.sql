@@ -0,0 +1,30 @@
+-- Migration: Per-config counters maintained incrementally by the crawler
+-- Rows are upserted in the same transactions that write pages/links, so
+-- /crawlers/stats is a primary-key lookup. A scheduler job periodically
+-- recomputes them from the base tables (ConfigStatsRepository.reconcile_all).
+
+CREATE TABLE IF NOT EXISTS config_stats (
+  config_id INTEGER PRIMARY KEY,
+  pages_discovered BIGINT NOT NULL DEFAULT 0,
+  pages_fetched BIGINT NOT NULL DEFAULT 0,
+  pages_failed BIGINT NOT NULL DEFAULT 0,
+  links BIGINT NOT NULL DEFAULT 0,
+  bytes_stored BIGINT NOT NULL DEFAULT 0,
+  last_fetched_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+-- Backfill from existing data
+INSERT INTO config_stats (config_id, pages_discovered, pages_fetched, pages_failed, links, bytes_stored, last_fetched_at)
+SELECT
+  p.config_id,
+  count(*),
+  count(*) FILTER (WHERE p.page_content IS NOT NULL),
+  count(*) FILTER (WHERE p.page_content IS NOT NULL AND p.http_status >= 400),
+  COALESCE((SELECT count(*) FROM links l JOIN pages src ON src.page_id = l.link_from_id WHERE src.config_id = p.config_id), 0),
+  COALESCE(sum(octet_length(p.page_content)), 0),
+  max(p.fetched_at) FILTER (WHERE p.page_content IS NOT NULL)
+FROM pages p
+WHERE p.config_id IS NOT NULL
+GROUP BY p.config_id
+ON CONFLICT (config_id) DO NOTHING;
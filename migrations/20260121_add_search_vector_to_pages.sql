@@ -0,0 +1,46 @@
+-- Migration: Full-text search over filtered_plain_text
+-- search_vector is kept in sync by a trigger on every write that sets
+-- filtered_plain_text. Input is capped at 500k characters to stay well under
+-- the 1MB tsvector limit on unusually large pages.
+-- Queried by PagesRepository.search_pages (GET /crawlers/search).
+--
+-- Locking: adding a nullable column without a default and creating the
+-- trigger only take brief locks; nothing rewrites the table. Existing rows are
+-- backfilled in page_id batches of 10k, each committed on its own, and the
+-- index is built CONCURRENTLY, so crawling continues throughout.
+-- This file must not run in a transaction (COMMIT inside DO needs Postgres 11+).
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+CREATE OR REPLACE FUNCTION pages_search_vector_update() RETURNS trigger AS $$
+BEGIN
+  NEW.search_vector := to_tsvector('english'::regconfig, left(coalesce(NEW.filtered_plain_text, ''), 500000));
+  RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_pages_search_vector ON pages;
+CREATE TRIGGER trg_pages_search_vector
+  BEFORE INSERT OR UPDATE OF filtered_plain_text ON pages
+  FOR EACH ROW EXECUTE FUNCTION pages_search_vector_update();
+
+-- Rows written before the trigger existed; pages without text stay NULL,
+-- which matches no query just like an empty vector.
+DO $$
+DECLARE
+  batch_start integer := 0;
+  last_id integer;
+BEGIN
+  SELECT coalesce(max(page_id), 0) INTO last_id FROM pages;
+  WHILE batch_start < last_id LOOP
+    UPDATE pages
+    SET search_vector = to_tsvector('english'::regconfig, left(filtered_plain_text, 500000))
+    WHERE page_id > batch_start AND page_id <= batch_start + 10000
+      AND search_vector IS NULL AND filtered_plain_text IS NOT NULL;
+    batch_start := batch_start + 10000;
+    COMMIT;
+  END LOOP;
+END
+$$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_search_vector ON pages USING gin (search_vector);
@@ -0,0 +1,22 @@
+-- Migration: SimHash fingerprints for near-duplicate detection
+-- simhash is the 64-bit fingerprint of the extracted text (stored signed);
+-- simhash_b0..b3 are its 16-bit bands. Pages within Hamming distance 3 share
+-- at least one band, so PagesRepository.find_near_duplicate probes the four
+-- (config_id, band) indexes and checks the exact distance in Python.
+-- Indexes are built CONCURRENTLY; this file must not run in a transaction.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS simhash BIGINT;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS simhash_b0 INTEGER;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS simhash_b1 INTEGER;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS simhash_b2 INTEGER;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS simhash_b3 INTEGER;
+
+-- Existing pages get fingerprints when they are next fetched.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_simhash_b0
+  ON pages (config_id, simhash_b0) WHERE simhash_b0 IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_simhash_b1
+  ON pages (config_id, simhash_b1) WHERE simhash_b1 IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_simhash_b2
+  ON pages (config_id, simhash_b2) WHERE simhash_b2 IS NOT NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_config_simhash_b3
+  ON pages (config_id, simhash_b3) WHERE simhash_b3 IS NOT NULL;
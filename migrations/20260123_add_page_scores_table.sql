@@ -0,0 +1,14 @@
+-- Migration: Link-graph scores per page
+-- Rebuilt per config by LinkGraphService (POST /crawlers/rank/{config}).
+
+CREATE TABLE IF NOT EXISTS page_scores (
+  page_id INTEGER PRIMARY KEY,
+  config_id INTEGER NOT NULL,
+  in_degree INTEGER NOT NULL DEFAULT 0,
+  out_degree INTEGER NOT NULL DEFAULT 0,
+  pagerank DOUBLE PRECISION NOT NULL DEFAULT 0,
+  computed_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_page_scores_config_pagerank
+  ON page_scores (config_id, pagerank DESC);
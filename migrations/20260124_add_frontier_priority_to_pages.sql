@@ -0,0 +1,25 @@
+-- Migration: Importance-ordered frontier
+-- inlink_count counts discovered links to a page; priority is recomputed for
+-- pending pages whenever new links to them are persisted (LinkPersister via
+-- PagesRepository.add_inlinks) and orders get_undiscovered_urls_by_depth.
+-- The index is built CONCURRENTLY; this file must not run in a transaction.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS inlink_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS priority DOUBLE PRECISION;
+
+-- Backfill from existing links; pending pages get the default score
+-- (ln(1 + inlinks) - depth) until their config's weights are next applied.
+UPDATE pages p
+SET inlink_count = l.n
+FROM (SELECT link_to_id, COUNT(*) AS n FROM links GROUP BY link_to_id) l
+WHERE p.page_id = l.link_to_id;
+
+UPDATE pages
+SET priority = ln(1 + inlink_count) - COALESCE(discovered_depth, 0)
+WHERE page_content IS NULL;
+
+-- Frontier query: WHERE config_id = ? AND discovered_depth = ? AND page_content IS NULL
+-- ORDER BY priority DESC NULLS LAST, page_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_frontier
+  ON pages (config_id, discovered_depth, priority DESC NULLS LAST, page_id)
+  WHERE page_content IS NULL;
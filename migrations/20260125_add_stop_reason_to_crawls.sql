@@ -0,0 +1,5 @@
+-- Migration: Record why a crawl run ended early
+-- NULL for runs that completed; "cancelled", or the budget that was hit
+-- ("max_pages", "max_duration", "max_bytes").
+
+ALTER TABLE crawls ADD COLUMN IF NOT EXISTS stop_reason TEXT;
@@ -0,0 +1,25 @@
+-- Migration: DB-backed crawl job queue for separate worker processes
+-- With INFRACRAWL_CRAWL_EXECUTION=worker the API and scheduler only insert rows
+-- here; `python worker.py` claims them with SELECT ... FOR UPDATE SKIP LOCKED.
+
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+  job_id SERIAL PRIMARY KEY,
+  config_path TEXT NOT NULL,
+  kind TEXT NOT NULL,
+  priority INTEGER NOT NULL,
+  status TEXT NOT NULL DEFAULT 'queued',
+  worker_id TEXT,
+  error TEXT,
+  enqueued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  started_at TIMESTAMPTZ,
+  heartbeat_at TIMESTAMPTZ,
+  finished_at TIMESTAMPTZ
+);
+
+-- Single-flight: one queued or running job per config across all processes
+CREATE UNIQUE INDEX IF NOT EXISTS uq_crawl_jobs_active_config
+  ON crawl_jobs (config_path) WHERE status IN ('queued', 'running');
+
+-- Claim order for workers
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_queued
+  ON crawl_jobs (priority, job_id) WHERE status = 'queued';
@@ -0,0 +1,5 @@
+-- Migration: Sitemap <lastmod> per page
+-- Set by sitemap discovery; a fetched page whose lastmod is newer than
+-- fetched_at is refetched, otherwise it is skipped as unchanged.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS sitemap_lastmod TIMESTAMPTZ;
@@ -0,0 +1,17 @@
+-- Migration: Adaptive revisit scheduling
+-- Each refetch of a page counts as a check (a change when content_hash
+-- differs); with the config's `revisit` section on, next_visit_at is set from
+-- the estimated change rate and due pages are refetched at the next crawl.
+-- The index is built CONCURRENTLY; this file must not run in a transaction.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS revisit_checks INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS revisit_changes INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS revisit_observed_seconds DOUBLE PRECISION NOT NULL DEFAULT 0;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS last_changed_at TIMESTAMPTZ;
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS next_visit_at TIMESTAMPTZ;
+
+-- Due query: WHERE config_id = ? AND page_content IS NOT NULL AND next_visit_at <= now()
+-- ORDER BY next_visit_at, page_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_next_visit
+  ON pages (config_id, next_visit_at, page_id)
+  WHERE page_content IS NOT NULL AND next_visit_at IS NOT NULL;
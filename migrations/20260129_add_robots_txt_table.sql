@@ -0,0 +1,14 @@
+-- Migration: Shared robots.txt cache
+-- RobotsService reads robots.txt from here before fetching it, so restarts
+-- and worker processes reuse each other's copies. Expired rows are
+-- revalidated with If-None-Match / If-Modified-Since.
+
+CREATE TABLE IF NOT EXISTS robots_txt (
+  base_url TEXT PRIMARY KEY,
+  status_code INTEGER NOT NULL,
+  body TEXT,
+  etag TEXT,
+  last_modified TEXT,
+  fetched_at TIMESTAMPTZ NOT NULL,
+  expires_at TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,6 @@
+-- Migration: Terminal skip state for never-fetched pages
+-- Pages blocked by robots.txt or of an unsupported content type get a
+-- skip_reason and are no longer pending, so resumes stop chasing them.
+-- A fresh crawl clears the config's skip reasons and rechecks the pages.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS skip_reason TEXT;
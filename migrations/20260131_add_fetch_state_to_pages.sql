@@ -0,0 +1,43 @@
+-- Migration: Explicit page fetch state
+-- fetch_state replaces "page_content IS NULL" as the frontier test:
+--   pending -> in_flight -> fetched | failed (-> pending on a fresh crawl)
+--   pending -> skipped (robots.txt, content type, duplicate; cleared by a fresh crawl)
+-- in_flight pages are requeued when an interrupted crawl resumes.
+-- The index is built CONCURRENTLY; this file must not run in a transaction.
+
+ALTER TABLE pages ADD COLUMN IF NOT EXISTS fetch_state TEXT NOT NULL DEFAULT 'pending';
+ALTER TABLE pages DROP CONSTRAINT IF EXISTS ck_pages_fetch_state;
+ALTER TABLE pages ADD CONSTRAINT ck_pages_fetch_state
+  CHECK (fetch_state IN ('pending', 'in_flight', 'fetched', 'failed', 'skipped'));
+
+-- Backfill: stored content means fetched; a skip reason without content means skipped
+UPDATE pages SET fetch_state = 'fetched'
+WHERE page_content IS NOT NULL AND fetch_state <> 'fetched';
+
+UPDATE pages SET fetch_state = 'skipped'
+WHERE page_content IS NULL AND skip_reason IS NOT NULL AND fetch_state <> 'skipped';
+
+-- Frontier and has-unvisited queries: WHERE config_id = ? [AND discovered_depth = ?]
+-- AND fetch_state IN ('pending', 'in_flight') ORDER BY priority DESC NULLS LAST, page_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_unfetched
+  ON pages (config_id, discovered_depth, priority DESC NULLS LAST, page_id)
+  WHERE fetch_state IN ('pending', 'in_flight');
+
+-- Fetched pages per config, newest first (replaces idx_pages_config_fetched):
+--   get_recent_fetched_urls_by_config, get_fetched_page_ids_by_config,
+--   count_fetched_pages_by_config, is_url_fetched
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_fetched
+  ON pages (config_id, fetched_at DESC, page_id DESC)
+  WHERE fetch_state = 'fetched';
+
+-- Due query: WHERE config_id = ? AND fetch_state = 'fetched' AND next_visit_at <= now()
+-- ORDER BY next_visit_at, page_id (replaces idx_pages_next_visit)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pages_due
+  ON pages (config_id, next_visit_at, page_id)
+  WHERE fetch_state = 'fetched' AND next_visit_at IS NOT NULL;
+
+-- Superseded: the page_content predicates these serve are no longer queried
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_frontier;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_discovered_depth;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_config_fetched;
+DROP INDEX CONCURRENTLY IF EXISTS idx_pages_next_visit;
@@ -0,0 +1,18 @@
+-- Migration: Per-fetch-state counters in config_stats
+-- Skipped and failed pages are neither fetched nor pending; counting them
+-- lets /crawlers/stats derive pending pages without scanning `pages`.
+
+ALTER TABLE config_stats ADD COLUMN IF NOT EXISTS pages_skipped BIGINT NOT NULL DEFAULT 0;
+ALTER TABLE config_stats ADD COLUMN IF NOT EXISTS pages_fetch_failed BIGINT NOT NULL DEFAULT 0;
+
+UPDATE config_stats cs
+SET pages_skipped = p.skipped, pages_fetch_failed = p.failed
+FROM (
+  SELECT config_id,
+         count(*) FILTER (WHERE fetch_state = 'skipped') AS skipped,
+         count(*) FILTER (WHERE fetch_state = 'failed') AS failed
+  FROM pages
+  WHERE config_id IS NOT NULL
+  GROUP BY config_id
+) p
+WHERE cs.config_id = p.config_id;
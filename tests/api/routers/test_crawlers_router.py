@@ -78,19 +78,19 @@ def test_remove_404_without_leaking_exception():
     endpoint = _get_endpoint(router, "/crawlers/remove", "DELETE")
 
     with pytest.raises(HTTPException) as exc:
-        endpoint(config="missing")
+        endpoint(config="missing", background_tasks=Mock())
     assert exc.value.status_code == 404
     assert exc.value.detail == "config not found"
 
 
-def test_remove_500_without_leaking_exception():
-    """Remove endpoint should return 500 without exposing internal exception details."""
+def test_remove_failure_without_leaking_exception():
+    """A failed background removal should report a generic error, not internal details."""
     def _boom(*args, **kwargs):
         raise RuntimeError("disk failure")
 
     cfg = SimpleNamespace(config_id=123)
     config_service = Mock(get_config=Mock(return_value=cfg))
-    pages_repo = Mock(get_page_ids_by_config=Mock(side_effect=_boom))
+    pages_repo = Mock(count_pages_by_config=Mock(return_value=5), delete_config_pages_chunk=Mock(side_effect=_boom))
     links_repo = Mock()
     crawl_registry = Mock()
     crawls_repo = Mock()
@@ -99,11 +99,16 @@ def test_remove_500_without_leaking_exception():
         pages_repo, links_repo, config_service, Mock(), Mock(), crawl_registry, crawls_repo
     )
     endpoint = _get_endpoint(router, "/crawlers/remove", "DELETE")
+    background_tasks = Mock()
 
-    with pytest.raises(HTTPException) as exc:
-        endpoint(config="test")
-    assert exc.value.status_code == 500
-    assert exc.value.detail == "error removing data"
+    job = endpoint(config="test", background_tasks=background_tasks)
+    run, job_id = background_tasks.add_task.call_args.args
+    run(job_id)
+
+    status = _get_endpoint(router, "/crawlers/remove/{job_id}", "GET")(job["job_id"])
+    assert status["status"] == "failed"
+    assert status["error"] == "error removing data"
+    assert "disk failure" not in str(status)
 
 
 def test_list_runs_500_without_leaking_exception():
@@ -254,3 +259,165 @@ def test_get_crawl_log_returns_empty_if_no_config_id():
 
     result = endpoint(crawl_id="abc")
     assert result == {"crawl_id": "abc", "recent_urls": []}
+
+
+def test_export_streams_rows_with_field_selection_and_after_cursor():
+    import asyncio
+    import json
+
+    cfg = SimpleNamespace(config_id=7)
+    config_service = Mock(get_config=Mock(return_value=cfg))
+    pages_repo = Mock(iter_pages=Mock(return_value=iter([
+        {"page_id": 11, "filtered_plain_text": "a"},
+        {"page_id": 12, "filtered_plain_text": "b"},
+    ])))
+    router = create_crawlers_router(pages_repo, Mock(), config_service, Mock(), Mock(), Mock(), Mock())
+    endpoint = _get_endpoint(router, "/crawlers/export", "GET")
+
+    response = endpoint(config="big.yml", limit=None, after=10, fields="filtered_plain_text")
+
+    async def _collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    lines = asyncio.run(_collect()).decode().splitlines()
+    assert [json.loads(line)["page_id"] for line in lines] == [11, 12]
+    pages_repo.iter_pages.assert_called_once_with(
+        config_id=7, after_page_id=10, fields=["filtered_plain_text"], limit=None
+    )
+    pages_repo.fetch_pages.assert_not_called()
+
+    with pytest.raises(HTTPException) as exc:
+        endpoint(config="big.yml", fields="page_url,secret")
+    assert exc.value.status_code == 400
+
+
+def test_export_gzip_format_sets_download_headers_and_rejects_unknown_format():
+    import asyncio
+    import gzip
+
+    pages_repo = Mock(iter_pages=Mock(return_value=iter([{"page_id": 1, "page_url": "https://a/"}])))
+    router = create_crawlers_router(pages_repo, Mock(), Mock(), Mock(), Mock(), Mock(), Mock())
+    endpoint = _get_endpoint(router, "/crawlers/export", "GET")
+
+    response = endpoint(fmt="ndjson.gz")
+    assert response.media_type == "application/gzip"
+    assert response.headers["content-disposition"] == 'attachment; filename="export.ndjson.gz"'
+
+    async def _collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    assert gzip.decompress(asyncio.run(_collect())) == b'{"page_id": 1, "page_url": "https://a/"}\n'
+
+    with pytest.raises(HTTPException) as exc:
+        endpoint(fmt="xml")
+    assert exc.value.status_code == 400
+
+
+def test_export_warc_names_the_warcinfo_record_after_the_download():
+    import asyncio
+    import gzip
+
+    pages_repo = Mock(iter_pages=Mock(return_value=iter([])))
+    router = create_crawlers_router(pages_repo, Mock(), Mock(), Mock(), Mock(), Mock(), Mock())
+    endpoint = _get_endpoint(router, "/crawlers/export", "GET")
+
+    response = endpoint(fmt="warc")
+    assert response.headers["content-disposition"] == 'attachment; filename="export.warc.gz"'
+
+    async def _collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    assert b"WARC-Filename: export.warc.gz" in gzip.decompress(asyncio.run(_collect()))
+
+
+def test_search_scopes_by_config_and_paginates():
+    cfg = SimpleNamespace(config_id=3)
+    config_service = Mock(get_config=Mock(return_value=cfg))
+    rows = [{"page_id": i, "page_url": f"https://a/{i}", "rank": 1.0 / i, "snippet": "<mark>fair</mark>"} for i in range(1, 4)]
+    pages_repo = Mock(search_pages=Mock(return_value=rows))
+    router = create_crawlers_router(pages_repo, Mock(), config_service, Mock(), Mock(), Mock(), Mock())
+    endpoint = _get_endpoint(router, "/crawlers/search", "GET")
+
+    result = endpoint(q="county fair", config="events.yml", limit=2, offset=0)
+
+    pages_repo.search_pages.assert_called_once_with("county fair", config_id=3, limit=3, offset=0)
+    assert [r["page_id"] for r in result["results"]] == [1, 2]
+    assert result["next_offset"] == 2
+
+    with pytest.raises(HTTPException) as exc:
+        endpoint(q="  ")
+    assert exc.value.status_code == 400
+
+
+def test_search_500_without_leaking_exception():
+    pages_repo = Mock(search_pages=Mock(side_effect=RuntimeError("syntax error in tsquery")))
+    router = create_crawlers_router(pages_repo, Mock(), Mock(), Mock(), Mock(), Mock(), Mock())
+    endpoint = _get_endpoint(router, "/crawlers/search", "GET")
+
+    with pytest.raises(HTTPException) as exc:
+        endpoint(q="fair")
+    assert exc.value.status_code == 500
+    assert exc.value.detail == "search failed"
+
+
+def test_rank_endpoints_compute_and_list_scores():
+    cfg = SimpleNamespace(config_id=4)
+    config_service = Mock(get_config=Mock(return_value=cfg))
+    link_graph_service = Mock(compute_scores=Mock(return_value={"config_id": 4, "pages": 3, "edges": 5}))
+    page_scores_repo = Mock(top_pages=Mock(return_value=[{"page_id": 1, "pagerank": 0.5}]))
+    router = create_crawlers_router(
+        Mock(), Mock(), config_service, Mock(), Mock(), Mock(), Mock(),
+        page_scores_repo=page_scores_repo, link_graph_service=link_graph_service,
+    )
+
+    result = _get_endpoint(router, "/crawlers/rank/{config}", "POST")(config="a.yml")
+    link_graph_service.compute_scores.assert_called_once_with(4)
+    assert result["pages"] == 3
+
+    listing = _get_endpoint(router, "/crawlers/rank/{config}", "GET")
+    assert listing(config="a.yml", limit=10, order_by="in_degree")["pages"][0]["page_id"] == 1
+    page_scores_repo.top_pages.assert_called_once_with(4, limit=10, order_by="in_degree")
+    with pytest.raises(HTTPException) as exc:
+        listing(config="a.yml", order_by="clicks")
+    assert exc.value.status_code == 400
+
+
+def test_rank_500_without_leaking_exception():
+    link_graph_service = Mock(compute_scores=Mock(side_effect=RuntimeError("out of memory")))
+    router = create_crawlers_router(
+        Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), link_graph_service=link_graph_service,
+    )
+    with pytest.raises(HTTPException) as exc:
+        _get_endpoint(router, "/crawlers/rank/{config}", "POST")(config="a.yml")
+    assert exc.value.status_code == 500
+    assert exc.value.detail == "error computing ranks"
+
+
+def test_crawl_start_uses_job_queue_and_409s_when_already_active():
+    cfg = SimpleNamespace(config_id=4, config_path="a.yml")
+    config_service = Mock(get_config=Mock(return_value=cfg))
+    job_queue = Mock(submit=Mock(side_effect=[{"job_id": "j1", "status": "queued"}, None]))
+    router = create_crawlers_router(
+        Mock(), Mock(), config_service, Mock(), Mock(), Mock(), Mock(), job_queue=job_queue,
+    )
+    endpoint = _get_endpoint(router, "/crawlers/crawl/{config}/start", "POST")
+    background_tasks = Mock()
+
+    assert endpoint(config="a.yml", background_tasks=background_tasks)["job"]["job_id"] == "j1"
+    assert job_queue.submit.call_args.args[0] == "a.yml"
+    assert job_queue.submit.call_args.kwargs == {"kind": "manual"}
+    background_tasks.add_task.assert_not_called()
+
+    with pytest.raises(HTTPException) as exc:
+        endpoint(config="a.yml", background_tasks=background_tasks)
+    assert exc.value.status_code == 409
+
+
+def test_queue_endpoint_returns_snapshot():
+    snapshot = {"max_concurrent": 2, "running": [], "queued": [], "queue_depth": 0}
+    router = create_crawlers_router(
+        Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), job_queue=Mock(snapshot=Mock(return_value=snapshot)),
+    )
+    assert _get_endpoint(router, "/crawlers/queue", "GET")() == snapshot
+    no_queue = create_crawlers_router(Mock(), Mock(), Mock(), Mock(), Mock(), Mock(), Mock())
+    assert _get_endpoint(no_queue, "/crawlers/queue", "GET")()["queue_depth"] == 0
@@ -0,0 +1,30 @@
+from sqlalchemy import create_engine, create_mock_engine
+
+from infracrawl.db.models import Base
+
+
+def _postgres_ddl():
+    statements = []
+    engine = create_mock_engine("postgresql://", lambda sql, *a, **kw: statements.append(str(sql.compile(dialect=engine.dialect))))
+    Base.metadata.create_all(engine, checkfirst=False)
+    return [s.strip() for s in statements]
+
+
+def test_postgres_pages_schema_matches_url_hash_migration():
+    ddl = _postgres_ddl()
+    pages = next(s for s in ddl if s.startswith("CREATE TABLE pages "))
+    assert "CONSTRAINT pages_page_url_excl EXCLUDE USING hash (page_url WITH =)" in pages
+    assert "UNIQUE" not in pages
+    page_indexes = [s for s in ddl if s.startswith("CREATE") and " ON pages " in s]
+    assert page_indexes == ["CREATE INDEX idx_pages_url_hash ON pages (url_hash)"]
+
+
+def test_other_dialects_keep_page_url_unique_with_an_index():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        indexes = dict(conn.exec_driver_sql("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pages'").all())
+    assert indexes == {
+        "idx_pages_url_hash": "CREATE INDEX idx_pages_url_hash ON pages (url_hash)",
+        "uq_pages_page_url": "CREATE UNIQUE INDEX uq_pages_page_url ON pages (page_url)",
+    }
@@ -0,0 +1,83 @@
+"""Query-plan regression tests for hot repository queries.
+
+Run against the local Postgres (DATABASE_URL) with schema and migrations
+applied. Sequential scans are disabled for the transaction, so the planner
+only picks one if no usable index exists; each query must also use the
+index meant for it, not just any index.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from infracrawl.db.engine import make_engine
+
+
+# name -> (query, index the planner must pick)
+HOT_QUERIES = {
+    "fetched_page_ids_by_config": (
+        "SELECT page_id FROM pages WHERE config_id = 1 AND fetch_state = 'fetched'",
+        "idx_pages_fetched",
+    ),
+    "recent_fetched_urls_by_config": (
+        "SELECT page_url FROM pages WHERE config_id = 1 AND fetch_state = 'fetched' "
+        "ORDER BY fetched_at DESC, page_id DESC LIMIT 10",
+        "idx_pages_fetched",
+    ),
+    "page_ids_by_config": ("SELECT page_id FROM pages WHERE config_id = 1", "idx_pages_config_page_id"),
+    "content_hash_dedup": (
+        "SELECT page_id FROM pages WHERE config_id = 1 AND content_hash = 'abc' LIMIT 1",
+        "idx_pages_config_content_hash",
+    ),
+    "undiscovered_by_depth": (
+        "SELECT page_url FROM pages WHERE config_id = 1 AND discovered_depth = 2 "
+        "AND fetch_state = 'pending' ORDER BY priority DESC NULLS LAST, page_id LIMIT 1000",
+        "idx_pages_unfetched",
+    ),
+    "due_by_config": (
+        "SELECT page_url, discovered_depth FROM pages WHERE config_id = 1 AND fetch_state = 'fetched' "
+        "AND next_visit_at <= now() AND discovered_depth >= 1 ORDER BY next_visit_at, page_id LIMIT 1000",
+        "idx_pages_due",
+    ),
+    "page_by_url_hash": (
+        "SELECT page_id FROM pages WHERE url_hash = 42 AND page_url = 'https://example.com/'",
+        "idx_pages_url_hash",
+    ),
+    "full_text_search": (
+        "SELECT page_id FROM pages WHERE config_id = 1 "
+        "AND search_vector @@ websearch_to_tsquery('english', 'county fair')",
+        "idx_pages_search_vector",
+    ),
+    "near_duplicate_bands": (
+        "SELECT page_id, simhash FROM pages WHERE config_id = 1 AND (simhash_b0 = 1 "
+        "OR simhash_b1 = 2 OR simhash_b2 = 3 OR simhash_b3 = 4) LIMIT 500",
+        "idx_pages_config_simhash_b0",
+    ),
+    "links_from_page": ("SELECT link_id FROM links WHERE link_from_id = 1", "idx_links_from"),
+    "links_to_page": ("SELECT link_id FROM links WHERE link_to_id = 1", "idx_links_to"),
+}
+
+
+@pytest.fixture(scope="module")
+def pg_conn():
+    try:
+        engine = make_engine()
+        conn = engine.connect()
+    except (RuntimeError, OperationalError) as e:
+        pytest.skip(f"Postgres not available: {e}")
+    if engine.dialect.name != "postgresql":
+        conn.close()
+        pytest.skip("query plan tests require Postgres")
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(pg_conn, name):
+    with pg_conn.begin() as tx:
+        pg_conn.execute(text("SET LOCAL enable_seqscan = off"))
+        query, index = HOT_QUERIES[name]
+        plan = "\n".join(row[0] for row in pg_conn.execute(text("EXPLAIN " + query)))
+        tx.rollback()
+    assert "Seq Scan" not in plan, f"{name} fell back to a sequential scan:\n{plan}"
+    # A scan on some other (e.g. superseded) index would also avoid the Seq Scan
+    assert index in plan, f"{name} does not use {index}:\n{plan}"
@@ -0,0 +1,39 @@
+import pytest
+
+from infracrawl.domain.config import CrawlerConfig
+from infracrawl.domain.crawl_budget import CrawlBudget, parse_duration_seconds, parse_size_bytes
+from infracrawl.domain.crawl_session import CrawlSession
+
+
+def test_parse_duration_and_size():
+    assert parse_duration_seconds(None) is None
+    assert parse_duration_seconds(90) == 90
+    assert parse_duration_seconds("45m") == 2700
+    assert parse_duration_seconds("1.5h") == 5400
+    assert parse_size_bytes("500KB") == 500 * 1024
+    assert parse_size_bytes("2GiB") == 2 * 1024 ** 3
+    assert parse_size_bytes(1000) == 1000
+    for bad in ("soon", "-5m", 0):
+        with pytest.raises(ValueError):
+            parse_duration_seconds(bad)
+    with pytest.raises(ValueError):
+        parse_size_bytes("10 parsecs")
+
+
+def test_budget_reports_first_exhausted_limit():
+    budget = CrawlBudget(max_pages=10, max_duration_seconds=60, max_bytes=1000)
+    assert budget.exceeded(pages=9, bytes_fetched=999, started_at=0, now=59) is None
+    assert budget.exceeded(pages=10, bytes_fetched=0, started_at=0, now=0) == "max_pages"
+    assert budget.exceeded(pages=0, bytes_fetched=1000, started_at=0, now=0) == "max_bytes"
+    assert budget.exceeded(pages=0, bytes_fetched=0, started_at=0, now=60) == "max_duration"
+    assert CrawlBudget().exceeded(pages=10 ** 9, bytes_fetched=10 ** 12, started_at=0, now=10 ** 6) is None
+
+
+def test_session_budget_does_not_signal_stop_event():
+    cfg = CrawlerConfig(None, "a.yml", fetch_mode="http", max_bytes=100)
+    session = CrawlSession(cfg)
+    assert not session.budget_exhausted()
+    session.add_bytes_fetched(150)
+    assert session.budget_exhausted()
+    assert session.stop_reason == "max_bytes"
+    assert not session.is_stopped()
@@ -1,4 +1,5 @@
-from infracrawl.domain.visited_tracker import VisitedTracker
+from infracrawl.domain.visited_tracker import BloomFilter, FingerprintSet, VisitedTracker
+from infracrawl.utils.url_fingerprint import url_fingerprint
 
 
 def test_url_not_visited_initially():
@@ -24,3 +25,47 @@ def test_marking_same_url_twice_is_idempotent():
     tracker.mark("https://example.com")
     tracker.mark("https://example.com")
     assert tracker.is_visited("https://example.com")
+
+
+def test_tracker_does_not_evict_past_max_size():
+    tracker = VisitedTracker(max_size=10, bloom_capacity=1000)
+    urls = [f"https://example.com/page/{i}" for i in range(200)]
+    for url in urls:
+        tracker.mark(url)
+    assert all(tracker.is_visited(url) for url in urls)
+    assert len(tracker) == 200
+
+
+def test_tracker_exact_tier_grows_when_bloom_disabled():
+    tracker = VisitedTracker(max_size=10, bloom_capacity=0)
+    urls = [f"https://example.com/page/{i}" for i in range(5000)]
+    for url in urls:
+        tracker.mark(url)
+    assert all(tracker.is_visited(url) for url in urls)
+    assert not tracker.is_visited("https://example.com/other")
+    assert len(tracker) == 5000
+
+
+def test_fingerprint_set_membership_and_growth():
+    fingerprints = FingerprintSet(initial_capacity=8)
+    for fp in range(1, 10_000, 7):
+        assert fingerprints.add(fp)
+    assert not fingerprints.add(8)
+    assert 15 in fingerprints
+    assert 16 not in fingerprints
+    assert len(fingerprints) == len(range(1, 10_000, 7))
+
+
+def test_fingerprint_set_stores_zero_fingerprint():
+    fingerprints = FingerprintSet()
+    fingerprints.add(0)
+    assert 0 in fingerprints
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(url_fingerprint(f"https://example.com/{i}"))
+    assert all(url_fingerprint(f"https://example.com/{i}") in bloom for i in range(10_000))
+    false_positives = sum(url_fingerprint(f"https://other.com/{i}") in bloom for i in range(10_000))
+    assert false_positives < 300
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from infracrawl.db.models import Base, Page as DBPage
+from infracrawl.domain import Link
+from infracrawl.domain.page import Page
+from infracrawl.domain.fetch_state import FetchState
+from infracrawl.repository.config_stats import ConfigStatsRepository
+from infracrawl.repository.links import LinksRepository
+from infracrawl.repository.pages import PagesRepository
+
+
+def _repos():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    sf = sessionmaker(bind=engine, future=True)
+    return sf, PagesRepository(sf), LinksRepository(sf), ConfigStatsRepository(sf)
+
+
+def test_counters_follow_page_and_link_writes():
+    _, pages, links, stats = _repos()
+    assert stats.get(1)["pages_discovered"] == 0
+
+    root = Page(page_url="https://a/", config_id=1)
+    pages.ensure_page(root)
+    ids = pages.ensure_pages_batch(["https://a/1", "https://a/2"], discovered_depth=1, config_id=1)
+    pages.ensure_pages_batch(["https://a/1"], discovered_depth=1, config_id=1)  # existing: no change
+    links.insert_links_batch(
+        [Link(link_id=None, link_from_id=root.page_id, link_to_id=pid) for pid in ids.values()],
+        config_id=1,
+    )
+
+    fetched_at = datetime(2026, 1, 20, tzinfo=timezone.utc)
+    pages.upsert_page(Page(page_url="https://a/", page_content="héllo", http_status=200, fetched_at=fetched_at, config_id=1))
+    pages.upsert_page(Page(page_url="https://a/1", page_content="gone", http_status=404, fetched_at=fetched_at, config_id=1))
+    # Refetch with new content adjusts bytes only
+    pages.upsert_page(Page(page_url="https://a/", page_content="hello world", http_status=200, fetched_at=fetched_at, config_id=1))
+
+    s = stats.get(1)
+    assert s["pages_discovered"] == 3
+    assert s["pages_fetched"] == 2
+    assert s["pages_failed"] == 1
+    assert s["links"] == 2
+    assert s["bytes_stored"] == len("hello world") + len("gone")
+    assert s["last_fetched_at"] is not None
+
+
+def test_counters_fall_back_to_update_then_insert_without_upsert_support(monkeypatch):
+    import infracrawl.repository.config_stats as config_stats
+
+    monkeypatch.setattr(config_stats, "_dialect_insert", lambda session: None)
+    test_counters_follow_page_and_link_writes()
+
+
+def test_reconcile_recomputes_counters_from_base_tables():
+    sf, pages, links, stats = _repos()
+    pages.ensure_pages_batch(["https://a/1", "https://a/2"], config_id=1)
+    pages.upsert_page(Page(page_url="https://a/1", page_content="abc", http_status=500, config_id=1))
+
+    # Drift: a write that bypasses the repositories
+    with sf() as session:
+        session.execute(update(DBPage).where(DBPage.page_url == "https://a/2").values(page_content="xy", http_status=200, fetch_state="fetched"))
+        session.commit()
+    assert stats.get(1)["pages_fetched"] == 1
+
+    reconciled = stats.reconcile(1)
+    assert reconciled["pages_discovered"] == 2
+    assert reconciled["pages_fetched"] == 2
+    assert reconciled["pages_failed"] == 1
+    assert reconciled["bytes_stored"] == 5
+    assert stats.get(1) == reconciled
+
+    assert stats.reconcile_all() == [1]
+
+
+def test_state_counters_follow_skips_failures_and_requeues():
+    _, pages, _, stats = _repos()
+    pages.ensure_pages_batch(["https://a/1", "https://a/2", "https://a/3"], discovered_depth=1, config_id=1)
+
+    pages.mark_skipped("https://a/1", "robots")
+    pages.set_fetch_state("https://a/2", FetchState.FAILED)
+    pages.mark_skipped("https://a/2", "too_large")  # failed -> skipped
+    pages.set_fetch_state("https://a/3", FetchState.FAILED)
+    s = stats.get(1)
+    assert (s["pages_skipped"], s["pages_fetch_failed"]) == (2, 1)
+
+    assert pages.requeue_unfetched(1, (FetchState.FAILED,)) == 1
+    assert stats.get(1)["pages_fetch_failed"] == 0
+    assert pages.requeue_unfetched(1) == 2
+    assert stats.get(1)["pages_skipped"] == 0
+
+    pages.mark_skipped("https://a/1", "robots")
+    reconciled = stats.reconcile(1)
+    assert (reconciled["pages_skipped"], reconciled["pages_fetch_failed"]) == (1, 0)
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from infracrawl.db.models import Base, CrawlJob as DBCrawlJob
+from infracrawl.repository.crawl_jobs import CrawlJobsRepository
+
+
+def _repo():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return CrawlJobsRepository(sessionmaker(bind=engine, future=True))
+
+
+def test_enqueue_is_single_flight_per_config_and_claims_by_priority():
+    repo = _repo()
+    assert repo.enqueue("r.yml", "recovery", 2) is not None
+    assert repo.enqueue("s.yml", "scheduled", 1) is not None
+    assert repo.enqueue("m.yml", "manual", 0) is not None
+    assert repo.enqueue("m.yml", "scheduled", 1) is None
+    assert repo.is_active("m.yml")
+
+    claimed = [repo.claim_next("w1")["config_path"] for _ in range(3)]
+    assert claimed == ["m.yml", "s.yml", "r.yml"]
+    assert repo.claim_next("w1") is None
+    assert [j["status"] for j in repo.list_active()] == ["running"] * 3
+
+    first = repo.list_active()[0]
+    repo.finish(first["job_id"])
+    assert not repo.is_active(first["config_path"])
+    # finished jobs no longer block a new one for the same config
+    assert repo.enqueue(first["config_path"], "manual", 0) is not None
+
+
+def test_requeue_stale_turns_dead_jobs_into_recovery():
+    repo = _repo()
+    job = repo.enqueue("a.yml", "manual", 0)
+    repo.claim_next("dead-worker")
+    with repo.get_session() as session:
+        session.execute(
+            update(DBCrawlJob)
+            .where(DBCrawlJob.job_id == job["job_id"])
+            .values(heartbeat_at=datetime.utcnow() - timedelta(seconds=600))
+        )
+        session.commit()
+
+    assert repo.requeue_stale(300, priority=2) == 1
+    again = repo.claim_next("w2")
+    assert again["job_id"] == job["job_id"]
+    assert again["kind"] == "recovery"
+    assert again["worker_id"] == "w2"
+
+    repo.finish(again["job_id"], error="boom")
+    assert repo.delete_finished(older_than_seconds=-1) == 1
@@ -25,3 +25,15 @@ def test_mark_incomplete_runs_sets_end_timestamp_and_exception():
     assert after is not None
     assert after.end_timestamp is not None
     assert after.exception == "recovered"
+
+
+def test_latest_stop_reason_reads_most_recent_run():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = CrawlsRepository(sessionmaker(bind=engine, future=True))
+
+    assert repo.latest_stop_reason(5) is None
+    repo.finish_run(repo.create_run(config_id=5), stop_reason="max_bytes")
+    assert repo.latest_stop_reason(5) == "max_bytes"
+    repo.finish_run(repo.create_run(config_id=5))
+    assert repo.latest_stop_reason(5) is None
@@ -43,3 +43,47 @@ def test_insert_links_batch_inserts_multiple_links():
     assert len(fetched) >= 2
     assert any(link.link_to_id == to_id1 and link.anchor_text == "batch-link1" for link in fetched)
     assert any(link.link_to_id == to_id2 and link.anchor_text == "batch-link2" for link in fetched)
+
+
+def test_count_links_by_config_counts_links_from_config_pages():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    pages_repo = PagesRepository(session_factory)
+    links_repo = LinksRepository(session_factory)
+    ids = pages_repo.ensure_pages_batch(["http://a.test/", "http://a.test/x"], config_id=1)
+    other = pages_repo.ensure_pages_batch(["http://b.test/"], config_id=2)
+    links_repo.insert_links_batch([
+        Link(link_id=None, link_from_id=ids["http://a.test/"], link_to_id=ids["http://a.test/x"]),
+        Link(link_id=None, link_from_id=ids["http://a.test/x"], link_to_id=ids["http://a.test/"]),
+        Link(link_id=None, link_from_id=other["http://b.test/"], link_to_id=ids["http://a.test/"]),
+    ])
+    assert links_repo.count_links_by_config(1) == 2
+    assert links_repo.count_links_by_config(2) == 1
+
+
+def test_persisting_the_same_links_again_adds_no_edges_or_inlinks():
+    from sqlalchemy import select
+    from infracrawl.db.models import Page as DBPage
+    from infracrawl.services.link_persister import LinkPersister
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    pages_repo = PagesRepository(session_factory)
+    links_repo = LinksRepository(session_factory)
+    from_id = pages_repo.ensure_pages_batch(["http://a.test/"], config_id=1)["http://a.test/"]
+    persister = LinkPersister(pages_repo, links_repo)
+
+    # A refetch of the page finds the same two links plus a new one
+    persister.persist_links(from_id=from_id, links=[("http://a.test/x", "x"), ("http://a.test/y", "y")], config_id=1)
+    persister.persist_links(
+        from_id=from_id, links=[("http://a.test/x", "x again"), ("http://a.test/y", "y"), ("http://a.test/z", "z")], config_id=1,
+    )
+
+    assert len(links_repo.fetch_links()) == 3
+    assert links_repo.count_links_by_config(1) == 3
+    with session_factory() as session:
+        counts = dict(session.execute(select(DBPage.page_url, DBPage.inlink_count).where(DBPage.page_id != from_id)).all())
+    assert counts == {"http://a.test/x": 1, "http://a.test/y": 1, "http://a.test/z": 1}
+    assert links_repo.insert_links_batch([Link(link_id=None, link_from_id=from_id, link_to_id=from_id)]) == [from_id]
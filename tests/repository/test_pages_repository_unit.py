@@ -8,6 +8,7 @@ import pytest
 from infracrawl.db.models import Base, Page as DBPage
 from infracrawl.repository.pages import PagesRepository
 from infracrawl.domain.page import Page as DomainPage
+from infracrawl.domain.fetch_state import FetchState
 
 # Use DomainPage as Page to match new mutation pattern
 Page = DomainPage
@@ -104,3 +105,317 @@ def test_upsert_strips_nul_characters():
         assert "\x00" not in (dbp.page_content or "")
         assert "\x00" not in (dbp.plain_text or "")
         assert "\x00" not in (dbp.filtered_plain_text or "")
+
+
+def test_is_url_fetched_and_count_fetched_pages_by_config():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    repo = PagesRepository(session_factory)
+
+    repo.upsert_page(DomainPage(page_url="http://example.com/a", page_content="a", config_id=1, fetched_at=datetime.utcnow()))
+    repo.upsert_page(DomainPage(page_url="http://example.com/b", page_content="b", config_id=1, fetched_at=datetime.utcnow()))
+    repo.ensure_pages_batch(["http://example.com/pending"], discovered_depth=1, config_id=1)
+
+    assert repo.is_url_fetched(1, "http://example.com/a")
+    assert not repo.is_url_fetched(1, "http://example.com/pending")
+    assert not repo.is_url_fetched(2, "http://example.com/a")
+    assert repo.count_fetched_pages_by_config(1) == 2
+    assert repo.count_fetched_pages_by_config(2) == 0
+
+    # Fetched means fetch_state, not non-NULL content
+    with session_factory() as s:
+        s.add(DBPage(page_url="http://example.com/c", config_id=1, page_content="", fetch_state="skipped"))
+        s.commit()
+    assert not repo.is_url_fetched(1, "http://example.com/c")
+    assert repo.count_fetched_pages_by_config(1) == 2
+
+
+def test_url_lookups_use_url_hash_and_resolve_collisions():
+    from infracrawl.utils.url_fingerprint import url_hash
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    repo = PagesRepository(session_factory)
+
+    ids = repo.ensure_pages_batch(["https://example.com/a", "https://example.com/b"], config_id=1)
+    with session_factory() as s:
+        row = s.execute(select(DBPage).where(DBPage.page_url == "https://example.com/a")).scalars().one()
+        assert row.url_hash == url_hash("https://example.com/a")
+        # Force a collision: a different URL sharing /a's hash must not match
+        s.add(DBPage(page_url="https://example.com/collides", url_hash=row.url_hash))
+        s.commit()
+
+    assert repo.get_page_by_url("https://example.com/a").page_id == ids["https://example.com/a"]
+    again = repo.ensure_pages_batch(["https://example.com/a", "https://example.com/c"], config_id=1)
+    assert again["https://example.com/a"] == ids["https://example.com/a"]
+    assert "https://example.com/collides" not in again
+
+
+def test_url_hash_matches_postgres_expression():
+    import hashlib
+    from infracrawl.utils.url_fingerprint import url_fingerprint, url_hash
+
+    url = "https://example.com/events?page=2"
+    # ('x' || substr(md5(url), 1, 16))::bit(64)::bigint
+    expected = int(hashlib.md5(url.encode()).hexdigest()[:16], 16)
+    if expected >= 2**63:
+        expected -= 2**64
+    assert url_hash(url) == expected
+    assert url_hash(url) % 2**64 == url_fingerprint(url)
+
+
+def test_get_config_stats_aggregates_in_sql():
+    from infracrawl.db.models import Link as DBLink
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    repo = PagesRepository(session_factory)
+
+    with session_factory() as s:
+        pages = [
+            DBPage(page_url="https://a/", config_id=1, discovered_depth=0, page_content="x", http_status=200, fetch_state="fetched"),
+            DBPage(page_url="https://a/1", config_id=1, discovered_depth=1, page_content="x", http_status=404, fetch_state="fetched"),
+            DBPage(page_url="https://a/2", config_id=1, discovered_depth=1, page_content="x", http_status=201, fetch_state="fetched"),
+            DBPage(page_url="https://a/3", config_id=1, discovered_depth=1),
+            DBPage(page_url="https://a/4", config_id=1, discovered_depth=1, fetch_state="skipped", skip_reason="robots"),
+            DBPage(page_url="https://b/", config_id=2, discovered_depth=0, page_content="x", http_status=200, fetch_state="fetched"),
+        ]
+        s.add_all(pages)
+        s.flush()
+        s.add_all([
+            DBLink(link_from_id=pages[0].page_id, link_to_id=pages[1].page_id),
+            DBLink(link_from_id=pages[0].page_id, link_to_id=pages[3].page_id),
+            DBLink(link_from_id=pages[5].page_id, link_to_id=pages[5].page_id),
+        ])
+        s.commit()
+
+    stats = repo.get_config_stats(1)
+    assert stats["pages"] == 3
+    assert stats["pending"] == 1
+    assert stats["skipped"] == 1
+    assert stats["total_pages"] == 5
+    assert stats["links"] == 2
+    assert stats["by_depth"] == {"0": {"fetched": 1, "pending": 0}, "1": {"fetched": 2, "pending": 1}}
+    assert stats["by_status_class"] == {"2xx": 2, "4xx": 1}
+    assert stats["by_state"] == {"fetched": 3, "pending": 1, "skipped": 1}
+
+    assert repo.get_config_stats(99) == {
+        "pages": 0, "pending": 0, "skipped": 0, "total_pages": 0, "links": 0,
+        "by_depth": {}, "by_status_class": {}, "by_state": {},
+    }
+
+
+def test_delete_config_pages_chunk_removes_config_pages_links_and_orphans_only():
+    from infracrawl.db.models import Link as DBLink
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    repo = PagesRepository(session_factory)
+
+    with session_factory() as s:
+        a = [DBPage(page_url=f"https://a/{i}", config_id=1) for i in range(3)]
+        orphan = DBPage(page_url="https://legacy/", config_id=None)
+        other = DBPage(page_url="https://b/", config_id=2)
+        s.add_all(a + [orphan, other])
+        s.flush()
+        s.add_all([
+            DBLink(link_from_id=a[0].page_id, link_to_id=a[1].page_id),
+            DBLink(link_from_id=a[0].page_id, link_to_id=orphan.page_id),
+            DBLink(link_from_id=a[2].page_id, link_to_id=other.page_id),
+            DBLink(link_from_id=other.page_id, link_to_id=other.page_id),
+        ])
+        s.commit()
+        other_id = other.page_id
+
+    assert repo.count_pages_by_config(1) == 3
+    # First chunk: a/0, a/1 and the orphan linked from a/0
+    assert repo.delete_config_pages_chunk(1, chunk_size=2) == (3, 2)
+    # Second chunk: a/2 and its link into config 2 (the config 2 page stays)
+    assert repo.delete_config_pages_chunk(1, chunk_size=2) == (1, 1)
+    assert repo.delete_config_pages_chunk(1, chunk_size=2) == (0, 0)
+
+    assert repo.count_pages_by_config(1) == 0
+    with session_factory() as s:
+        assert s.get(DBPage, other_id) is not None
+        assert s.execute(select(DBLink)).scalars().all()[0].link_from_id == other_id
+
+
+def test_iter_pages_streams_selected_fields_with_keyset_resume():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, future=True)
+    repo = PagesRepository(session_factory)
+
+    with session_factory() as s:
+        s.add_all([DBPage(page_url=f"https://a/{i}", config_id=1, filtered_plain_text=f"t{i}") for i in range(5)])
+        s.add(DBPage(page_url="https://b/", config_id=2))
+        s.commit()
+
+    rows = list(repo.iter_pages(config_id=1, fields=["filtered_plain_text"], batch_size=2))
+    assert [set(r) for r in rows] == [{"page_id", "filtered_plain_text"}] * 5
+    assert [r["filtered_plain_text"] for r in rows] == ["t0", "t1", "t2", "t3", "t4"]
+
+    first = list(repo.iter_pages(config_id=1, fields=["page_url"], limit=2))
+    rest = list(repo.iter_pages(config_id=1, fields=["page_url"], after_page_id=first[-1]["page_id"]))
+    assert [r["page_url"] for r in first + rest] == [f"https://a/{i}" for i in range(5)]
+
+    with pytest.raises(ValueError):
+        list(repo.iter_pages(fields=["password"]))
+
+
+def test_add_inlinks_orders_pending_pages_by_priority():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    from infracrawl.services.frontier_priority import FrontierPriority
+
+    ids = repo.ensure_pages_batch(
+        ["http://a/leaf", "http://a/hub", "http://a/docs/x", "http://a/unscored"], discovered_depth=1, config_id=1
+    )
+    repo.upsert_page(DomainPage(page_url="http://a/done", page_content="x", config_id=1, fetched_at=datetime.utcnow()))
+    scorer = FrontierPriority(url_weights=(("*/docs/*", 5.0),)).score
+
+    repo.add_inlinks([ids["http://a/leaf"], ids["http://a/hub"], ids["http://a/docs/x"]], scorer)
+    for _ in range(3):
+        repo.add_inlinks([ids["http://a/hub"], repo.get_page_by_url("http://a/done").page_id], scorer)
+
+    assert repo.get_undiscovered_urls_by_depth(1, 1) == [
+        "http://a/docs/x", "http://a/hub", "http://a/leaf", "http://a/unscored",
+    ]
+    assert repo.get_undiscovered_urls_by_depth(1, 1, limit=2) == ["http://a/docs/x", "http://a/hub"]
+    with repo.get_session() as session:
+        hub, done = (session.execute(select(DBPage).where(DBPage.page_url == url)).scalar_one() for url in ("http://a/hub", "http://a/done"))
+        assert (hub.inlink_count, done.inlink_count) == (4, 3)
+        assert done.priority is None
+
+
+def test_add_sitemap_urls_queues_new_pages_and_reports_changed_ones():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    fetched_at = datetime(2024, 3, 1)
+    for url in ("http://a/changed", "http://a/same"):
+        repo.upsert_page(DomainPage(page_url=url, page_content=url, config_id=1, fetched_at=fetched_at))
+
+    changed = repo.add_sitemap_urls(
+        [
+            ("http://a/changed", datetime(2024, 3, 5)),
+            ("http://a/same", datetime(2024, 2, 1)),
+            ("http://a/new", datetime(2024, 3, 5)),
+            ("http://a/undated", None),
+        ],
+        config_id=1,
+        discovered_depth=1,
+    )
+
+    assert changed == ["http://a/changed"]
+    assert sorted(repo.get_undiscovered_urls_by_depth(1, 1)) == ["http://a/new", "http://a/undated"]
+    assert repo.get_page_by_url("http://a/same").sitemap_lastmod.replace(tzinfo=None) == datetime(2024, 2, 1)
+
+
+def test_upsert_page_records_changes_and_schedules_due_pages():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    every_day = lambda checks, changes, observed: 86400.0
+    t0 = datetime(2024, 3, 1)
+
+    def fetch(url, content, at):
+        page = DomainPage(page_url=url, page_content=content, content_hash=content, config_id=1, fetched_at=at)
+        return repo.upsert_page(page, revisit_interval=every_day)
+
+    repo.ensure_pages_batch(["http://a/"], discovered_depth=0, config_id=1)
+    repo.ensure_pages_batch(["http://a/news", "http://a/about"], discovered_depth=1, config_id=1)
+    fetch("http://a/news", "v1", t0)
+    fetch("http://a/about", "same", t0)
+    fetch("http://a/", "root", t0)
+    # same content hash as the first fetch: a refetch of the URL, not a duplicate
+    fetch("http://a/news", "v1", datetime(2024, 3, 2))
+    fetch("http://a/news", "v2", datetime(2024, 3, 4))
+    fetch("http://a/about", "same", datetime(2024, 3, 3))
+
+    with repo.get_session() as session:
+        news = session.execute(select(DBPage).where(DBPage.page_url == "http://a/news")).scalar_one()
+        assert (news.revisit_checks, news.revisit_changes, news.revisit_observed_seconds) == (2, 1, 3 * 86400.0)
+        assert news.last_changed_at.replace(tzinfo=None) == datetime(2024, 3, 4)
+        assert news.fetched_at.replace(tzinfo=None) == datetime(2024, 3, 4)
+    assert repo.get_page_by_url("http://a/news").next_visit_at.replace(tzinfo=None) == datetime(2024, 3, 5)
+
+    assert repo.get_due_urls(1, datetime(2024, 3, 4, 12)) == [("http://a/about", 1)]
+    assert repo.get_due_urls(1, datetime(2024, 3, 6)) == [("http://a/about", 1), ("http://a/news", 1)]
+    assert repo.get_due_urls(1, datetime(2024, 3, 6), max_depth=0) == []
+    assert repo.get_due_urls(1, datetime(2024, 3, 6), limit=1) == [("http://a/about", 1)]
+
+
+def test_skipped_pages_leave_the_frontier_until_requeued():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    repo.ensure_pages_batch(["http://a/blocked", "http://a/open"], discovered_depth=1, config_id=1)
+
+    repo.mark_skipped("http://a/blocked", "robots")
+    assert repo.get_undiscovered_urls_by_depth(1, 1) == ["http://a/open"]
+    assert repo.get_unvisited_urls_by_config(1) == ["http://a/open"]
+
+    repo.upsert_page(DomainPage(page_url="http://a/open", page_content="x", config_id=1, fetched_at=datetime.utcnow()))
+    assert not repo.has_unvisited_urls_by_config(1)
+    repo.mark_skipped("http://a/open", "robots")  # fetched pages are not touched
+    assert repo.get_config_stats(1)["pages"] == 1
+
+    assert repo.requeue_unfetched(1) == 1
+    assert repo.get_undiscovered_urls_by_depth(1, 1) == ["http://a/blocked"]
+
+
+def test_fetch_state_moves_through_in_flight_failed_and_requeue():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    repo.ensure_pages_batch(["http://a/1", "http://a/2"], discovered_depth=1, config_id=1)
+
+    assert repo.set_fetch_state("http://a/1", FetchState.IN_FLIGHT, from_states=(FetchState.PENDING,))
+    # Only one claim succeeds
+    assert not repo.set_fetch_state("http://a/1", FetchState.IN_FLIGHT, from_states=(FetchState.PENDING,))
+    assert repo.get_undiscovered_urls_by_depth(1, 1) == ["http://a/2"]
+    assert sorted(repo.get_unvisited_urls_by_config(1)) == ["http://a/1", "http://a/2"]
+
+    assert repo.set_fetch_state("http://a/1", FetchState.FAILED)
+    assert repo.get_unvisited_urls_by_config(1) == ["http://a/2"]
+    assert repo.get_config_stats(1)["by_state"] == {"failed": 1, "pending": 1}
+
+    # A resume only takes back in-flight pages; a fresh crawl retries failures
+    assert repo.requeue_unfetched(1, (FetchState.IN_FLIGHT,)) == 0
+    assert repo.requeue_unfetched(1) == 1
+    assert sorted(repo.get_undiscovered_urls_by_depth(1, 1)) == ["http://a/1", "http://a/2"]
+
+    repo.upsert_page(DomainPage(page_url="http://a/1", page_content="x", config_id=1, fetched_at=datetime.utcnow()))
+    assert not repo.set_fetch_state("http://a/1", FetchState.FAILED)  # fetched pages keep their state
+    assert repo.get_page_by_url("http://a/1").fetch_state == FetchState.FETCHED
+
+    with pytest.raises(ValueError):
+        repo.set_fetch_state("http://a/2", "done")
+
+
+def test_find_near_duplicate_is_not_crowded_out_by_a_shared_band():
+    from infracrawl.utils.simhash import simhash_bands, to_signed64
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    target = 0x1234_5678_9ABC_DEF0
+
+    def row(url, fingerprint):
+        b0, b1, b2, b3 = simhash_bands(fingerprint)
+        return DBPage(page_url=url, config_id=1, fetch_state="fetched", simhash=to_signed64(fingerprint),
+                      simhash_b0=b0, simhash_b1=b1, simhash_b2=b2, simhash_b3=b3)
+
+    with repo.get_session() as session:
+        # Hundreds of pages share the target's top band but differ everywhere else
+        session.add_all(row(f"http://a/far/{i}", (target & ~0xFFFF_FFFF_FFFF) | (~target & 0xFFFF_FFFF_FFFF) ^ i) for i in range(700))
+        session.add(row("http://a/match", target ^ 0b101))
+        session.commit()
+
+    assert repo.find_near_duplicate(1, target, max_distance=3).page_url == "http://a/match"
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from infracrawl.services.crawl_job_queue import CrawlJobQueue
+
+
+def _blocker():
+    started = threading.Event()
+    release = threading.Event()
+
+    def run(*_args):
+        started.set()
+        release.wait(5)
+
+    return run, started, release
+
+
+def test_single_flight_and_cap():
+    queue = CrawlJobQueue(max_concurrent=1)
+    run_a, started_a, release_a = _blocker()
+    try:
+        assert queue.submit("a.yml", run_a)["status"] == "queued"
+        assert started_a.wait(5)
+        # a.yml is running: a second submit is rejected
+        assert queue.submit("a.yml", run_a, kind="scheduled") is None
+        assert queue.is_active("a.yml")
+
+        # the cap is 1, so b.yml waits
+        assert queue.submit("b.yml", lambda: None) is not None
+        snap = queue.snapshot()
+        assert snap["max_concurrent"] == 1
+        assert [j["config_path"] for j in snap["running"]] == ["a.yml"]
+        assert [j["config_path"] for j in snap["queued"]] == ["b.yml"]
+        assert snap["queue_depth"] == 1
+    finally:
+        release_a.set()
+        queue.shutdown(wait=True, timeout=5)
+
+
+def test_priority_order_manual_scheduled_recovery():
+    queue = CrawlJobQueue(max_concurrent=1)
+    run_block, started, release = _blocker()
+    order = []
+    done = threading.Event()
+    try:
+        queue.submit("block.yml", run_block)
+        assert started.wait(5)
+        queue.submit("r.yml", lambda: order.append("recovery"), kind="recovery")
+        queue.submit("s.yml", lambda: order.append("scheduled"), kind="scheduled")
+        queue.submit("m.yml", lambda: order.append("manual"), kind="manual")
+        queue.submit("s2.yml", lambda: (order.append("scheduled2"), done.set()), kind="scheduled")
+        assert [j["kind"] for j in queue.snapshot()["queued"]] == ["manual", "scheduled", "scheduled", "recovery"]
+        release.set()
+        assert done.wait(5)
+    finally:
+        release.set()
+        queue.shutdown(wait=True, timeout=5)
+    assert order[:3] == ["manual", "scheduled", "scheduled2"]
+
+
+def test_failed_job_frees_config_and_rejects_unknown_kind():
+    queue = CrawlJobQueue(max_concurrent=1)
+    ran = threading.Event()
+
+    def boom():
+        raise RuntimeError("fetch failed")
+
+    try:
+        queue.submit("a.yml", boom)
+        queue.submit("b.yml", ran.set)
+        assert ran.wait(5)
+        assert queue.submit("a.yml", lambda: None) is not None
+        with pytest.raises(ValueError):
+            queue.submit("c.yml", lambda: None, kind="urgent")
+    finally:
+        queue.shutdown(wait=True, timeout=5)
@@ -107,3 +107,33 @@ def test_should_skip_due_to_refresh_returns_false_when_no_fetched_at():
     context = CrawlSession(cfg)
     
     assert not policy.should_skip_due_to_refresh('http://example.com', context)
+
+
+def test_should_skip_due_to_refresh_uses_sitemap_lastmod_when_enabled():
+    pages_repo = MagicMock()
+    fetched = datetime.utcnow() - timedelta(days=1)
+    policy = CrawlPolicy(pages_repo)
+    cfg = CrawlerConfig(config_id=1, config_path='test.yml', refresh_days=7, fetch_mode="http", sitemap_options={"enabled": True})
+    context = CrawlSession(cfg)
+
+    # changed after the last fetch: refetch despite refresh_days
+    pages_repo.get_page_by_url.return_value = type('Page', (), {'fetched_at': fetched, 'sitemap_lastmod': datetime.utcnow()})
+    assert not policy.should_skip_due_to_refresh('http://example.com', context)
+
+    # unchanged: skip even without refresh_days
+    cfg = CrawlerConfig(config_id=1, config_path='test.yml', fetch_mode="http", sitemap_options={"enabled": True})
+    pages_repo.get_page_by_url.return_value = type('Page', (), {'fetched_at': fetched, 'sitemap_lastmod': fetched - timedelta(days=30)})
+    assert policy.should_skip_due_to_refresh('http://example.com', CrawlSession(cfg))
+
+
+def test_should_skip_due_to_refresh_waits_for_next_visit_when_revisit_enabled():
+    pages_repo = MagicMock()
+    policy = CrawlPolicy(pages_repo)
+    cfg = CrawlerConfig(config_id=1, config_path='test.yml', fetch_mode="http", revisit_options=True)
+    fetched = datetime.utcnow() - timedelta(days=30)
+
+    pages_repo.get_page_by_url.return_value = type('Page', (), {'fetched_at': fetched, 'next_visit_at': datetime.utcnow() + timedelta(hours=1)})
+    assert policy.should_skip_due_to_refresh('http://example.com', CrawlSession(cfg))
+
+    pages_repo.get_page_by_url.return_value = type('Page', (), {'fetched_at': fetched, 'next_visit_at': datetime.utcnow() - timedelta(hours=1)})
+    assert not policy.should_skip_due_to_refresh('http://example.com', CrawlSession(cfg))
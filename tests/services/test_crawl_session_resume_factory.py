@@ -17,8 +17,8 @@ def factory(mock_pages_repo):
     )
 
 
-def test_rebuild_loads_visited_urls_from_database(factory, mock_pages_repo):
-    """rebuild() should load visited URLs from database and populate tracker."""
+def test_rebuild_consults_database_for_visited_urls(factory, mock_pages_repo):
+    """rebuild() should look up visited URLs in the database instead of preloading them."""
     config = CrawlerConfig(
         config_id=42,
         config_path="test.yml",
@@ -28,24 +28,40 @@ def test_rebuild_loads_visited_urls_from_database(factory, mock_pages_repo):
         delay_seconds=0,
     )
     
-    # Mock the pages repo to return some visited URLs
-    mock_pages_repo.get_visited_urls_by_config.return_value = [
+    fetched = {
         "http://example.com",
         "http://example.com/page1",
         "http://example.com/page2",
-    ]
+    }
+    mock_pages_repo.is_url_fetched.side_effect = lambda config_id, url: url in fetched
+    mock_pages_repo.count_fetched_pages_by_config.return_value = 3
     
     session = factory.rebuild(config)
+    assert session.resumed
     
-    # Verify pages repo was called with correct config_id
-    mock_pages_repo.get_visited_urls_by_config.assert_called_once_with(42)
+    # Nothing is preloaded: startup cost does not depend on crawled URL count
+    mock_pages_repo.get_visited_urls_by_config.assert_not_called()
+    assert session.pages_crawled == 3
     
-    # Verify session has visited tracker pre-populated
     assert session.visited_tracker is not None
     assert session.visited_tracker.is_visited("http://example.com")
     assert session.visited_tracker.is_visited("http://example.com/page1")
     assert session.visited_tracker.is_visited("http://example.com/page2")
     assert not session.visited_tracker.is_visited("http://example.com/page3")
+    mock_pages_repo.is_url_fetched.assert_any_call(42, "http://example.com/page1")
+
+
+def test_rebuild_remembers_database_hits(factory, mock_pages_repo):
+    """A URL found in the database is only looked up once."""
+    config = CrawlerConfig(config_id=7, config_path="test.yml", fetch_mode="http")
+    mock_pages_repo.is_url_fetched.return_value = True
+    mock_pages_repo.count_fetched_pages_by_config.return_value = 0
+    
+    session = factory.rebuild(config)
+    
+    assert session.visited_tracker.is_visited("http://example.com")
+    assert session.visited_tracker.is_visited("http://example.com")
+    assert mock_pages_repo.is_url_fetched.call_count == 1
 
 
 def test_rebuild_handles_config_without_id(factory, mock_pages_repo):
@@ -62,7 +78,8 @@ def test_rebuild_handles_config_without_id(factory, mock_pages_repo):
     session = factory.rebuild(config)
     
     # Should not call pages repo if config_id is None
-    mock_pages_repo.get_visited_urls_by_config.assert_not_called()
+    mock_pages_repo.is_url_fetched.assert_not_called()
+    mock_pages_repo.count_fetched_pages_by_config.assert_not_called()
     
     # Should still create a valid session with empty tracker
     assert session.visited_tracker is not None
@@ -91,7 +108,7 @@ def test_rebuild_with_registry_starts_tracking(mock_pages_repo):
         delay_seconds=0,
     )
     
-    mock_pages_repo.get_visited_urls_by_config.return_value = []
+    mock_pages_repo.count_fetched_pages_by_config.return_value = 0
     
     session = factory.rebuild(config)
     
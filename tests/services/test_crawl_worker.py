@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+from infracrawl.services.crawl_job_queue import DbCrawlJobQueue
+from infracrawl.services.crawl_worker import CrawlWorker
+
+
+def _jobs_repo(*jobs):
+    return Mock(claim_next=Mock(side_effect=list(jobs) + [None]))
+
+
+def test_run_once_dispatches_by_kind_and_finishes():
+    repo = _jobs_repo(
+        {"job_id": 1, "config_path": "a.yml", "kind": "scheduled"},
+        {"job_id": 2, "config_path": "b.yml", "kind": "recovery"},
+    )
+    runner = Mock()
+    worker = CrawlWorker(repo, runner, worker_id="w1")
+
+    assert worker.run_once() and worker.run_once()
+    assert worker.run_once() is False
+    runner.run.assert_called_once_with("a.yml")
+    assert runner.run_config_resume.call_args.args[0].config_path == "b.yml"
+    assert [c.args for c in repo.finish.call_args_list] == [(1,), (2,)]
+
+
+def test_run_once_records_failures_and_requeues_on_shutdown():
+    repo = _jobs_repo(
+        {"job_id": 1, "config_path": "a.yml", "kind": "manual"},
+        {"job_id": 2, "config_path": "b.yml", "kind": "manual"},
+    )
+    runner = Mock(run=Mock(side_effect=[RuntimeError("db down"), None]))
+    registry = Mock(list_active=Mock(return_value=[{"id": "c1"}]))
+    worker = CrawlWorker(repo, runner, crawl_registry=registry, worker_id="w1")
+
+    worker.run_once()
+    repo.finish.assert_called_once_with(1, error="db down")
+
+    worker.stop()
+    registry.cancel.assert_called_once_with("c1")
+    worker.run_once()
+    repo.requeue_as_recovery.assert_called_once_with(2, 2)
+
+
+def test_db_queue_submits_rows_and_reports_snapshot():
+    repo = Mock(
+        enqueue=Mock(side_effect=[{"job_id": 1}, None]),
+        list_active=Mock(return_value=[
+            {"job_id": 1, "status": "running"},
+            {"job_id": 2, "status": "queued"},
+        ]),
+    )
+    queue = DbCrawlJobQueue(repo)
+    assert queue.submit("a.yml", Mock(), "a.yml", kind="scheduled") == {"job_id": 1}
+    repo.enqueue.assert_called_once_with("a.yml", "scheduled", 1)
+    assert queue.submit("a.yml", kind="manual") is None
+    snap = queue.snapshot()
+    assert snap["queue_depth"] == 1 and snap["running"][0]["job_id"] == 1
@@ -8,7 +8,10 @@ from types import SimpleNamespace
 
 from infracrawl.domain.config import CrawlerConfig
 from infracrawl.domain.crawl_session import CrawlSession
+from infracrawl.services.crawl_session_resume_factory import CrawlSessionResumeFactory
 from infracrawl.domain.http_response import HttpResponse
+from infracrawl.domain.fetch_state import FetchState
+from infracrawl.exceptions import HttpFetchError
 
 
 @pytest.fixture
@@ -73,8 +76,25 @@ def test_crawl_skips_robots(executor_with_mocks):
     cfg = CrawlerConfig(config_id=None, config_path='p', root_urls=['http://example.com'], max_depth=1, fetch_mode="http", delay_seconds=0)
     session = CrawlSession(cfg)
     executor.crawl(session)
-    # Should not fetch if robots disallowed
+    # Should not fetch if robots disallowed, and the page leaves the frontier
     assert not fetcher.fetch.called
+    assert pages_repo.mark_skipped.call_args.args == ('http://example.com/', "robots")
+
+
+def test_crawl_marks_failed_fetch_and_leaves_it_out_of_flight(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pages_repo.ensure_page.return_value = 1
+    pages_repo.get_undiscovered_urls_by_depth.return_value = []
+    fetcher.fetch = MagicMock(side_effect=HttpFetchError("http://example.com/", ConnectionError("refused")))
+    cfg = CrawlerConfig(config_id=None, config_path='p', root_urls=['http://example.com'], max_depth=1, fetch_mode="http", delay_seconds=0)
+    executor.crawl(CrawlSession(cfg))
+    states = [c.args[:2] for c in pages_repo.set_fetch_state.call_args_list]
+    assert states == [
+        ('http://example.com/', FetchState.IN_FLIGHT),
+        ('http://example.com/', FetchState.FAILED),
+        ('http://example.com/', FetchState.PENDING),  # no-op once failed: only in-flight pages revert
+    ]
+    assert pages_repo.set_fetch_state.call_args.kwargs == {"from_states": (FetchState.IN_FLIGHT,)}
 
 
 def test_crawl_refresh_days_skips_recent(executor_with_mocks):
@@ -107,3 +127,269 @@ def test_crawl_inserts_links(executor_with_mocks):
     executor.crawl(session)
     # Should insert links via batch method
     assert links_repo.insert_links_batch.called
+
+
+def _article(stamp: str, links: str = "") -> str:
+    import random
+    rng = random.Random(1)
+    body = " ".join(f"w{rng.randint(0, 5000)}" for _ in range(2000))
+    return f"<html><body><p>Updated {stamp}</p><p>{body}</p>{links}</body></html>"
+
+
+@pytest.mark.parametrize("follow_links", [None, False])
+def test_crawl_follows_links_of_stored_near_duplicates_unless_disabled(follow_links):
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import sessionmaker
+    from infracrawl.db.models import Base, Page as DBPage
+    from infracrawl.repository.links import LinksRepository
+    from infracrawl.repository.pages import PagesRepository
+    from infracrawl.services.content_review_service import ContentReviewService
+    from infracrawl.services.page_fetch_persist_service import PageFetchPersistService
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    sf = sessionmaker(bind=engine, future=True)
+    pages_repo, links_repo = PagesRepository(sf), LinksRepository(sf)
+    site = {
+        "http://example.com/": _article("2026-01-01", '<a href="/dup">dup</a><a href="/other">other</a>'),
+        "http://example.com/dup": _article("2026-02-14", '<a href="/only-from-dup">next</a>'),
+        "http://example.com/other": "<html><body><p>Something else entirely</p></body></html>",
+    }
+    fetcher = MagicMock()
+    fetcher.fetch.side_effect = lambda url, **kwargs: HttpResponse(200, site.get(url, "<html></html>"))
+    crawl_policy = MagicMock()
+    crawl_policy.should_skip_due_to_depth.return_value = False
+    crawl_policy.should_skip_due_to_robots.return_value = False
+    crawl_policy.should_skip_due_to_refresh.return_value = False
+    provider_factory = ConfiguredCrawlProviderFactory(
+        fetcher_factory=MagicMock(get=MagicMock(return_value=fetcher)),
+        pages_repo=pages_repo,
+        crawl_policy=crawl_policy,
+        link_processor=LinkProcessor(ContentReviewService(), LinkPersister(pages_repo, links_repo)),
+        fetch_persist_service=PageFetchPersistService(http_service=MagicMock(), pages_repo=pages_repo),
+    )
+    options = {"skip": True}
+    if follow_links is not None:
+        options["follow_links"] = follow_links
+    cfg = CrawlerConfig(
+        config_id=1, config_path='p', root_urls=['http://example.com/'], max_depth=1, fetch_mode="http",
+        delay_seconds=0, near_duplicate_options=options,
+    )
+    CrawlExecutor(provider_factory=provider_factory).crawl(CrawlSession(cfg))
+
+    with sf() as s:
+        rows = {r.page_url: r for r in s.execute(select(DBPage)).scalars()}
+    assert rows["http://example.com/dup"].page_content == ""  # body not stored
+    if follow_links is False:
+        assert "http://example.com/only-from-dup" not in rows
+    else:
+        # Discovered through the near-duplicate, queued behind a regular link at the same depth
+        assert rows["http://example.com/only-from-dup"].fetch_state == FetchState.PENDING
+        assert rows["http://example.com/only-from-dup"].priority < rows["http://example.com/other"].priority
+
+
+def test_crawl_drains_depth_in_batches_and_skips_stuck_pages(executor_with_mocks, monkeypatch):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    import infracrawl.services.crawl_executor as crawl_executor
+    monkeypatch.setattr(crawl_executor, "FRONTIER_BATCH_SIZE", 2)
+
+    # Highest priority first; the blocked page never leaves this mocked frontier
+    pending = {1: ["http://example.com/blocked", "http://example.com/a", "http://example.com/b", "http://example.com/c"]}
+    pages_repo.get_undiscovered_urls_by_depth.side_effect = lambda config_id, depth, limit: pending.get(depth, [])[:limit]
+    crawl_policy.should_skip_due_to_robots.side_effect = lambda url, ctx: url.endswith("/blocked")
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html></html>'))
+    content_review_service.extract_links = MagicMock(return_value=[])
+
+    def persist(page, **kwargs):
+        pending[1].remove(page.page_url)
+        return True
+
+    provider_factory.fetch_persist_service.extract_and_persist.side_effect = persist
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=[], max_depth=2, fetch_mode="http", delay_seconds=0)
+    executor.crawl(CrawlSession(cfg))
+
+    fetched = [c.args[0] for c in fetcher.fetch.call_args_list]
+    assert fetched == ["http://example.com/a", "http://example.com/b", "http://example.com/c"]
+    # Every read stays one batch long however many pages got stuck
+    assert {c.kwargs["limit"] for c in pages_repo.get_undiscovered_urls_by_depth.call_args_list} == {2}
+
+
+def test_crawl_stops_handing_out_urls_when_page_budget_is_hit(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pending = ["http://example.com/%d" % i for i in range(5)]
+    pages_repo.get_undiscovered_urls_by_depth.side_effect = lambda config_id, depth, limit: list(pending) if depth == 1 else []
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html>0123456789</html>'))
+    content_review_service.extract_links = MagicMock(return_value=[])
+
+    def persist(page, **kwargs):
+        pending.remove(page.page_url)
+        return True
+
+    provider_factory.fetch_persist_service.extract_and_persist.side_effect = persist
+    cfg = CrawlerConfig(
+        config_id=1, config_path='p', root_urls=[], max_depth=3, fetch_mode="http", delay_seconds=0, max_pages=2,
+    )
+    session = CrawlSession(cfg)
+    result = executor.crawl(session)
+
+    assert fetcher.fetch.call_count == 2
+    assert result.pages_crawled == 2
+    assert result.stop_reason == "max_pages"
+    assert result.budget_limited and not result.stopped
+    assert session.bytes_fetched == 2 * len('<html>0123456789</html>')
+    assert not session.is_stopped()
+
+
+def test_crawl_refetches_changed_sitemap_pages_before_the_depth_1_frontier(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pending = ["http://example.com/from-sitemap"]
+    pages_repo.get_undiscovered_urls_by_depth.side_effect = lambda config_id, depth, limit: list(pending) if depth == 1 else []
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html></html>'))
+    content_review_service.extract_links = MagicMock(return_value=[])
+
+    def persist(page, **kwargs):
+        if page.page_url in pending:
+            pending.remove(page.page_url)
+        return True
+
+    provider_factory.fetch_persist_service.extract_and_persist.side_effect = persist
+    executor.sitemap_seeder = MagicMock()
+    executor.sitemap_seeder.seed.return_value = ["http://example.com/changed"]
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=[], max_depth=1, fetch_mode="http", delay_seconds=0)
+    executor.crawl(CrawlSession(cfg))
+
+    executor.sitemap_seeder.seed.assert_called_once()
+    fetched = [c.args[0] for c in fetcher.fetch.call_args_list]
+    assert fetched == ["http://example.com/changed", "http://example.com/from-sitemap"]
+
+
+
+def test_crawl_refetches_due_pages_at_any_depth_before_the_depth_1_frontier(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pending = ["http://example.com/new"]
+    due = [("http://example.com/deep", 2), ("http://example.com/news", 1)]
+    pages_repo.get_undiscovered_urls_by_depth.side_effect = lambda config_id, depth, limit: list(pending) if depth == 1 else []
+    pages_repo.get_due_urls.side_effect = lambda config_id, now, max_depth, limit: list(due)[:limit]
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html></html>'))
+    content_review_service.extract_links = MagicMock(return_value=[])
+    depths = {}
+
+    def persist(page, **kwargs):
+        depths[page.page_url] = page.discovered_depth
+        due[:] = [entry for entry in due if entry[0] != page.page_url]
+        if page.page_url in pending:
+            pending.remove(page.page_url)
+        return True
+
+    provider_factory.fetch_persist_service.extract_and_persist.side_effect = persist
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=[], max_depth=2, fetch_mode="http", delay_seconds=0, revisit_options=True)
+    executor.crawl(CrawlSession(cfg))
+
+    fetched = [c.args[0] for c in fetcher.fetch.call_args_list]
+    assert fetched == ["http://example.com/deep", "http://example.com/news", "http://example.com/new"]
+    assert depths["http://example.com/deep"] == 2
+    assert pages_repo.get_due_urls.call_args.kwargs["max_depth"] == 2
+
+
+def test_resumed_crawl_requeues_in_flight_pages_only(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pages_repo.get_undiscovered_urls_by_depth.return_value = []
+    pages_repo.is_url_fetched.return_value = True
+    pages_repo.count_fetched_pages_by_config.return_value = 5
+    cfg = CrawlerConfig(config_id=3, config_path='p', root_urls=['http://example.com'], max_depth=1, fetch_mode="http", delay_seconds=0)
+    session = CrawlSessionResumeFactory(pages_repo=pages_repo).rebuild(cfg)
+    assert len(session.visited_tracker) == 0  # nothing preloaded; still a resume
+
+    executor.crawl(session)
+
+    pages_repo.requeue_unfetched.assert_called_once_with(3, (FetchState.IN_FLIGHT,))
+
+
+def test_resumed_crawl_counts_max_pages_from_zero(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pending = ["http://example.com/%d" % i for i in range(5)]
+    pages_repo.get_undiscovered_urls_by_depth.side_effect = lambda config_id, depth, limit: list(pending) if depth == 1 else []
+    pages_repo.is_url_fetched.return_value = False
+    pages_repo.count_fetched_pages_by_config.return_value = 50
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html></html>'))
+    content_review_service.extract_links = MagicMock(return_value=[])
+
+    def persist(page, **kwargs):
+        pending.remove(page.page_url)
+        return True
+
+    provider_factory.fetch_persist_service.extract_and_persist.side_effect = persist
+    cfg = CrawlerConfig(
+        config_id=1, config_path='p', root_urls=[], max_depth=3, fetch_mode="http", delay_seconds=0, max_pages=2,
+    )
+    session = CrawlSessionResumeFactory(pages_repo=pages_repo).rebuild(cfg)
+    result = executor.crawl(session)
+
+    # 50 pages from earlier runs do not use up this run's budget
+    assert fetcher.fetch.call_count == 2
+    assert result.stop_reason == "max_pages"
+    assert session.pages_this_run == 2
+    assert session.pages_crawled == 52
+
+
+def test_crawl_prefetches_robots_for_roots_and_discovered_links(executor_with_mocks):
+    executor, pages_repo, links_repo, fetcher, provider_factory, content_review_service, crawl_policy = executor_with_mocks
+    pages_repo.get_undiscovered_urls_by_depth.return_value = []
+    pages_repo.ensure_pages_batch.return_value = {"http://blog.example.com/post": 2}
+    fetcher.fetch = MagicMock(return_value=HttpResponse(200, '<html></html>'))
+    content_review_service.extract_links = MagicMock(return_value=[("http://blog.example.com/post", "post")])
+    prefetcher = MagicMock()
+    prefetcher.filter_allowed.side_effect = lambda urls, enabled, cached_only: list(urls)
+    executor.robots_prefetcher = prefetcher
+    provider_factory.link_processor.robots_service = prefetcher
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=['http://example.com', 'http://other.com'], max_depth=1, fetch_mode="http", delay_seconds=0)
+    executor.crawl(CrawlSession(cfg))
+
+    # fresh crawl: pages that failed or were skipped last time are retried
+    pages_repo.requeue_unfetched.assert_called_once_with(1)
+    prefetched = [list(c.args[0]) for c in prefetcher.prefetch.call_args_list]
+    assert prefetched[0] == ['http://example.com', 'http://other.com']
+    assert ["http://blog.example.com/post"] in prefetched[1:]
+
+
+def test_link_processor_drops_links_disallowed_by_robots():
+    from infracrawl.domain.page import Page
+    from infracrawl.services.robots_service import RobotsService
+
+    robots = RobotsService(MagicMock(fetch_robots=MagicMock(return_value=HttpResponse(200, "User-agent: *\nDisallow: /private"))), user_agent="InfraCrawl/0.1")
+    robots.allowed_by_robots("http://example.com/", True)  # rules now cached
+    persister = MagicMock()
+    review = MagicMock(extract_links=MagicMock(return_value=[("http://example.com/private/a", "a"), ("http://example.com/b", "b")]))
+    processor = LinkProcessor(review, persister, robots_service=robots)
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=['http://example.com/'], fetch_mode="http")
+    session = CrawlSession(cfg)
+    session.current_root = "http://example.com/"
+    page = Page(page_url="http://example.com/", page_id=1, page_content="<html></html>", config_id=1)
+    page.discovered_depth = 0
+
+    processor.process(page, session)
+
+    assert persister.persist_links.call_args.kwargs["links"] == [("http://example.com/b", "b")]
+
+def test_link_processor_canonicalizes_and_dedupes_before_persisting():
+    link_persister = MagicMock()
+    content_review_service = MagicMock()
+    content_review_service.extract_links.return_value = [
+        ("https://example.com/events#top", "Events"),
+        ("https://example.com/events?utm_source=nav", "Events again"),
+        ("https://EXAMPLE.com:443/about", "About"),
+    ]
+    link_processor = LinkProcessor(content_review_service, link_persister)
+    cfg = CrawlerConfig(config_id=1, config_path='p', root_urls=['https://example.com/'], fetch_mode="http")
+    session = CrawlSession(cfg)
+    session.current_root = "https://example.com/"
+    page = SimpleNamespace(page_id=10, page_url="https://example.com/", page_content="<html></html>", discovered_depth=0, config_id=1)
+
+    link_processor.process(page, session)
+
+    persisted = link_persister.persist_links.call_args.kwargs["links"]
+    assert persisted == [
+        ("https://example.com/events", "Events"),
+        ("https://example.com/about", "About"),
+    ]
+    assert session.links_discovered == 2
@@ -9,6 +9,7 @@ from infracrawl.domain.config import CrawlerConfig
 from infracrawl.domain.http_response import HttpResponse
 from infracrawl.domain import CrawlSession
 from infracrawl.domain.page import Page
+from infracrawl.exceptions import ResponseTooLargeError
 
 
 def make_executor_with(mocks=None):
@@ -49,7 +50,7 @@ def make_config(config_id: int) -> CrawlerConfig:
 
 def test_fetch_raises_logs_and_returns_none(caplog):
     http = MagicMock()
-    http.fetch.side_effect = RuntimeError("network down")
+    http.fetch_page.side_effect = RuntimeError("network down")
     pages = MagicMock()
     executor, provider_factory = make_executor_with({"http_service": http, "pages_repo": pages})
     cfg = make_config(1)
@@ -66,7 +67,7 @@ def test_fetch_raises_logs_and_returns_none(caplog):
 
 def test_storage_failure_logs_and_returns_none(caplog):
     http = MagicMock()
-    http.fetch.return_value = HttpResponse(200, "ok")
+    http.fetch_page.return_value = HttpResponse(200, "ok")
     pages = MagicMock()
     pages.upsert_page.side_effect = Exception("db write failed")
     executor, provider_factory = make_executor_with({"http_service": http, "pages_repo": pages})
@@ -84,7 +85,7 @@ def test_storage_failure_logs_and_returns_none(caplog):
 
 def test_non_200_status_is_logged_and_body_returned(caplog):
     http = MagicMock()
-    http.fetch.return_value = HttpResponse(500, "server error")
+    http.fetch_page.return_value = HttpResponse(500, "server error")
     pages = MagicMock()
     mock_page = Page(page_url="http://example.test/fail", page_id=42)
     pages.upsert_page.return_value = mock_page
@@ -100,3 +101,15 @@ def test_non_200_status_is_logged_and_body_returned(caplog):
     assert success is True
     assert page.page_content == "server error"
     assert any("Non-success status" in r.message or "Non-success status" in r.getMessage() for r in caplog.records)
+
+
+def test_too_large_page_is_skipped_not_failed():
+    http = MagicMock()
+    http.fetch_page.side_effect = ResponseTooLargeError("http://example.test/big.iso", 10)
+    pages = MagicMock()
+    executor, provider_factory = make_executor_with({"http_service": http, "pages_repo": pages})
+    provider = provider_factory.build(CrawlSession(make_config(4)))
+
+    assert provider.fetch_and_persist(Page(page_url="http://example.test/big.iso")) is False
+    pages.mark_skipped.assert_called_once_with("http://example.test/big.iso", "too_large")
+    pages.set_fetch_state.assert_not_called()
@@ -1,69 +1,89 @@
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock
+from fastapi import BackgroundTasks
 from infracrawl.api.routers.crawlers import create_crawlers_router
 from infracrawl.domain.config import CrawlerConfig
 
 
-def test_remove_endpoint_deletes_pages_and_links_for_config():
-    """Test that /crawlers/remove deletes all pages and links for a config."""
-    # Setup mocks
-    mock_pages_repo = MagicMock()
-    mock_links_repo = MagicMock()
+def _route(router, path, method):
+    for route in router.routes:
+        if getattr(route, 'path', None) == path and method in getattr(route, 'methods', set()):
+            return route.endpoint
+    raise AssertionError(f"{method} {path} not found")
+
+
+def _make_router(mock_pages_repo, config_stats_repo=None):
     mock_config_service = MagicMock()
-    
-    # Create a test config
-    config = CrawlerConfig(
+    mock_config_service.get_config.return_value = CrawlerConfig(
         config_id=1,
         config_path="test.yml",
         root_urls=["http://example.com"],
         max_depth=1,
         fetch_mode="http",
     )
-    
-    # Mock config_service.get_config to return the test config
-    mock_config_service.get_config.return_value = config
-    
-    # Mock pages_repo to return page IDs and delete count
-    page_ids = [1, 2, 3]  # 3 pages from config
-    mock_pages_repo.get_page_ids_by_config.return_value = page_ids
-    mock_pages_repo.delete_pages_by_ids.return_value = 3
-    
-    # Mock links_repo methods
-    # get_all_page_ids_referenced_by_pages returns the config pages (no additional referenced pages in this case)
-    mock_links_repo.get_all_page_ids_referenced_by_pages.return_value = page_ids
-    mock_links_repo.delete_links_for_page_ids.return_value = 5  # 5 links deleted
-    
-    # Create router
     router = create_crawlers_router(
         pages_repo=mock_pages_repo,
-        links_repo=mock_links_repo,
+        links_repo=MagicMock(),
         config_service=mock_config_service,
         session_factory=MagicMock(),
         start_crawl_callback=MagicMock(),
         crawl_registry=None,
         crawls_repo=MagicMock(),
+        config_stats_repo=config_stats_repo,
     )
-    
-    # Find the remove endpoint function - it's defined as @router.delete("/remove")
-    remove_endpoint = None
-    for route in router.routes:
-        if hasattr(route, 'path') and route.path == '/crawlers/remove':
-            remove_endpoint = route.endpoint
-            break
-    
-    assert remove_endpoint is not None, "Remove endpoint should exist"
-    
-    # Call the endpoint with config parameter
-    result = remove_endpoint(config="test.yml")
-    
-    # Verify response
-    assert result["status"] == "removed"
-    assert result["deleted_pages"] == 3
-    assert result["deleted_links"] == 5
-    
-    # Verify that the repos were called correctly
+    return router, mock_config_service
+
+
+def test_remove_endpoint_deletes_pages_and_links_for_config_in_background_chunks():
+    """DELETE /crawlers/remove returns a job and deletes config data chunk by chunk."""
+    mock_pages_repo = MagicMock()
+    mock_pages_repo.count_pages_by_config.return_value = 3
+    mock_pages_repo.delete_config_pages_chunk.side_effect = [(2, 4), (1, 1), (0, 0)]
+    config_stats_repo = MagicMock()
+    router, mock_config_service = _make_router(mock_pages_repo, config_stats_repo)
+
+    remove_endpoint = _route(router, '/crawlers/remove', 'DELETE')
+    background = BackgroundTasks()
+    result = remove_endpoint(config="test.yml", background_tasks=background)
+
+    assert result["status"] == "pending"
+    assert result["config_id"] == 1
+    job_id = result["job_id"]
+    # Nothing is deleted in the request itself
+    mock_pages_repo.delete_config_pages_chunk.assert_not_called()
+
+    asyncio.run(background())
+
+    job = _route(router, '/crawlers/remove/{job_id}', 'GET')(job_id)
+    assert job["status"] == "completed"
+    assert job["total_pages"] == 3
+    assert job["deleted_pages"] == 3
+    assert job["deleted_links"] == 5
+    assert job["chunks"] == 2
     mock_config_service.get_config.assert_called_once_with("test.yml")
-    mock_pages_repo.get_page_ids_by_config.assert_called_once_with(1)
-    mock_links_repo.get_all_page_ids_referenced_by_pages.assert_called_once_with(page_ids)
-    mock_links_repo.delete_links_for_page_ids.assert_called_once_with(page_ids)
-    mock_pages_repo.delete_pages_by_ids.assert_called_once_with(page_ids)
+    mock_pages_repo.delete_config_pages_chunk.assert_called_with(1, 1000)
+    config_stats_repo.reconcile.assert_called_once_with(1)
+
+
+def test_remove_endpoint_reuses_in_progress_job_and_supports_cancel():
+    mock_pages_repo = MagicMock()
+    mock_pages_repo.count_pages_by_config.return_value = 10
+    router, _ = _make_router(mock_pages_repo)
+    remove_endpoint = _route(router, '/crawlers/remove', 'DELETE')
+
+    background = BackgroundTasks()
+    first = remove_endpoint(config="test.yml", background_tasks=background)
+    second = remove_endpoint(config="test.yml", background_tasks=BackgroundTasks())
+    assert second["job_id"] == first["job_id"]
+
+    cancel = _route(router, '/crawlers/remove/{job_id}/cancel', 'POST')
+    assert cancel(first["job_id"]) == {"status": "cancelling", "job_id": first["job_id"]}
+    asyncio.run(background())
+
+    job = _route(router, '/crawlers/remove/{job_id}', 'GET')(first["job_id"])
+    assert job["status"] == "cancelled"
+    mock_pages_repo.delete_config_pages_chunk.assert_not_called()
+    with pytest.raises(Exception):
+        cancel(first["job_id"])
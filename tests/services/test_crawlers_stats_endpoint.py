@@ -23,12 +23,15 @@ def test_get_config_stats_returns_page_and_link_counts():
     # Mock config_service.get_config to return the test config
     mock_config_service.get_config.return_value = config
     
-    # Mock pages_repo to return fetched page IDs (only pages with content)
-    page_ids = [1, 2, 3]  # 3 pages
-    mock_pages_repo.get_fetched_page_ids_by_config.return_value = page_ids
-    
-    # Mock links_repo to return link count
-    mock_links_repo.count_links_for_page_ids.return_value = 5  # 5 links
+    # Mock pages_repo to return SQL-aggregated stats (fetched pages only in "pages")
+    mock_pages_repo.get_config_stats.return_value = {
+        "pages": 3,
+        "pending": 2,
+        "total_pages": 5,
+        "links": 5,
+        "by_depth": {"0": {"fetched": 1, "pending": 0}, "1": {"fetched": 2, "pending": 2}},
+        "by_status_class": {"2xx": 3},
+    }
     
     # Create router
     router = create_crawlers_router(
@@ -57,8 +60,56 @@ def test_get_config_stats_returns_page_and_link_counts():
     assert result["config_path"] == "test.yml"
     assert result["pages"] == 3
     assert result["links"] == 5
+    assert result["pending"] == 2
+    assert result["by_depth"]["1"] == {"fetched": 2, "pending": 2}
+    assert result["by_status_class"] == {"2xx": 3}
     
-    # Verify that the repos were called correctly
+    # Verify stats come from a single aggregate query, not ID lists
     mock_config_service.get_config.assert_called_once_with("test.yml")
-    mock_pages_repo.get_fetched_page_ids_by_config.assert_called_once_with(1)
-    mock_links_repo.count_links_for_page_ids.assert_called_once_with(page_ids)
+    mock_pages_repo.get_config_stats.assert_called_once_with(1)
+    mock_pages_repo.get_fetched_page_ids_by_config.assert_not_called()
+
+
+def test_get_config_stats_reads_counters_row_when_available():
+    mock_pages_repo = MagicMock()
+    mock_config_service = MagicMock()
+    mock_config_service.get_config.return_value = CrawlerConfig(config_id=7, config_path="big.yml", fetch_mode="http")
+    config_stats_repo = MagicMock()
+    config_stats_repo.get.return_value = {
+        "config_id": 7,
+        "pages_discovered": 10,
+        "pages_fetched": 6,
+        "pages_failed": 1,
+        "pages_skipped": 2,
+        "pages_fetch_failed": 1,
+        "links": 40,
+        "bytes_stored": 1234,
+        "last_fetched_at": None,
+    }
+
+    router = create_crawlers_router(
+        mock_pages_repo, MagicMock(), mock_config_service, MagicMock(), MagicMock(), None, MagicMock(),
+        config_stats_repo=config_stats_repo,
+    )
+    stats_endpoint = next(r.endpoint for r in router.routes if '/stats/' in getattr(r, 'path', ''))
+
+    result = stats_endpoint("big.yml")
+    assert result["pages"] == 6
+    # Skipped and failed pages are not pending
+    assert result["pending"] == 1
+    assert result["skipped"] == 2
+    assert result["links"] == 40
+    assert result["bytes_stored"] == 1234
+    config_stats_repo.get.assert_called_once_with(7)
+    mock_pages_repo.get_config_stats.assert_not_called()
+
+    mock_pages_repo.get_config_stats.return_value = {"by_depth": {"0": {"fetched": 6, "pending": 4}}, "by_status_class": {}}
+    result = stats_endpoint("big.yml", breakdown=True)
+    assert result["by_depth"] == {"0": {"fetched": 6, "pending": 4}}
+    assert result["pages"] == 6
+
+    # The exact aggregate is not overwritten by the counters
+    mock_pages_repo.get_config_stats.return_value = {"pages": 6, "pending": 0, "skipped": 4, "by_state": {"fetched": 6, "skipped": 4}}
+    result = stats_endpoint("big.yml", breakdown=True)
+    assert (result["pending"], result["skipped"]) == (0, 4)
+    assert result["bytes_stored"] == 1234
@@ -0,0 +1,64 @@
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from infracrawl.services.export_writers import (
+    gzip_stream,
+    ndjson_stream,
+    parquet_available,
+    parquet_stream,
+    warc_stream,
+)
+
+ROWS = [
+    {"page_id": 1, "page_url": "https://example.com/", "page_content": "<p>héllo</p>", "http_status": 200,
+     "fetched_at": datetime(2026, 1, 20, 12, 0, tzinfo=timezone.utc)},
+    {"page_id": 2, "page_url": "https://example.com/missing", "page_content": "nope", "http_status": 404,
+     "fetched_at": None},
+    {"page_id": 3, "page_url": "https://example.com/pending", "page_content": None, "http_status": None,
+     "fetched_at": None},
+]
+
+
+def test_gzip_stream_round_trips_ndjson():
+    plain = b"".join(ndjson_stream(ROWS))
+    compressed = b"".join(gzip_stream(ndjson_stream(ROWS * 2000)))
+    lines = gzip.decompress(compressed).splitlines()
+    assert len(lines) == 6000
+    assert b"\n".join(lines[:3]) + b"\n" == plain
+    assert json.loads(lines[0])["page_url"] == "https://example.com/"
+
+
+def test_warc_stream_writes_warcinfo_and_response_records():
+    data = gzip.decompress(b"".join(warc_stream(ROWS, filename="x.warc.gz")))
+    records = [r for r in data.split(b"WARC/1.1\r\n") if r]
+    assert b"WARC-Type: warcinfo" in records[0]
+    # The page without content is skipped
+    assert len(records) == 3
+    first = records[1]
+    assert b"WARC-Target-URI: https://example.com/" in first
+    assert b"WARC-Date: 2026-01-20T12:00:00Z" in first
+    assert b"HTTP/1.1 200 OK\r\n" in first
+    assert "<p>héllo</p>".encode("utf-8") in first
+    assert b"HTTP/1.1 404 Not Found\r\n" in records[2]
+    head, _, block = first.partition(b"\r\n\r\n")
+    length = int([l for l in head.split(b"\r\n") if l.startswith(b"Content-Length")][0].split(b": ")[1])
+    assert len(block) == length + 4  # record block + trailing CRLF CRLF
+
+
+def test_parquet_stream_requires_pyarrow():
+    if parquet_available():
+        pytest.skip("pyarrow is installed; missing-import behavior not applicable")
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        b"".join(parquet_stream(ROWS, ["page_id", "page_url"]))
+
+
+def test_parquet_stream_writes_row_groups():
+    pq = pytest.importorskip("pyarrow.parquet")
+    data = b"".join(parquet_stream(ROWS, ["page_id", "page_url", "http_status"], row_group_size=2))
+    f = pq.ParquetFile(io.BytesIO(data))
+    assert f.metadata.num_row_groups == 2
+    assert f.read().column("page_url").to_pylist() == [r["page_url"] for r in ROWS]
@@ -33,3 +33,37 @@ def test_fetcher_factory_unknown_mode_raises():
     factory = FetcherFactory(http_fetcher=_DummyFetcher(), headless_fetcher=_DummyFetcher())
     with pytest.raises(ValueError, match="Unknown fetch_mode"):
         factory.get(_make_config("nope"))
+
+
+class _DummyHttpService:
+    user_agent = "TestAgent"
+    max_body_bytes = 100
+
+
+class _DummyHttpFetcher(_DummyFetcher):
+    _http_service = _DummyHttpService()
+
+
+def _make_http_config(http_options: dict) -> CrawlerConfig:
+    return CrawlerConfig(
+        config_id=1,
+        config_path="test",
+        root_urls=["http://example.test"],
+        fetch_mode="http",
+        http_options=http_options,
+    )
+
+
+def test_fetcher_factory_parses_max_body_bytes_sizes():
+    factory = FetcherFactory(http_fetcher=_DummyHttpFetcher(), headless_fetcher=_DummyFetcher())
+    fetcher = factory.get(_make_http_config({"max_body_bytes": "10MB"}))
+    assert fetcher._http_service.max_body_bytes == 10 * 1024 * 1024
+    fetcher = factory.get(_make_http_config({"timeout_ms": 5000}))
+    assert fetcher._http_service.max_body_bytes == 100
+
+
+def test_fetcher_factory_builds_configured_http_fetcher_once_per_config():
+    factory = FetcherFactory(http_fetcher=_DummyHttpFetcher(), headless_fetcher=_DummyFetcher())
+    first = factory.get(_make_http_config({"timeout_ms": 5000}))
+    assert factory.get(_make_http_config({"timeout_ms": 5000})) is first
+    assert factory.get(_make_http_config({"timeout_ms": 6000})) is not first
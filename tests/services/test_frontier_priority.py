@@ -0,0 +1,35 @@
+import math
+
+import pytest
+
+from infracrawl.domain.config import CrawlerConfig
+from infracrawl.services.frontier_priority import FrontierPriority
+
+
+def test_score_combines_inlinks_depth_and_url_weights():
+    priority = FrontierPriority(inlink_weight=2.0, depth_weight=0.5, url_weights=(("*/docs/*", 3.0), ("*.pdf", -1.0)))
+    assert priority.score("https://a/", 0, 0) == 0.0
+    assert priority.score("https://a/x", 2, 3) == pytest.approx(2.0 * math.log1p(3) - 1.0)
+    assert priority.score("https://a/docs/a.pdf", None, 0) == pytest.approx(2.0)
+
+
+def test_more_inlinks_beat_one_extra_level_of_depth_by_default():
+    priority = FrontierPriority()
+    assert priority.score("https://a/hub", 3, 10) > priority.score("https://a/leaf", 2, 1)
+
+
+def test_for_config_reads_priority_section():
+    cfg = CrawlerConfig(
+        None, "a.yml", fetch_mode="http",
+        priority_options={"depth_weight": 2, "url_weights": {"*/blog/*": 1.5}},
+    )
+    priority = FrontierPriority.for_config(cfg)
+    assert priority == FrontierPriority(inlink_weight=1.0, depth_weight=2.0, url_weights=(("*/blog/*", 1.5),))
+    assert FrontierPriority.for_config(None) == FrontierPriority()
+
+
+def test_links_of_near_duplicates_score_lower_by_the_configured_penalty():
+    priority = FrontierPriority.from_options({"near_duplicate_penalty": 3})
+    penalized = priority.for_near_duplicate_links()
+    assert penalized.score("https://a/x", 1, 2) == pytest.approx(priority.score("https://a/x", 1, 2) - 3.0)
+    assert FrontierPriority().for_near_duplicate_links().score("https://a/", 0, 0) == -2.0
@@ -1,6 +1,9 @@
 from infracrawl.services.http_service import HttpService
-from infracrawl.exceptions import HttpFetchError
+from infracrawl.services.fetcher import HttpServiceFetcher
+from infracrawl.domain.http_response import HttpResponse
+from infracrawl.exceptions import HttpFetchError, ResponseTooLargeError
 from unittest.mock import Mock, PropertyMock
+import pytest
 import requests
 
 
@@ -93,3 +96,109 @@ def test_fetch_uses_custom_timeout():
     mock_http_client.assert_called_once()
     call_kwargs = mock_http_client.call_args[1]
     assert call_kwargs['timeout'] == 15
+
+
+def test_stream_yields_chunks_and_closes_response():
+    mock_http_client = Mock()
+    resp = mock_http_client.return_value
+    resp.status_code = 200
+    resp.headers = {'Content-Type': 'application/xml'}
+    resp.iter_content.return_value = iter([b'<a>', b'</a>'])
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client)
+
+    with http.stream('http://example.com/sitemap.xml') as body:
+        assert body.status_code == 200
+        assert body.content_type == 'application/xml'
+        assert b''.join(body.chunks) == b'<a></a>'
+    assert mock_http_client.call_args.kwargs['stream'] is True
+    resp.close.assert_called_once()
+
+
+def test_fetch_robots_sends_validators_and_returns_headers():
+    mock_http_client = Mock()
+    mock_http_client.return_value.status_code = 304
+    mock_http_client.return_value.text = ''
+    mock_http_client.return_value.headers = {'ETag': '"v2"'}
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client)
+    response = http.fetch_robots('http://example.com/robots.txt', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+    headers = mock_http_client.call_args.kwargs['headers']
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert response.status_code == 304
+    assert response.headers['ETag'] == '"v2"'
+
+
+def _streamed(status=200, headers=None, chunks=(), encoding='utf-8'):
+    mock_http_client = Mock()
+    resp = mock_http_client.return_value
+    resp.status_code = status
+    resp.headers = headers or {}
+    resp.encoding = encoding
+    resp.iter_content.return_value = iter(chunks)
+    return mock_http_client, resp
+
+
+def test_fetch_page_streams_and_decodes_body():
+    mock_http_client, resp = _streamed(headers={'Content-Type': 'text/html'}, chunks=[b'<p>caf', b'\xc3\xa9</p>'])
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client, max_body_bytes=100)
+    response = http.fetch_page('http://example.com')
+    assert response.text == '<p>café</p>'
+    assert response.content_type == 'text/html'
+    assert mock_http_client.call_args.kwargs['stream'] is True
+    resp.close.assert_called_once()
+
+
+def test_fetch_page_rejected_content_type_is_never_read():
+    mock_http_client, resp = _streamed(headers={'Content-Type': 'application/pdf'}, chunks=[b'%PDF'])
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client)
+    response = http.fetch_page('http://example.com/a.pdf', accept_content_type=lambda ct: ct.startswith('text/'))
+    assert response.text == ''
+    assert response.content_type == 'application/pdf'
+    resp.iter_content.assert_not_called()
+    resp.close.assert_called_once()
+
+
+def test_fetch_page_enforces_max_body_bytes():
+    # Announced size: rejected before reading
+    mock_http_client, resp = _streamed(headers={'Content-Length': '11'}, chunks=[b'x' * 11])
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client, max_body_bytes=10)
+    with pytest.raises(ResponseTooLargeError):
+        http.fetch_page('http://example.com/big')
+    resp.iter_content.assert_not_called()
+
+    # No Content-Length: stops once the streamed bytes pass the limit
+    mock_http_client, resp = _streamed(chunks=[b'x' * 6, b'x' * 6, b'x' * 6])
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client, max_body_bytes=10)
+    with pytest.raises(ResponseTooLargeError) as exc:
+        http.fetch_page('http://example.com/big')
+    assert isinstance(exc.value, HttpFetchError) and exc.value.limit == 10
+    resp.close.assert_called_once()
+
+
+def test_probe_uses_head_and_falls_back_to_range_get():
+    head_client = Mock()
+    head_client.return_value.status_code = 200
+    head_client.return_value.headers = {'Content-Type': 'image/png', 'Content-Length': '5000'}
+    mock_http_client = Mock()
+    http = HttpService(user_agent='TestAgent', http_client=mock_http_client, head_client=head_client)
+    response = http.probe('http://example.com/a.png')
+    assert (response.status_code, response.content_type, response.text) == (200, 'image/png', '')
+    mock_http_client.assert_not_called()
+
+    head_client.return_value.status_code = 405
+    mock_http_client.return_value.status_code = 206
+    mock_http_client.return_value.headers = {'Content-Type': 'video/mp4', 'Content-Range': 'bytes 0-0/123456'}
+    response = http.probe('http://example.com/v.mp4')
+    assert response.content_type == 'video/mp4'
+    assert HttpService.content_length(response.headers) == 123456
+    assert mock_http_client.call_args.kwargs['headers']['Range'] == 'bytes=0-0'
+    mock_http_client.return_value.iter_content.assert_not_called()
+    mock_http_client.return_value.close.assert_called_once()
+
+
+def test_fetcher_probe_skips_get_for_rejected_type():
+    http = Mock()
+    http.probe.return_value = HttpResponse(200, '', 'application/pdf', {})
+    fetcher = HttpServiceFetcher(http, accept_content_type=lambda ct: ct.startswith('text/'), probe=True)
+    assert fetcher.fetch('http://example.com/a.pdf').content_type == 'application/pdf'
+    http.fetch_page.assert_not_called()
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from infracrawl.db.models import Base
+from infracrawl.domain import Link
+from infracrawl.domain.page import Page
+from infracrawl.repository.links import LinksRepository
+from infracrawl.repository.page_scores import PageScoresRepository
+from infracrawl.repository.pages import PagesRepository
+from infracrawl.services.link_graph import LinkGraph, LinkGraphService
+
+
+def _naive_pagerank(nodes, edges, damping=0.85, iterations=200):
+    out = {n: [d for s, d in edges if s == n] for n in nodes}
+    rank = {n: 1.0 / len(nodes) for n in nodes}
+    for _ in range(iterations):
+        dangling = sum(rank[n] for n in nodes if not out[n])
+        new = {n: (1 - damping + damping * dangling) / len(nodes) for n in nodes}
+        for n in nodes:
+            for d in out[n]:
+                new[d] += damping * rank[n] / len(out[n])
+        rank = new
+    return rank
+
+
+def test_degrees_ignore_duplicate_and_self_links():
+    graph = LinkGraph(np.array([10, 10, 10, 11, 12]), np.array([11, 11, 10, 12, 10]))
+    assert graph.page_ids.tolist() == [10, 11, 12]
+    assert graph.num_edges == 3
+    assert graph.in_degree().tolist() == [1, 1, 1]
+    assert graph.out_degree().tolist() == [1, 1, 1]
+
+
+@pytest.mark.parametrize("offset", [1, 10**12])  # dense and sorted page_id remapping
+def test_pagerank_matches_reference_implementation(offset):
+    # 5 has no inlinks, 6 has no outlinks
+    edges = [(1, 2), (1, 3), (2, 3), (3, 1), (4, 3), (5, 4), (3, 6)]
+    shifted = [(s + offset, d + offset) for s, d in edges]
+    graph = LinkGraph(np.array([s for s, _ in shifted]), np.array([d for _, d in shifted]))
+    rank = graph.pagerank()
+
+    expected = _naive_pagerank(sorted({n for e in shifted for n in e}), shifted)
+    assert rank.sum() == pytest.approx(1.0)
+    for page_id, score in zip(graph.page_ids.tolist(), rank.tolist()):
+        assert score == pytest.approx(expected[page_id], abs=1e-9)
+
+
+def test_empty_graph():
+    graph = LinkGraph.from_edge_batches([])
+    assert graph.num_nodes == 0
+    assert graph.pagerank().size == 0
+
+
+def test_compute_scores_writes_config_scores():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    sf = sessionmaker(bind=engine, future=True)
+    pages, links, scores = PagesRepository(sf), LinksRepository(sf), PageScoresRepository(sf)
+
+    ids = pages.ensure_pages_batch(["https://a/", "https://a/1", "https://a/2"], discovered_depth=0, config_id=1)
+    other = Page(page_url="https://b/", config_id=2)
+    pages.ensure_page(other)
+    root, one, two = ids["https://a/"], ids["https://a/1"], ids["https://a/2"]
+    links.insert_links_batch([
+        Link(link_id=None, link_from_id=root, link_to_id=one),
+        Link(link_id=None, link_from_id=root, link_to_id=two),
+        Link(link_id=None, link_from_id=one, link_to_id=two),
+        Link(link_id=None, link_from_id=two, link_to_id=root),
+    ])
+    links.insert_links_batch([Link(link_id=None, link_from_id=other.page_id, link_to_id=two)])
+
+    service = LinkGraphService(links, scores)
+    summary = service.compute_scores(1)
+    assert summary["pages"] == 3
+    assert summary["edges"] == 4
+
+    # Recomputing replaces rather than duplicates
+    service.compute_scores(1)
+    top = scores.top_pages(1)
+    assert [r["page_url"] for r in top] == ["https://a/2", "https://a/", "https://a/1"]
+    assert sum(r["pagerank"] for r in top) == pytest.approx(1.0)
+    assert top[0]["in_degree"] == 2
+    assert scores.top_pages(1, order_by="out_degree")[0]["page_url"] == "https://a/"
+    assert scores.top_pages(2) == []
@@ -144,3 +144,38 @@ def test_upsert_deduplicates_by_config_and_content_hash():
         ).scalars().all()
     # Should be only 1 page, not 2
     assert len(existing) == 1
+
+
+def _html_article(stamp: str, seed: int) -> str:
+    import random
+    rng = random.Random(seed)
+    body = " ".join(f"w{rng.randint(0, 5000)}" for _ in range(2000))
+    return f"<html><body><p>Updated {stamp}</p><p>{body}</p></body></html>"
+
+
+def test_near_duplicate_is_detected_and_body_not_stored():
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    pages_repo = PagesRepository(sessionmaker(bind=engine, future=True))
+    svc = PageFetchPersistService(http_service=DummyHttp(), pages_repo=pages_repo)
+
+    original = Page(page_url='http://a/1', page_content=_html_article('2026-01-01', 1), http_status=200, config_id=1)
+    assert svc.extract_and_persist(original, near_duplicate_distance=3, store_near_duplicates=False)
+    assert original.near_duplicate_of is None
+    assert original.simhash is not None
+
+    # Same config: skipped as a near-duplicate of the original
+    dup = Page(page_url='http://a/2', page_content=_html_article('2026-02-14', 1), http_status=200, config_id=1)
+    assert svc.extract_and_persist(dup, near_duplicate_distance=3, store_near_duplicates=False)
+    assert dup.near_duplicate_of == original.page_id
+    stored = pages_repo.get_page_by_url('http://a/2')
+    assert stored.page_content == ""
+    assert stored.plain_text is None
+    assert stored.simhash == dup.simhash
+
+    # Other configs and the page's own row never match
+    other = Page(page_url='http://b/1', page_content=_html_article('2026-02-14', 1), http_status=200, config_id=2)
+    assert svc.extract_and_persist(other, near_duplicate_distance=3)
+    assert other.near_duplicate_of is None
+    assert pages_repo.find_near_duplicate(1, original.simhash, exclude_url='http://a/1').page_id == dup.page_id
+    assert pages_repo.find_near_duplicate(1, original.simhash ^ 0xFFFF_FFFF) is None
@@ -0,0 +1,44 @@
+import pytest
+
+from infracrawl.domain.config import CrawlerConfig
+from infracrawl.services.revisit_policy import DAY, RevisitPolicy
+
+
+def test_from_options_defaults_and_shorthand():
+    assert not RevisitPolicy.from_options(None).enabled
+    policy = RevisitPolicy.from_options(True, refresh_days=3)
+    assert policy.enabled and policy.initial_seconds == 3 * DAY
+
+    policy = RevisitPolicy.from_options({"min_interval": "2h", "max_interval": "30d", "initial_interval": "1d"})
+    assert (policy.min_seconds, policy.max_seconds, policy.initial_seconds) == (7200, 30 * DAY, DAY)
+
+    with pytest.raises(ValueError):
+        RevisitPolicy.from_options({"min_interval": "10d", "max_interval": "1d"})
+
+
+def test_for_config_reads_revisit_section():
+    cfg = CrawlerConfig(config_id=1, config_path="a.yml", fetch_mode="http", refresh_days=2, revisit_options=True)
+    policy = RevisitPolicy.for_config(cfg)
+    assert policy.enabled and policy.initial_seconds == 2 * DAY
+    assert not RevisitPolicy.for_config(None).enabled
+
+
+def test_interval_without_history_uses_initial_interval():
+    policy = RevisitPolicy(enabled=True, initial_seconds=5 * DAY)
+    assert policy.interval(0, 0, 0) == 5 * DAY
+
+
+def test_interval_follows_change_rate():
+    policy = RevisitPolicy(enabled=True, min_seconds=3600, max_seconds=365 * DAY)
+    # changed on every daily check: revisit about daily or sooner
+    assert policy.interval(10, 10, 10 * DAY) < DAY
+    # changed on half of the daily checks: between one and two days
+    assert DAY < policy.interval(10, 5, 10 * DAY) < 2 * DAY
+
+
+def test_unchanged_page_backs_off_geometrically_and_is_clamped():
+    policy = RevisitPolicy(enabled=True, min_seconds=DAY, max_seconds=10 * DAY)
+    assert policy.interval(1, 0, DAY) == 2 * DAY
+    assert policy.interval(3, 0, 12 * DAY) == 8 * DAY
+    assert policy.interval(4, 0, 40 * DAY) == 10 * DAY
+    assert policy.interval(20, 20, 20 * 3600) == DAY
@@ -28,3 +28,11 @@ def test_clear_removes_all_entries():
     cache.clear()
     assert cache.get("https://example.com") is None
     assert cache.get("https://other.com") is None
+
+
+def test_get_default_distinguishes_miss_from_cached_failure():
+    cache = RobotsCache()
+    missing = object()
+    cache.set("https://example.com", None)
+    assert cache.get("https://example.com", missing) is None
+    assert cache.get("https://other.com", missing) is missing
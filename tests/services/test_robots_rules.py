@@ -0,0 +1,64 @@
+import pytest
+
+from infracrawl.services.robots_rules import RobotsRules, product_token
+
+ROBOTS = """\
+# comment
+Sitemap: https://example.com/sitemap.xml
+
+User-agent: *
+Disallow: /private
+Allow: /private/public
+Disallow: /*.pdf$
+Disallow: /search?*q=
+Allow: /page
+Disallow: /*.php
+
+User-agent: InfraCrawl
+User-agent: OtherBot
+Disallow: /only-for-us
+"""
+
+
+def test_product_token():
+    assert product_token("InfraCrawl/0.1 (+https://example.com)") == "infracrawl"
+    assert product_token("") == "*"
+
+
+@pytest.mark.parametrize("url,allowed", [
+    ("https://example.com/", True),
+    ("https://example.com/private", False),
+    ("https://example.com/private/x", False),
+    ("https://example.com/private/public/x", True),  # longer Allow wins
+    ("https://example.com/doc.pdf", False),
+    ("https://example.com/doc.pdf?x=1", True),  # `$` anchors the end
+    ("https://example.com/search?lang=en&q=x", False),
+    ("https://example.com/search?lang=en", True),
+    ("https://example.com/page.php", False),  # Disallow /*.php is longer than Allow /page
+    ("https://example.com/page", True),
+    ("https://example.com/robots.txt", True),
+])
+def test_star_group_longest_match(url, allowed):
+    rules = RobotsRules.parse(ROBOTS, "SomeBot/1.0")
+    assert rules.allowed(url) is allowed
+
+
+def test_named_group_replaces_star_group():
+    rules = RobotsRules.parse(ROBOTS, "InfraCrawl/0.1")
+    assert not rules.allowed("https://example.com/only-for-us")
+    assert rules.allowed("https://example.com/private")
+    assert rules.site_maps() == ["https://example.com/sitemap.xml"]
+
+
+def test_allow_wins_ties_and_percent_encoding_is_normalized():
+    rules = RobotsRules.parse("User-agent: *\nDisallow: /a\nAllow: /a\nDisallow: /*.ph\nAllow: /x.p*\nDisallow: /%7Euser\n", "bot")
+    assert rules.allowed("https://example.com/a")
+    assert rules.allowed("https://example.com/x.php")
+    assert not rules.allowed("https://example.com/~user/x")
+
+
+def test_empty_or_missing_rules_allow_everything():
+    assert RobotsRules.parse("User-agent: *\nDisallow:\n", "bot").allowed("/anything")
+    assert RobotsRules.parse("", "bot").allowed("/anything")
+    # rules before any user-agent line belong to no group
+    assert RobotsRules.parse("Disallow: /\n", "bot").allowed("/anything")
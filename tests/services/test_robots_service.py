@@ -25,3 +25,93 @@ def test_allowed_by_robots_blocks_disallowed():
     assert not svc.allowed_by_robots('http://example.com/private', robots_enabled=True)
     # Should allow /public
     assert svc.allowed_by_robots('http://example.com/public', robots_enabled=True)
+
+
+class ConditionalHttp:
+    """robots.txt server that answers 304 to a matching If-None-Match."""
+    def __init__(self, text, etag='"v1"'):
+        self.text = text
+        self.etag = etag
+        self.calls = []
+    def fetch_robots(self, url, etag=None, last_modified=None):
+        self.calls.append(etag)
+        if etag is not None and etag == self.etag:
+            return HttpResponse(304, '', None, {})
+        return HttpResponse(200, self.text, 'text/plain', {'ETag': self.etag})
+
+
+def _store():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from infracrawl.db.models import Base
+    from infracrawl.repository.robots_txt import RobotsTxtRepository
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return RobotsTxtRepository(sessionmaker(bind=engine, future=True))
+
+
+def test_stored_robots_txt_is_shared_and_revalidated_when_expired():
+    from datetime import datetime, timedelta
+
+    store = _store()
+    http = ConditionalHttp('User-agent: *\nDisallow: /private')
+    first = RobotsService(http, user_agent='TestAgent', store=store)
+    assert not first.allowed_by_robots('http://example.com/private', robots_enabled=True)
+    assert http.calls == [None]
+    assert store.get('http://example.com')['etag'] == '"v1"'
+
+    # another process (fresh in-memory cache) reads the stored copy
+    second = RobotsService(http, user_agent='TestAgent', store=store)
+    assert not second.allowed_by_robots('http://example.com/private', robots_enabled=True)
+    assert http.calls == [None]
+
+    # expired: a conditional GET answered 304 keeps the copy
+    store.extend('http://example.com', datetime.utcnow(), datetime.utcnow() - timedelta(seconds=1))
+    third = RobotsService(http, user_agent='TestAgent', store=store)
+    assert not third.allowed_by_robots('http://example.com/private', robots_enabled=True)
+    assert http.calls == [None, '"v1"']
+    assert store.get('http://example.com')['expires_at'].replace(tzinfo=None) > datetime.utcnow()
+
+
+def test_stored_robots_txt_is_used_while_site_is_unreachable():
+    from datetime import datetime, timedelta
+
+    store = _store()
+    store.save('http://example.com', 200, 'User-agent: *\nDisallow: /', None, None,
+               datetime.utcnow() - timedelta(days=2), datetime.utcnow() - timedelta(days=1))
+    svc = RobotsService(DummyHttp(503, ''), user_agent='TestAgent', store=store)
+    assert not svc.allowed_by_robots('http://example.com/page', robots_enabled=True)
+
+
+def test_failed_fetch_is_cached_and_not_retried_per_url():
+    http = DummyHttp(404, '')
+    svc = RobotsService(http, user_agent='TestAgent')
+    assert svc.allowed_by_robots('http://example.com/a', robots_enabled=True)
+    assert svc.allowed_by_robots('http://example.com/b', robots_enabled=True)
+    assert http.called_urls == ['http://example.com/robots.txt']
+
+
+def test_prefetch_loads_each_host_once_in_background():
+    http = DummyHttp(200, 'User-agent: *\nDisallow: /private')
+    svc = RobotsService(http, user_agent='TestAgent')
+    svc.prefetch(['http://a.example.com/x', 'http://a.example.com/y', 'http://b.example.com/', 'not-a-url'])
+    svc.shutdown(wait=True)
+
+    assert sorted(http.called_urls) == ['http://a.example.com/robots.txt', 'http://b.example.com/robots.txt']
+    assert not svc.allowed_by_robots('http://b.example.com/private', robots_enabled=True)
+    assert len(http.called_urls) == 2
+
+
+def test_filter_allowed_checks_a_batch_per_host():
+    http = DummyHttp(200, 'User-agent: *\nDisallow: /private')
+    svc = RobotsService(http, user_agent='TestAgent')
+    urls = ['http://example.com/a', 'http://example.com/private/b', 'http://other.com/private']
+
+    # nothing cached yet: kept unchecked, no fetch
+    assert svc.filter_allowed(urls, True, cached_only=True) == urls
+    assert http.called_urls == []
+
+    assert svc.filter_allowed(urls, True) == ['http://example.com/a']
+    assert http.called_urls == ['http://example.com/robots.txt', 'http://other.com/robots.txt']
+    assert svc.filter_allowed(urls, False) == urls
@@ -32,9 +32,10 @@ class DummyConfigProvider:
 
 
 class DummyCrawlsRepo:
-    def __init__(self, counts_by_config_id, has_incomplete_map=None):
+    def __init__(self, counts_by_config_id, has_incomplete_map=None, stop_reasons=None):
         self.counts_by_config_id = counts_by_config_id
         self.has_incomplete_map = has_incomplete_map or {}  # config_id -> bool
+        self.stop_reasons = stop_reasons or {}  # config_id -> last run's stop_reason
         self.calls = []
 
     def mark_incomplete_runs(self, config_id: int, within_seconds=None, message=None) -> int:
@@ -44,6 +45,9 @@ class DummyCrawlsRepo:
     def has_incomplete_runs(self, config_id: int, within_seconds=None) -> bool:
         return self.has_incomplete_map.get(config_id, False)
 
+    def latest_stop_reason(self, config_id: int):
+        return self.stop_reasons.get(config_id)
+
 
 class DummyPagesRepo:
     def __init__(self, unvisited_map=None):
@@ -207,6 +211,27 @@ def test_recovery_off_mode_does_nothing():
     svc._recover_incomplete_runs_on_startup()
 
 
+def test_recovery_is_left_to_workers_in_worker_mode():
+    provider = DummyConfigProvider([DummyConfig(1, "a.yml")])
+    crawls_repo = DummyCrawlsRepo({1: 1})
+    pages_repo = DummyPagesRepo({1: True})
+
+    svc = SchedulerService(
+        provider,
+        None,  # session_factory
+        start_crawl_callback=lambda *a, **k: None,
+        crawls_repo=crawls_repo,
+        pages_repo=pages_repo,
+        crawl_execution="worker",
+    )
+    svc._sched = DummyScheduler()
+
+    svc._recover_incomplete_runs_on_startup()
+    # Runs live workers are executing are not closed, and nothing is resumed
+    assert crawls_repo.calls == []
+    assert pages_repo.calls == []
+
+
 def test_recovery_restart_skips_if_incomplete_runs_in_db():
     """When recovering and config already has incomplete runs, skip restart scheduling."""
     provider = DummyConfigProvider([
@@ -361,6 +386,36 @@ def test_recovery_resumes_when_unvisited_pages_exist_even_if_no_incomplete_runs(
     assert "unvisited pages exist for b.yml" in recovery_logs
     assert "dispatching resume for config b.yml" in recovery_logs
 
+
+def test_recovery_does_not_resume_budget_limited_crawls():
+    provider = DummyConfigProvider([
+        DummyConfig(1, "budget.yml"),
+        DummyConfig(2, "cancelled.yml"),
+    ])
+    # Both left pending pages; config 1's last run ended on its page budget
+    crawls_repo = DummyCrawlsRepo({1: 0, 2: 0}, stop_reasons={1: "max_pages", 2: "cancelled"})
+    pages_repo = DummyPagesRepo({1: True, 2: True})
+
+    svc = SchedulerService(
+        provider,
+        None,  # session_factory
+        start_crawl_callback=lambda *a, **k: None,
+        crawls_repo=crawls_repo,
+        pages_repo=pages_repo,
+    )
+    svc._sched = DummyScheduler()
+    calls = []
+
+    class ImmediateExecutor:
+        def submit(self, fn, *args, **kwargs):
+            return fn(*args, **kwargs)
+
+    svc._recovery._resume_callback = lambda cfg: calls.append(cfg.config_id)
+    svc._recovery._resume_executor = ImmediateExecutor()
+
+    svc._recover_incomplete_runs_on_startup()
+    assert calls == [2]
+
 def test_load_and_schedule_logs_loading_message(caplog):
     provider = DummyConfigProvider([
         DummyConfig(1, "a.yml"),
@@ -381,4 +436,29 @@ def test_load_and_schedule_logs_loading_message(caplog):
     svc.load_and_schedule_all()
 
     scheduler_logs = " ".join(r.message for r in caplog.records if r.name.endswith("scheduler_service"))
-    assert "Loading scheduled jobs from configs" in scheduler_logs
\ No newline at end of file
+    assert "Loading scheduled jobs from configs" in scheduler_logs
+
+def test_scheduled_and_resumed_crawls_go_through_job_queue():
+    class RecordingQueue:
+        def __init__(self):
+            self.submitted = []
+
+        def submit(self, key, fn, *args, kind="manual"):
+            self.submitted.append((key, kind))
+            return {"job_id": key}
+
+    cfg = DummyConfig(1, "a.yml")
+    queue = RecordingQueue()
+    svc = SchedulerService(
+        DummyConfigProvider([cfg]),
+        None,  # session_factory
+        start_crawl_callback=lambda *a, **k: None,
+        crawls_repo=DummyCrawlsRepo({}),
+        pages_repo=DummyPagesRepo(),
+        job_queue=queue,
+    )
+
+    svc._execute_scheduled_crawl("a.yml")
+    svc._recovery._resume_callback(cfg)
+
+    assert queue.submitted == [("a.yml", "scheduled"), ("a.yml", "recovery")]
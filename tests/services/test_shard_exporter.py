@@ -0,0 +1,91 @@
+import gzip
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from infracrawl.db.models import Base, Page as DBPage
+from infracrawl.repository.pages import PagesRepository
+from infracrawl.services.shard_exporter import ShardSpec, export_shard, export_sharded, plan_shards
+
+
+def _seed(url, n=10):
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    sf = sessionmaker(bind=engine, future=True)
+    with sf() as s:
+        s.add_all([DBPage(page_url=f"https://a/{i}", config_id=1, page_content=f"<p>{i}</p>", http_status=200) for i in range(n)])
+        s.add(DBPage(page_url="https://b/", config_id=2))
+        s.commit()
+    return PagesRepository(sf)
+
+
+def test_plan_shards_covers_range_without_gaps():
+    specs = plan_shards("cfg", 1, (10, 20), 4)
+    assert [(s.min_page_id, s.max_page_id) for s in specs] == [(10, 12), (13, 15), (16, 18), (19, 20)]
+    assert plan_shards("cfg", 1, (5, 6), 8)[-1].count == 2
+    assert plan_shards("cfg", 1, None, 4) == []
+
+
+def test_export_shard_resumes_from_checkpoint_after_partial_write(tmp_path):
+    repo = _seed("sqlite://")
+    spec = plan_shards("cfg", 1, repo.get_page_id_range(1), 1)[0]
+
+    first = export_shard(repo, spec, tmp_path, checkpoint_every=4, fields=["page_url"])
+    assert first["done"] and first["rows"] == 10
+    data_path = tmp_path / spec.filename("ndjson", True)
+    ckpt_path = tmp_path / (data_path.name + ".ckpt")
+    full = gzip.decompress(data_path.read_bytes())
+
+    # Rewind to a checkpoint after page_id 4 and leave a half-written segment behind it
+    seg_ckpt = {"params": first["params"], "last_page_id": 4, "bytes_written": 0, "rows": 4, "done": False}
+    export_shard(repo, ShardSpec("cfg", 1, 0, 1, 1, 4), tmp_path / "seg", fields=["page_url"])
+    seg_bytes = (tmp_path / "seg" / spec.filename("ndjson", True)).read_bytes()
+    data_path.write_bytes(seg_bytes + b"partial-garbage")
+    seg_ckpt["bytes_written"] = len(seg_bytes)
+    ckpt_path.write_text(json.dumps(seg_ckpt))
+
+    resumed = export_shard(repo, spec, tmp_path, checkpoint_every=4, fields=["page_url"])
+    assert resumed["done"] and resumed["rows"] == 10
+    assert gzip.decompress(data_path.read_bytes()) == full
+    lines = [json.loads(l) for l in full.splitlines()]
+    assert [l["page_url"] for l in lines] == [f"https://a/{i}" for i in range(10)]
+    assert set(lines[0]) == {"page_id", "page_url"}
+
+    # A finished shard is not rewritten
+    assert export_shard(repo, spec, tmp_path, fields=["page_url"]) == resumed
+
+
+def test_export_shard_restarts_when_checkpoint_is_for_another_shard_or_format(tmp_path):
+    repo = _seed("sqlite://")
+    spec = plan_shards("cfg", 1, repo.get_page_id_range(1), 1)[0]
+    export_shard(repo, spec, tmp_path, fields=["page_url"])
+    data_path = tmp_path / spec.filename("ndjson", True)
+
+    # Same file name, different fields: the finished checkpoint is not reused
+    redone = export_shard(repo, spec, tmp_path, fields=["page_url", "http_status"])
+    assert redone["done"] and redone["rows"] == 10
+    lines = [json.loads(l) for l in gzip.decompress(data_path.read_bytes()).splitlines()]
+    assert len(lines) == 10 and set(lines[0]) == {"page_id", "page_url", "http_status"}
+
+    # Same file name, narrower page_id range (e.g. re-planned after new pages)
+    narrower = ShardSpec("cfg", 1, 0, 1, spec.min_page_id, spec.min_page_id + 2)
+    assert export_shard(repo, narrower, tmp_path, fields=["page_url"])["rows"] == 3
+    assert len(gzip.decompress(data_path.read_bytes()).splitlines()) == 3
+
+
+def test_export_sharded_writes_shards_in_parallel_and_manifest(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'pages.db'}"
+    repo = _seed(db_url, n=25)
+    specs = plan_shards("cfg", 1, repo.get_page_id_range(1), 3)
+
+    manifest = export_sharded(db_url, specs, tmp_path / "out", workers=2, fmt="warc")
+
+    assert sum(s["rows"] for s in manifest["shards"]) == 25
+    total_responses = 0
+    for shard in manifest["shards"]:
+        data = gzip.decompress((tmp_path / "out" / shard["file"]).read_bytes())
+        assert data.startswith(b"WARC/1.1\r\nWARC-Type: warcinfo")
+        total_responses += data.count(b"WARC-Type: response")
+    assert total_responses == 25
+    assert json.loads((tmp_path / "out" / "manifest.json").read_text())["format"] == "warc"
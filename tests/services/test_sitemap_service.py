@@ -0,0 +1,92 @@
+import gzip
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from infracrawl.domain.config import CrawlerConfig
+from infracrawl.domain.http_response import HttpStream
+from infracrawl.services.sitemap_service import SitemapService, iter_sitemap, parse_lastmod
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://a.gov/one</loc><lastmod>2024-03-01</lastmod></url>
+  <url><loc> https://a.gov/two?utm_source=x </loc></url>
+  <url><loc>https://other.gov/off-site</loc></url>
+</urlset>"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://a.gov/pages.xml.gz</loc><lastmod>2024-03-02T10:00:00Z</lastmod></sitemap>
+  <sitemap><loc>https://a.gov/pages.xml.gz</loc></sitemap>
+</sitemapindex>"""
+
+
+def _chunks(data: bytes, size: int = 7):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_iter_sitemap_streams_plain_and_gzip_in_small_chunks():
+    for body in (URLSET, gzip.compress(URLSET)):
+        entries = list(iter_sitemap(_chunks(body)))
+        assert [e.loc for e in entries] == ["https://a.gov/one", "https://a.gov/two?utm_source=x", "https://other.gov/off-site"]
+        assert entries[0].kind == "url"
+        assert entries[0].lastmod == datetime(2024, 3, 1)
+        assert entries[1].lastmod is None
+
+
+def test_iter_sitemap_reads_index_entries_and_caps_size():
+    entries = list(iter_sitemap([INDEX]))
+    assert entries[0].kind == "sitemap"
+    assert entries[0].lastmod == datetime(2024, 3, 2, 10)
+    with pytest.raises(ValueError):
+        list(iter_sitemap(_chunks(gzip.compress(b"<urlset>" + b" " * 5000 + b"</urlset>")), max_bytes=1000))
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("2024", datetime(2024, 1, 1)),
+    ("2024-05", datetime(2024, 5, 1)),
+    ("2024-05-06T07:08:09.5+02:00", datetime(2024, 5, 6, 5, 8, 9, 500000)),
+    ("not a date", None),
+    (None, None),
+])
+def test_parse_lastmod(value, expected):
+    assert parse_lastmod(value) == expected
+
+
+def test_seed_follows_index_filters_hosts_and_returns_changed_pages():
+    bodies = {
+        "https://a.gov/sitemap_index.xml": INDEX,
+        "https://a.gov/pages.xml.gz": gzip.compress(URLSET),
+    }
+    fetched = []
+
+    @contextmanager
+    def stream(url):
+        fetched.append(url)
+        body = bodies.get(url)
+        yield HttpStream(200 if body else 404, iter(_chunks(body or b"")))
+
+    robots = Mock(sitemaps=Mock(return_value=["https://a.gov/sitemap_index.xml"]))
+    robots.filter_allowed.side_effect = lambda urls, enabled: [u for u in urls if u != "https://a.gov/two"]
+    pages_repo = Mock(add_sitemap_urls=Mock(return_value=["https://a.gov/one"]))
+    cfg = CrawlerConfig(1, "a.yml", root_urls=["https://a.gov/"], fetch_mode="http", sitemap_options={"max_urls": 10})
+    session = SimpleNamespace(config=cfg, is_stopped=lambda: False)
+
+    changed = SitemapService(SimpleNamespace(stream=stream), robots, pages_repo).seed(session)
+
+    assert changed == ["https://a.gov/one"]
+    assert fetched == ["https://a.gov/sitemap_index.xml", "https://a.gov/pages.xml.gz"]
+    entries, config_id, depth = pages_repo.add_sitemap_urls.call_args.args
+    # off-site and robots-disallowed URLs dropped, tracking parameter canonicalized away
+    assert entries == [("https://a.gov/one", datetime(2024, 3, 1))]
+    assert (config_id, depth) == (1, 1)
+
+
+def test_seed_is_off_without_sitemap_section():
+    cfg = CrawlerConfig(1, "a.yml", root_urls=["https://a.gov/"], fetch_mode="http")
+    http = Mock()
+    assert SitemapService(http, Mock(), Mock()).seed(SimpleNamespace(config=cfg, is_stopped=lambda: False)) == []
+    http.stream.assert_not_called()
@@ -0,0 +1,75 @@
+from infracrawl.services.url_canonicalizer import CanonicalizationRules, UrlCanonicalizer
+
+
+def test_drops_fragment():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("https://allevents.in/canton/stark%20county#") == "https://allevents.in/canton/stark%20county"
+    assert c.canonicalize("https://example.com/a#section") == "https://example.com/a"
+
+
+def test_lowercases_scheme_and_host_and_drops_default_port():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("HTTPS://Example.COM:443/Path") == "https://example.com/Path"
+    assert c.canonicalize("http://example.com:80/") == "http://example.com/"
+    assert c.canonicalize("http://example.com:8080/") == "http://example.com:8080/"
+
+
+def test_empty_path_becomes_slash():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("https://example.com") == "https://example.com/"
+
+
+def test_removes_tracking_and_session_params_and_sorts_query():
+    c = UrlCanonicalizer()
+    url = "https://example.com/events?utm_source=x&b=2&PHPSESSID=abc&a=1&fbclid=y"
+    assert c.canonicalize(url) == "https://example.com/events?a=1&b=2"
+
+
+def test_removes_jsessionid_path_parameter():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("https://example.com/page;jsessionid=ABC123?x=1") == "https://example.com/page?x=1"
+
+
+def test_normalizes_percent_escape_case():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("https://example.com/a%2fb") == "https://example.com/a%2Fb"
+
+
+def test_trailing_slash_is_kept_by_default_and_stripped_when_configured():
+    assert UrlCanonicalizer().canonicalize("https://example.com/events/") == "https://example.com/events/"
+    rules = CanonicalizationRules.from_options({"strip_trailing_slash": True})
+    c = UrlCanonicalizer(rules)
+    assert c.canonicalize("https://example.com/events/") == "https://example.com/events"
+    assert c.canonicalize("https://example.com/") == "https://example.com/"
+
+
+def test_sid_is_kept_by_default_and_dropped_when_configured():
+    url = "https://example.com/story?sid=42"
+    assert UrlCanonicalizer().canonicalize(url) == url
+    rules = CanonicalizationRules.from_options({"drop_query_params": ["sid"]})
+    assert UrlCanonicalizer(rules).canonicalize(url) == "https://example.com/story"
+
+
+def test_per_config_drop_query_params_extend_defaults():
+    rules = CanonicalizationRules.from_options({"drop_query_params": ["ref", "session_*"]})
+    c = UrlCanonicalizer(rules)
+    url = "https://example.com/?ref=home&session_id=1&utm_medium=x&page=2"
+    assert c.canonicalize(url) == "https://example.com/?page=2"
+
+
+def test_non_http_urls_are_unchanged():
+    c = UrlCanonicalizer()
+    assert c.canonicalize("mailto:someone@example.com") == "mailto:someone@example.com"
+    assert c.canonicalize("javascript:void(0)") == "javascript:void(0)"
+
+
+def test_for_config_reads_canonicalize_options():
+    from infracrawl.domain.config import CrawlerConfig
+
+    cfg = CrawlerConfig(
+        config_id=1,
+        config_path="x.yml",
+        fetch_mode="http",
+        canonicalize_options={"strip_trailing_slash": True},
+    )
+    assert UrlCanonicalizer.for_config(cfg).canonicalize("https://example.com/a/") == "https://example.com/a"
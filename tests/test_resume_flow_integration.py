@@ -86,8 +86,9 @@ def test_resume_flow_integration_discovers_unvisited_pages(mock_repos, test_conf
     
     unvisited_discovered_urls = ["http://example.com/child2"]  # discovered but no content
     
-    # Configure pages_repo mock to return pre-existing visited URLs
-    mock_repos['pages_repo'].get_visited_urls_by_config.return_value = visited_urls
+    # Configure pages_repo mock to answer visited lookups from pre-existing URLs
+    mock_repos['pages_repo'].is_url_fetched.side_effect = lambda config_id, url: url in visited_urls
+    mock_repos['pages_repo'].count_fetched_pages_by_config.return_value = len(visited_urls)
     
     # Configure pages_repo mock to return unvisited discovered pages
     mock_repos['pages_repo'].get_unvisited_urls_by_config.return_value = unvisited_discovered_urls
@@ -151,7 +152,7 @@ def test_resume_flow_integration_discovers_unvisited_pages(mock_repos, test_conf
     executor = CrawlExecutor(provider_factory=provider_factory)
     
     # ===== CREATE RESUME SESSION (simulating app restart) =====
-    # Simulate resume by pre-populating visited tracker (as resume factory would do)
+    # Simulate resume by rebuilding the session the way recovery does
     resume_factory = CrawlSessionResumeFactory(
         pages_repo=mock_repos['pages_repo'],
     )
@@ -162,8 +163,9 @@ def test_resume_flow_integration_discovers_unvisited_pages(mock_repos, test_conf
     
     # ===== VERIFY =====
     
-    # Verify that visited URLs were pre-loaded into session
-    assert mock_repos['pages_repo'].get_visited_urls_by_config.called, "Should have loaded visited URLs for resume"
+    # Verify that visited URLs were looked up in the database rather than preloaded
+    assert mock_repos['pages_repo'].is_url_fetched.called, "Should have consulted the DB for visited URLs"
+    assert not mock_repos['pages_repo'].get_visited_urls_by_config.called, "Should not preload visited URLs"
     
     # Verify that undiscovered pages by depth were queried (iterative depth-based crawling)
     assert mock_repos['pages_repo'].get_undiscovered_urls_by_depth.called, "Should have queried undiscovered pages by depth"
@@ -189,7 +191,8 @@ def test_resume_with_empty_unvisited_list(mock_repos, test_config):
     
     # Setup: All visited, no unvisited discovered pages
     visited_urls = ["http://example.com"]
-    mock_repos['pages_repo'].get_visited_urls_by_config.return_value = visited_urls
+    mock_repos['pages_repo'].is_url_fetched.side_effect = lambda config_id, url: url in visited_urls
+    mock_repos['pages_repo'].count_fetched_pages_by_config.return_value = len(visited_urls)
     mock_repos['pages_repo'].get_unvisited_urls_by_config.return_value = []  # Empty: no discovered pages
     mock_repos['pages_repo'].get_undiscovered_urls_by_depth.return_value = []  # Empty for all depths
     mock_repos['pages_repo'].ensure_page.return_value = 1
@@ -1,3 +1,5 @@
+import pytest
+
 from infracrawl.services.crawler_config_parser import CrawlerConfigParser
 
 
@@ -99,3 +101,42 @@ def test_parse_with_http_options():
     assert cfg.fetch_mode == "http"
     assert cfg.http_options == {"timeout_ms": 15000}
     assert cfg.headless_options is None
+
+
+def test_parse_canonicalize_section():
+    parser = CrawlerConfigParser()
+    cfg = parser.parse(
+        config_path="a.yml",
+        data={"fetch": {"mode": "http"}, "canonicalize": {"drop_query_params": ["ref"], "strip_trailing_slash": True}},
+    )
+    assert cfg is not None
+    assert cfg.canonicalize_options == {"drop_query_params": ["ref"], "strip_trailing_slash": True}
+
+
+def test_parse_near_duplicate_section():
+    parser = CrawlerConfigParser()
+    cfg = parser.parse(
+        config_path="a.yml",
+        data={"fetch": {"mode": "http"}, "near_duplicate": {"max_distance": 2, "skip": True}},
+    )
+    assert cfg is not None
+    assert cfg.near_duplicate_options == {"max_distance": 2, "skip": True}
+
+
+def test_parse_crawl_budgets():
+    parser = CrawlerConfigParser()
+    cfg = parser.parse(
+        config_path="a.yml",
+        data={"fetch": {"mode": "http"}, "max_pages": 500, "max_duration": "45m", "max_bytes": "200MB"},
+    )
+    assert (cfg.max_pages, cfg.max_duration_seconds, cfg.max_bytes) == (500, 2700, 200 * 1024 ** 2)
+
+    with pytest.raises(ValueError):
+        parser.parse(config_path="a.yml", data={"fetch": {"mode": "http"}, "max_pages": 0})
+
+
+def test_parse_rejects_invalid_max_body_bytes():
+    parser = CrawlerConfigParser()
+    data = {"fetch": {"mode": "http", "http": {"max_body_bytes": "lots"}}}
+    with pytest.raises(ValueError, match="invalid size"):
+        parser.parse(config_path="test.yml", data=data)
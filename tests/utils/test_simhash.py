@@ -0,0 +1,51 @@
+import random
+
+from infracrawl.utils.simhash import (
+    SIMHASH_BANDS,
+    from_signed64,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+    to_signed64,
+)
+
+
+def _article(seed: int, words: int = 2000) -> str:
+    rng = random.Random(seed)
+    return " ".join(f"w{rng.randint(0, 5000)}" for _ in range(words))
+
+
+def test_simhash_is_deterministic_and_case_insensitive():
+    text = _article(1)
+    assert simhash(text) == simhash(text.upper())
+    assert 0 <= simhash(text) < 1 << 64
+
+
+def test_simhash_of_empty_text_is_none():
+    assert simhash(None) is None
+    assert simhash("") is None
+    assert simhash("  ... ") is None
+
+
+def test_small_edit_stays_close_and_unrelated_text_is_far():
+    body = _article(1)
+    a = simhash("Updated 2026-01-01. " + body)
+    b = simhash("Updated 2026-02-14. " + body)
+    c = simhash(_article(2))
+    assert hamming_distance(a, b) < SIMHASH_BANDS
+    assert hamming_distance(a, c) > 16
+
+
+def test_bands_share_one_band_within_distance():
+    fp = simhash(_article(3))
+    near = fp ^ (1 << 0) ^ (1 << 17) ^ (1 << 40)  # one flipped bit in three bands
+    shared = [x == y for x, y in zip(simhash_bands(fp), simhash_bands(near))]
+    assert shared.count(True) == 1
+    assert all(0 <= band < 1 << 16 for band in simhash_bands(fp))
+
+
+def test_signed64_round_trip():
+    for value in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+        signed = to_signed64(value)
+        assert -(1 << 63) <= signed < 1 << 63
+        assert from_signed64(signed) == value
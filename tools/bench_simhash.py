@@ -0,0 +1,48 @@
+"""Benchmark SimHash fingerprinting throughput.
+
+Usage:
+    python tools/bench_simhash.py [--docs 2000] [--words 1500]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Ensure repo root is on sys.path when running the script directly.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infracrawl.utils.simhash import hamming_distance, simhash
+
+
+def make_docs(count: int, words: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(5000)]
+    return [" ".join(rng.choice(vocab) for _ in range(words)) for _ in range(count)]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=1500)
+    args = parser.parse_args(argv)
+
+    docs = make_docs(args.docs, args.words)
+    total_bytes = sum(len(d) for d in docs)
+
+    start = time.perf_counter()
+    fingerprints = [simhash(d) for d in docs]
+    elapsed = time.perf_counter() - start
+    print(
+        f"simhash: {args.docs} docs, {total_bytes / 1e6:.1f} MB in {elapsed:.2f}s "
+        f"-> {args.docs / elapsed:.0f} docs/s, {total_bytes / 1e6 / elapsed:.1f} MB/s"
+    )
+
+    # A near-duplicate (one changed word) should stay within a few bits
+    edited = docs[0].split()
+    edited[len(edited) // 2] = "changed"
+    print(f"distance after one-word edit: {hamming_distance(fingerprints[0], simhash(' '.join(edited)))} bits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Crawl worker: runs crawl jobs from the `crawl_jobs` table, without the API.
+
+Examples:
+    python worker.py                      # INFRACRAWL_MAX_CONCURRENT_CRAWLS slots
+    python worker.py --concurrency 4 --processes 2
+
+Start the API with `INFRACRAWL_CRAWL_EXECUTION=worker` so manual, scheduled and
+recovery crawls are queued in the database instead of run in the API process.
+Crawls run here are not visible to the API's active-crawl and cancel endpoints,
+which only know crawls of their own process.
+Run as many workers (processes or containers) as needed; they share the queue.
+On SIGTERM/SIGINT a worker stops claiming jobs and cancels its running crawls,
+which are requeued and resumed by the next worker.
+"""
+import argparse
+import logging
+import multiprocessing
+import signal
+import sys
+from typing import Optional
+
+from infracrawl.container import Container
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run crawl jobs queued in the database.")
+    parser.add_argument("--concurrency", type=int, default=None, help="Crawls per process (default: INFRACRAWL_MAX_CONCURRENT_CRAWLS)")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes to start")
+    parser.add_argument("--worker-id", help="Name recorded on claimed jobs (default: host:pid)")
+    return parser.parse_args(argv)
+
+
+def run_worker(args, container: Optional[Container] = None) -> int:
+    if container is None:
+        container = Container()
+    if not container.config.DATABASE_URL():
+        print("DATABASE_URL is not set", file=sys.stderr)
+        return 2
+
+    overrides = {}
+    if args.concurrency is not None:
+        overrides["concurrency"] = args.concurrency
+    if args.worker_id:
+        overrides["worker_id"] = args.worker_id
+    worker = container.crawl_worker(**overrides)
+
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+    worker.run_forever()
+    return 0
+
+
+def _child(args) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(processName)s %(name)s: %(message)s")
+    if args.worker_id:
+        args.worker_id = f"{args.worker_id}:{multiprocessing.current_process().name}"
+    sys.exit(run_worker(args))
+
+
+def main(argv=None, container: Optional[Container] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    args = parse_args(argv)
+    if args.processes <= 1:
+        return run_worker(args, container)
+
+    # spawn: each process builds its own container and DB connection pool
+    ctx = multiprocessing.get_context("spawn")
+    children = [ctx.Process(target=_child, args=(args,), name=f"worker-{i + 1}") for i in range(args.processes)]
+    for child in children:
+        child.start()
+
+    def _forward(signum, _frame):
+        for child in children:
+            if child.is_alive():
+                child.terminate()  # SIGTERM: graceful stop in the child
+
+    signal.signal(signal.SIGTERM, _forward)
+    signal.signal(signal.SIGINT, _forward)
+    for child in children:
+        child.join()
+    return max((child.exitcode or 0) for child in children)
+
+
+if __name__ == "__main__":
+    sys.exit(main())